@@ -48,21 +48,39 @@ def create_test_audio_pcm(
     # Generate a simple sine wave pattern as placeholder
     # In a real scenario, you'd use the TTS service or record actual audio
     duration = len(text) * 0.1  # Rough estimation: 0.1 seconds per character
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    t = np.linspace(
+        0, duration, int(sample_rate * duration), endpoint=False, dtype=np.float32
+    )
 
     # Create a more speech-like pattern with multiple frequencies
-    frequencies = [200, 400, 600, 800]  # Simulate speech formants
-    wave_data = np.zeros_like(t)
+    # (float32 throughout: int16 output doesn't need float64 precision)
+    frequencies = np.array([200, 400, 600, 800], dtype=np.float32)  # Formants
+    amplitudes = (0.1 / np.arange(1, len(frequencies) + 1)).astype(np.float32)
 
-    for i, freq in enumerate(frequencies):
-        amplitude = 0.1 / (i + 1)  # Decreasing amplitude for higher frequencies
-        wave_data += amplitude * np.sin(2 * np.pi * freq * t)
+    # Sum all formants in one broadcast pass instead of one pass per formant
+    omegas = (2 * np.pi * frequencies[:, None]).astype(np.float32)
+    try:
+        import numexpr as ne
 
-    # Add some variation to make it more speech-like
-    wave_data *= 1 + 0.3 * np.sin(2 * np.pi * 3 * t)  # Amplitude modulation
+        # numexpr fuses sin, scaling and the sum into one SIMD pass over t
+        wave_data = ne.evaluate(
+            "sum(amps * sin(omegas * t), axis=0)",
+            local_dict={"amps": amplitudes[:, None], "omegas": omegas, "t": t[None, :]},
+        )
+    except ImportError:
+        # Plain numpy fallback when numexpr isn't installed
+        phase = omegas * t[None, :]
+        wave_data = amplitudes @ np.sin(phase, out=phase)
+
+    # Add some variation to make it more speech-like (amplitude modulation)
+    modulation = np.sin(np.float32(2 * np.pi * 3) * t)
+    modulation *= 0.3
+    modulation += 1
+    wave_data *= modulation
 
     # Convert to 16-bit PCM
-    audio_data = (wave_data * 16383).astype(np.int16).tobytes()
+    wave_data *= 16383
+    audio_data = np.clip(wave_data, -32768, 32767).astype(np.int16).tobytes()
     return audio_data
 
 
@@ -86,6 +104,7 @@ async def demo_text_to_audio_generation():
     ]
 
     generated_files = []
+    audio_dir = Path(service.audio_output_dir)
 
     for i, prompt in enumerate(prompts):
         print(f"\n🗣️  Generating audio for: '{prompt}'")
@@ -100,7 +119,7 @@ async def demo_text_to_audio_generation():
                     print(f"✅ Audio saved: {audio_file}")
 
                     # Show file size
-                    audio_path = Path(service.audio_output_dir) / audio_file
+                    audio_path = audio_dir / audio_file
                     if audio_path.exists():
                         size_kb = audio_path.stat().st_size / 1024
                         print(f"📊 File size: {size_kb:.1f} KB")
@@ -250,6 +269,20 @@ async def demo_microphone_input():
         # Initialize PyAudio
         audio = pyaudio.PyAudio()
 
+        # Preallocate the whole recording; PortAudio's callback fills it in place
+        bytes_per_second = RATE * CHANNELS * audio.get_sample_size(FORMAT)
+        buffer = bytearray(bytes_per_second * RECORD_SECONDS)
+        view = memoryview(buffer)
+        written = 0
+
+        def on_audio(in_data, frame_count, time_info, status):
+            nonlocal written
+            n = min(len(in_data), len(buffer) - written)
+            view[written : written + n] = in_data[:n]
+            written += n
+            done = written >= len(buffer)
+            return (None, pyaudio.paComplete if done else pyaudio.paContinue)
+
         # Start recording
         stream = audio.open(
             format=FORMAT,
@@ -257,21 +290,18 @@ async def demo_microphone_input():
             rate=RATE,
             input=True,
             frames_per_buffer=CHUNK,
+            stream_callback=on_audio,
         )
 
-        frames = []
-        for i in range(0, int(RATE / CHUNK * RECORD_SECONDS)):
-            data = stream.read(CHUNK)
-            frames.append(data)
-            if i % 5 == 0:  # Progress indicator
-                print(f"Recording... {i * CHUNK / RATE:.1f}s")
+        while stream.is_active():  # Progress indicator
+            print(f"Recording... {written / bytes_per_second:.1f}s")
+            await asyncio.sleep(0.3)
 
         stream.stop_stream()
         stream.close()
         audio.terminate()
 
-        # Combine audio data
-        audio_data = b"".join(frames)
+        audio_data = bytes(view[:written])
         print(f"✅ Recorded {len(audio_data)} bytes of audio")
 
         # Configure for conversation
@@ -12,7 +12,10 @@ Usage: python full_audio_demo.py
 """
 
 import asyncio
+import os
 import sys
+import uuid
+import wave
 from pathlib import Path
 
 # Add project root to path
@@ -37,7 +40,15 @@ async def run_audio_to_audio_demo():
     from src.app.core.config import settings
 
     audio_dir = Path(settings.AUDIO_OUTPUT_DIR)
-    audio_files = list(audio_dir.glob("*.wav"))
+    with os.scandir(audio_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith(".wav")]
+    # Keep only the newest; DirEntry caches its stat, so each file is stat'ed once
+    audio_files = (
+        [Path(max(entries, key=lambda entry: entry.stat().st_mtime).path)]
+        if entries
+        else []
+    )
+    generated_input = False
 
     if not audio_files:
         print("❌ No audio files found!")
@@ -58,18 +69,28 @@ async def run_audio_to_audio_demo():
             if chunk["type"] == "final":
                 print(f"✅ Created audio file: {chunk['content']['audio_filename']}")
                 audio_files = [audio_dir / chunk["content"]["audio_filename"]]
+                generated_input = True
                 break
 
-    # Use the first/newest audio file
+    # Use the newest audio file
     input_audio_file = audio_files[0]
     print(f"\n🎧 Using audio input: {input_audio_file.name}")
     print(f"📊 File size: {input_audio_file.stat().st_size / 1024:.1f} KB")
 
     try:
-        # Convert to PCM format
-        print("\n🔄 Converting audio to PCM format...")
-        pcm_data = await service.convert_wav_to_pcm(str(input_audio_file))
-        print(f"✅ Converted {len(pcm_data):,} bytes of PCM audio data")
+        if generated_input:
+            # Live API output is already 16-bit mono PCM, so read the frames
+            # straight back instead of decoding and resampling with librosa
+            with wave.open(str(input_audio_file), "rb") as wf:
+                sample_rate = wf.getframerate()
+                pcm_data = wf.readframes(wf.getnframes())
+            print(f"✅ Loaded {len(pcm_data):,} bytes of PCM audio data")
+        else:
+            # Convert to PCM format
+            print("\n🔄 Converting audio to PCM format...")
+            sample_rate = 16000
+            pcm_data = await service.convert_wav_to_pcm(str(input_audio_file))
+            print(f"✅ Converted {len(pcm_data):,} bytes of PCM audio data")
 
         # Configure for audio-to-audio
         config = LiveSessionConfig(
@@ -86,17 +107,19 @@ async def run_audio_to_audio_demo():
         print("🎧 Sending audio to Gemini...")
 
         # Track the conversation
-        input_transcript = ""
-        output_transcript = ""
+        input_parts = []
+        output_parts = []
         response_audio_file = None
 
-        async for chunk in service.send_audio_message(pcm_data, session_config=config):
+        async for chunk in service.send_audio_message(
+            pcm_data, sample_rate=sample_rate, session_config=config
+        ):
             if chunk["type"] == "input_transcript":
-                input_transcript += chunk["content"]
+                input_parts.append(chunk["content"])
                 print(f"\n📝 INPUT TRANSCRIPT: {chunk['content']}")
 
             elif chunk["type"] == "output_transcript":
-                output_transcript += chunk["content"]
+                output_parts.append(chunk["content"])
                 print(f"🗣️  AI RESPONSE: {chunk['content']}", end="", flush=True)
 
             elif chunk["type"] == "text":
@@ -114,23 +137,26 @@ async def run_audio_to_audio_demo():
         print("\n" + "=" * 60)
         print("📋 CONVERSATION SUMMARY:")
         print("=" * 60)
-        print(f"🎤 HUMAN (from audio): {input_transcript}")
-        print(f"🤖 AI RESPONSE: {output_transcript}")
+        print(f"🎤 HUMAN (from audio): {''.join(input_parts)}")
+        print(f"🤖 AI RESPONSE: {''.join(output_parts)}")
         print(f"🎵 Response audio saved: {response_audio_file}")
 
         # Show all audio files
-        updated_files = sorted(audio_dir.glob("*.wav"), key=lambda x: x.stat().st_mtime)
+        # DirEntry caches its stat result, so each file costs a single stat call
+        with os.scandir(audio_dir) as it:
+            updated_files = sorted(
+                (entry for entry in it if entry.name.endswith(".wav")),
+                key=lambda entry: entry.stat().st_mtime,
+            )
         print(f"\n📁 ALL AUDIO FILES ({len(updated_files)} total):")
-        for i, f in enumerate(updated_files, 1):
-            size_kb = f.stat().st_size / 1024
+        for i, entry in enumerate(updated_files, 1):
+            size_kb = entry.stat().st_size / 1024
             age = (
                 "📄 Input"
-                if f == input_audio_file
-                else "🆕 Output"
-                if f.name == response_audio_file
-                else "📜 Other"
+                if entry.name == input_audio_file.name
+                else "🆕 Output" if entry.name == response_audio_file else "📜 Other"
             )
-            print(f"   {i}. {f.name} ({size_kb:.1f} KB) {age}")
+            print(f"   {i}. {entry.name} ({size_kb:.1f} KB) {age}")
 
         print("\n🎧 You can play these audio files to hear the conversation!")
         print(f"   Input:  {input_audio_file}")
@@ -164,26 +190,45 @@ async def demo_audio_conversation_chain():
         enable_output_audio_transcription=True,
     )
 
-    for i, question in enumerate(questions, 1):
-        print(f"\n🔄 TURN {i}/3:")
-        print(f"🧑 HUMAN: {question}")
-        print("🤖 AI: ", end="", flush=True)
-
-        response_transcript = ""
-
-        async for chunk in service.send_text_message(question, session_config=config):
-            if chunk["type"] == "transcript":
-                print(chunk["content"], end="", flush=True)
-                response_transcript += chunk["content"]
-
-            elif chunk["type"] == "final":
-                audio_file = chunk["content"]["audio_filename"]
-                print(f"\n   🎵 Audio: {audio_file}")
-                break
+    # One Live session for the whole chain instead of a new connection per turn
+    audio_dir = Path(service.audio_output_dir)
+    async with service.client.aio.live.connect(
+        model=service._choose_model(config),
+        config=service._create_session_config(config),
+    ) as session:
+        for i, question in enumerate(questions, 1):
+            print(f"\n🔄 TURN {i}/3:")
+            print(f"🧑 HUMAN: {question}")
+            print("🤖 AI: ", end="", flush=True)
+
+            await session.send_client_content(
+                turns={"role": "user", "parts": [{"text": question}]},
+                turn_complete=True,
+            )
 
-        # Brief pause between questions
-        if i < len(questions):
-            await asyncio.sleep(0.5)
+            # receive() yields this turn's messages and stops at turn completion
+            audio_file = f"live_audio_{uuid.uuid4()}.wav"
+            with wave.open(str(audio_dir / audio_file), "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(24000)
+
+                async for response in session.receive():
+                    if response.data:
+                        wf.writeframes(response.data)
+
+                    server_content = response.server_content
+                    transcription = (
+                        server_content.output_transcription if server_content else None
+                    )
+                    if transcription and transcription.text:
+                        print(transcription.text, end="", flush=True)
+
+            print(f"\n   🎵 Audio: {audio_file}")
+
+            # Brief pause between questions
+            if i < len(questions):
+                await asyncio.sleep(0.5)
 
     print("\n✅ Conversation chain complete!")
 
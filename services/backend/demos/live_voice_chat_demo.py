@@ -7,7 +7,7 @@ This script enables live voice conversations with Gemini AI:
 - Plays AI responses through speakers
 - Supports text input as well
 
-Usage: python live_voice_chat.py
+Usage: python live_voice_chat.py [--yes]
 
 Requirements:
 - pip install pyaudio
@@ -20,11 +20,16 @@ Controls:
 - Press Ctrl+C to exit
 """
 
+import argparse
 import asyncio
+import collections
+import concurrent.futures
 import os
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -36,6 +41,12 @@ except ImportError:
     print("On macOS: brew install portaudio && pip install pyaudio")
     sys.exit(1)
 
+# Prefer uvloop's faster event loop where it is installed (not on Windows)
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 from src.app.schemas.gemini_live import (  # noqa: E402
     LiveSessionConfig,
     ResponseModality,
@@ -49,29 +60,96 @@ CHANNELS = 1
 SEND_SAMPLE_RATE = 16000
 RECEIVE_SAMPLE_RATE = 24000
 CHUNK_SIZE = 1024
+SEND_BPS = SEND_SAMPLE_RATE * 2  # Bytes per second of 16-bit mono mic audio
+RECV_BPS = RECEIVE_SAMPLE_RATE * 2  # Bytes per second of 16-bit mono playback
+MIC_RING_BUFFER_BYTES = SEND_BPS  # 1 s of audio
+SEND_BATCH_MS = 200  # Audio per Live API message
+SEND_BATCH_BYTES = SEND_BPS * SEND_BATCH_MS // 1000
+MAX_BUFFERED_BYTES = RECV_BPS * 2  # 2 s of audio
+
+# Voice menu entries, built once
+VOICES = tuple(VoiceName)
+
+# Set GENASSIST_DEBUG_AUDIO=1 to log and dump playback chunks
+DEBUG_AUDIO = os.getenv("GENASSIST_DEBUG_AUDIO") == "1"
 
 pya = pyaudio.PyAudio()
 
 
+class PcmRingBuffer:
+    """
+    Fixed-size single-producer/single-consumer byte ring.
+
+    The PortAudio callback thread is the only writer of the head index and the
+    asyncio consumer the only writer of the tail index, so no lock is needed.
+    If the consumer falls a full buffer behind, new audio is dropped.
+    """
+
+    def __init__(self, capacity):
+        """Allocate the ring once up front."""
+        self._buffer = bytearray(capacity)
+        self._capacity = capacity
+        self._head = 0  # Total bytes written
+        self._tail = 0  # Total bytes read
+
+    def write(self, data):
+        """Append data, dropping it if the ring is full."""
+        size = len(data)
+        if size > self._capacity - (self._head - self._tail):
+            return
+        start = self._head % self._capacity
+        first = min(size, self._capacity - start)
+        self._buffer[start : start + first] = data[:first]
+        self._buffer[: size - first] = data[first:]
+        self._head += size
+
+    def read_all(self):
+        """Return and consume everything written since the last read."""
+        head = self._head
+        size = head - self._tail
+        start = self._tail % self._capacity
+        first = min(size, self._capacity - start)
+        data = bytes(self._buffer[start : start + first]) + bytes(
+            self._buffer[: size - first]
+        )
+        self._tail = head
+        return data
+
+
 class LiveVoiceChat:
     """Real-time voice chat with Gemini Live API."""
 
-    def __init__(self, voice_name=VoiceName.KORE):
+    def __init__(self, voice_name=VoiceName.KORE, service=None):
         """Initialize the voice chat system."""
-        self.service = GeminiLiveService()
+        self.service = service or GeminiLiveService()
         self.voice_name = voice_name
 
-        # Audio queues
-        self.audio_in_queue = None
-        self.audio_out_queue = None
+        # Audio playback buffer: a deque plus an event is enough for the single
+        # producer (handle_live_responses) and single consumer (playback)
+        self.audio_out = collections.deque()
+        self.audio_out_ready = None
+        self._buffered_bytes = 0  # Running size of audio_out, avoids rescans
 
         # Audio streams
         self.input_stream = None
         self.output_stream = None
 
+        # Speaker writes get their own thread so they never queue behind the
+        # blocking input() call or other work on the default executor
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="audio-io"
+        )
+
+        # Microphone audio handed from the PortAudio callback to asyncio
+        self.mic_buffer = PcmRingBuffer(MIC_RING_BUFFER_BYTES)
+        self.mic_ready = None
+
         # Live API session
         self.session = None
 
+        # Set when the user quits so the audio tasks wind down on their own
+        self._stop = None
+
         # Session configuration
         self.config = LiveSessionConfig(
             response_modality=ResponseModality.AUDIO,
@@ -99,7 +177,16 @@ class LiveVoiceChat:
             print(f"❌ Audio device error: {e}")
             return False
 
-        # Create audio input stream (microphone)
+        # Create audio input stream (microphone) in callback mode: PortAudio's
+        # thread fills the ring buffer and wakes the asyncio consumer
+        loop = asyncio.get_running_loop()
+        self.mic_ready = asyncio.Event()
+
+        def on_mic_audio(in_data, frame_count, time_info, status):
+            self.mic_buffer.write(in_data)
+            loop.call_soon_threadsafe(self.mic_ready.set)
+            return (None, pyaudio.paContinue)
+
         try:
             self.input_stream = await asyncio.to_thread(
                 pya.open,
@@ -109,6 +196,7 @@ class LiveVoiceChat:
                 input=True,
                 input_device_index=mic_info["index"],
                 frames_per_buffer=CHUNK_SIZE,
+                stream_callback=on_mic_audio,
             )
             print("✅ Microphone ready")
         except Exception as e:
@@ -135,51 +223,114 @@ class LiveVoiceChat:
         """Continuously listen to microphone and send to Live API."""
         print("🎧 Listening to microphone...")
 
-        kwargs = {"exception_on_overflow": False} if __debug__ else {}
+        # Coalesce ~64 ms callback chunks into SEND_BATCH_MS messages so each
+        # WebSocket frame carries several chunks
+        pending = bytearray()
 
-        while True:
+        # The session and buffers are fixed for the conversation, so bind the
+        # per-iteration lookups once
+        stop = self._stop
+        mic_ready = self.mic_ready
+        read_all = self.mic_buffer.read_all
+        send = self.session.send_realtime_input
+        wait_or_stop = self._wait_or_stop
+
+        # send_realtime_input validates the payload into its own model before
+        # awaiting, so one dict can be reused for every message
+        audio_payload = {"data": b"", "mime_type": "audio/pcm"}
+
+        while not stop.is_set():
             try:
-                # Read audio data from microphone
-                data = await asyncio.to_thread(
-                    self.input_stream.read, CHUNK_SIZE, **kwargs
-                )
+                # Wait for the callback, then take everything captured so far
+                if not await wait_or_stop(mic_ready):
+                    break
+                mic_ready.clear()
+                pending += read_all()
 
                 # Send to Live API session
-                if self.session:
-                    await self.session.send_realtime_input(
-                        audio={"data": data, "mime_type": "audio/pcm"}
-                    )
+                if len(pending) >= SEND_BATCH_BYTES:
+                    audio_payload["data"] = bytes(pending)
+                    await send(audio=audio_payload)
+                    pending.clear()
 
             except Exception as e:
                 print(f"❌ Microphone error: {e}")
                 break
 
+    async def _wait_or_stop(self, event):
+        """
+        Wait until event is set or the conversation is stopping.
+
+        Args:
+            event: The asyncio.Event signalling that work is available
+
+        Returns:
+            False once the stop event is set, True otherwise
+        """
+        if not event.is_set() and not self._stop.is_set():
+            waiters = {
+                asyncio.create_task(event.wait()),
+                asyncio.create_task(self._stop.wait()),
+            }
+            _, pending = await asyncio.wait(
+                waiters, return_when=asyncio.FIRST_COMPLETED
+            )
+            for waiter in pending:
+                waiter.cancel()
+        return not self._stop.is_set()
+
+    def queue_audio(self, audio_data):
+        """
+        Queue audio for playback and wake the playback task.
+
+        At most MAX_BUFFERED_BYTES are kept; if playback falls behind, the
+        oldest chunks are dropped so memory stays bounded in long sessions.
+        """
+        self.audio_out.append(audio_data)
+        self._buffered_bytes += len(audio_data)
+        while self._buffered_bytes > MAX_BUFFERED_BYTES and len(self.audio_out) > 1:
+            self._buffered_bytes -= len(self.audio_out.popleft())
+        self.audio_out_ready.set()
+
     async def play_audio_responses(self):
         """Play audio responses from the AI through speakers."""
         audio_chunk_count = 0
-        while True:
+        while not self._stop.is_set():
             try:
                 # Get audio data from queue
-                audio_data = await self.audio_out_queue.get()
+                while not self.audio_out:
+                    if not await self._wait_or_stop(self.audio_out_ready):
+                        return
+                    self.audio_out_ready.clear()
+
+                # Drain everything that has arrived so a burst of chunks costs a
+                # single thread hop and write instead of one per chunk
+                chunks = [self.audio_out.popleft() for _ in range(len(self.audio_out))]
+                self._buffered_bytes = 0
+                audio_data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
                 audio_chunk_count += 1
 
-                print(
-                    f"🔊 Playing audio chunk {audio_chunk_count}: {len(audio_data)} bytes"
-                )
+                # Debug output stays off the playback path unless requested
+                if DEBUG_AUDIO:
+                    print(
+                        f"🔊 Playing audio chunk {audio_chunk_count}: {len(audio_data)} bytes"
+                    )
 
-                # Debug: Save first few chunks to files for analysis
-                if audio_chunk_count <= 3:
-                    filename = f"debug_audio_chunk_{audio_chunk_count}.raw"
-                    with open(filename, "wb") as f:
-                        f.write(audio_data)
-                    print(f"💾 Saved audio chunk to {filename}")
+                    # Save first few chunks to files for analysis
+                    if audio_chunk_count <= 3:
+                        filename = f"debug_audio_chunk_{audio_chunk_count}.raw"
+                        with open(filename, "wb") as f:
+                            f.write(audio_data)
+                        print(f"💾 Saved audio chunk to {filename}")
 
-                    # Show first few bytes in hex
-                    hex_bytes = " ".join([f"{b:02x}" for b in audio_data[:16]])
-                    print(f"🔍 First 16 bytes: {hex_bytes}")
+                        # Show the first few 16-bit samples
+                        samples = np.frombuffer(audio_data[:32], dtype=np.int16)
+                        print(f"🔍 First {samples.size} samples: {samples}")
 
                 # Play through speakers
-                await asyncio.to_thread(self.output_stream.write, audio_data)
+                await asyncio.get_running_loop().run_in_executor(
+                    self._audio_executor, self.output_stream.write, audio_data
+                )
 
             except Exception as e:
                 print(f"❌ Audio playback error: {e}")
@@ -190,83 +341,100 @@ class LiveVoiceChat:
         print("🤖 Ready to receive AI responses...")
         response_count = 0
 
-        while True:
+        while not self._stop.is_set():
             try:
                 turn = self.session.receive()
                 async for response in turn:
                     response_count += 1
 
                     # Handle audio data
-                    if hasattr(response, "data") and response.data:
+                    data = getattr(response, "data", None)
+                    if data:
                         print(
-                            f"📥 Response {response_count}: Received audio data ({len(response.data)} bytes)"
+                            f"📥 Response {response_count}: Received audio data ({len(data)} bytes)"
                         )
-                        await self.audio_out_queue.put(response.data)
+                        self.queue_audio(data)
 
                     # Handle text responses (for debugging)
-                    if hasattr(response, "text") and response.text:
-                        print(f"🤖 AI: {response.text}")
+                    text = getattr(response, "text", None)
+                    if text:
+                        print(f"🤖 AI: {text}")
 
                     # Handle server content parts
-                    if hasattr(response, "server_content") and response.server_content:
-                        if (
-                            response.server_content.model_turn
-                            and response.server_content.model_turn.parts
-                        ):
-                            for i, part in enumerate(
-                                response.server_content.model_turn.parts
-                            ):
-                                if (
-                                    hasattr(part, "inline_data")
-                                    and part.inline_data
-                                    and part.inline_data.data
-                                ):
-                                    print(
-                                        f"📥 Response {response_count}: Model part {i} audio data ({len(part.inline_data.data)} bytes)"
-                                    )
-                                    await self.audio_out_queue.put(
-                                        part.inline_data.data
-                                    )
-                                if hasattr(part, "text") and part.text:
-                                    print(f"🤖 AI text part {i}: {part.text}")
+                    server_content = getattr(response, "server_content", None)
+                    if server_content:
+                        model_turn = server_content.model_turn
+                        parts = model_turn.parts if model_turn else None
+                        for i, part in enumerate(parts or ()):
+                            inline_data = part.inline_data
+                            part_data = inline_data.data if inline_data else None
+                            if part_data:
+                                print(
+                                    f"📥 Response {response_count}: Model part {i} audio data ({len(part_data)} bytes)"
+                                )
+                                self.queue_audio(part_data)
+                            if part.text:
+                                print(f"🤖 AI text part {i}: {part.text}")
 
                         # Handle transcriptions
-                        if (
-                            response.server_content.input_transcription
-                            and response.server_content.input_transcription.text
-                        ):
-                            transcript = (
-                                response.server_content.input_transcription.text
-                            )
-                            print(f"🎤 You said: {transcript}")
-
-                        if (
-                            response.server_content.output_transcription
-                            and response.server_content.output_transcription.text
-                        ):
-                            transcript = (
-                                response.server_content.output_transcription.text
-                            )
-                            print(f"🗣️  AI said: {transcript}")
+                        input_transcription = server_content.input_transcription
+                        if input_transcription and input_transcription.text:
+                            print(f"🎤 You said: {input_transcription.text}")
+
+                        output_transcription = server_content.output_transcription
+                        if output_transcription and output_transcription.text:
+                            print(f"🗣️  AI said: {output_transcription.text}")
 
                 # Handle interruptions - clear audio queue
-                while not self.audio_out_queue.empty():
-                    try:
-                        self.audio_out_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+                self.audio_out.clear()
+                self._buffered_bytes = 0
 
             except Exception as e:
                 print(f"❌ Response handling error: {e}")
                 break
 
+    async def _read_line(self, prompt):
+        """
+        Read a line from stdin without tying up an executor thread.
+
+        Args:
+            prompt: Text printed before waiting for input
+
+        Returns:
+            The line without its trailing newline
+
+        Raises:
+            EOFError: If stdin is closed
+        """
+        print(prompt, end="", flush=True)
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        line_ready = loop.create_future()
+
+        def on_readable():
+            if not line_ready.done():
+                line_ready.set_result(sys.stdin.readline())
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except NotImplementedError:
+            # Windows event loops cannot watch stdin, fall back to a thread
+            return await asyncio.to_thread(input)
+
+        try:
+            line = await line_ready
+        finally:
+            loop.remove_reader(fd)
+
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
     async def handle_text_input(self):
         """Handle text input for when user wants to type instead of speak."""
         while True:
             try:
-                text = await asyncio.to_thread(
-                    input, "\nType message (or 'q' to quit): "
-                )
+                text = await self._read_line("\nType message (or 'q' to quit): ")
 
                 if text.lower().strip() in ["q", "quit", "exit"]:
                     print("👋 Goodbye!")
@@ -306,15 +474,16 @@ class LiveVoiceChat:
             ) as session:
                 self.session = session
 
-                # Create audio queues
-                self.audio_out_queue = asyncio.Queue()
+                # Create the playback wake-up and stop events on the running loop
+                self.audio_out_ready = asyncio.Event()
+                self._stop = asyncio.Event()
 
                 # Start all tasks
                 async with asyncio.TaskGroup() as tg:
                     # Audio tasks
                     tg.create_task(self.listen_microphone())
                     tg.create_task(self.play_audio_responses())
-                    tg.create_task(self.handle_live_responses())
+                    receive_task = tg.create_task(self.handle_live_responses())
 
                     # Text input task (this will exit when user types 'q')
                     text_task = tg.create_task(self.handle_text_input())
@@ -322,8 +491,12 @@ class LiveVoiceChat:
                     # Wait for text task to complete (user quits)
                     await text_task
 
-                    # Cancel other tasks
-                    raise asyncio.CancelledError("User requested exit")
+                    # Let the audio tasks exit their loops; the receiver is
+                    # blocked on the socket, so cancel it directly
+                    self._stop.set()
+                    receive_task.cancel()
+
+            print("🛑 Conversation ended")
 
         except asyncio.CancelledError:
             print("🛑 Conversation ended")
@@ -346,13 +519,48 @@ class LiveVoiceChat:
                 self.input_stream.close()
             if self.output_stream:
                 self.output_stream.close()
+            self._audio_executor.shutdown(wait=False)
             pya.terminate()
         except Exception:
             pass
 
 
-async def main():
-    """Main function."""
+def choose_voice():
+    """
+    Ask the user to pick an AI voice.
+
+    Returns:
+        The selected VoiceName, or the default on empty or invalid input
+    """
+    print("\n🗣️  Choose AI voice:")
+    for i, voice in enumerate(VOICES, 1):
+        print(f"   {i}. {voice.value}")
+
+    try:
+        choice = input(
+            f"\nSelect voice (1-{len(VOICES)}) or press Enter for default: "
+        ).strip()
+        if choice and choice.isdigit() and 1 <= int(choice) <= len(VOICES):
+            selected_voice = VOICES[int(choice) - 1]
+        else:
+            selected_voice = VoiceName.KORE
+
+        print(f"✅ Selected voice: {selected_voice.value}")
+
+    except (ValueError, KeyboardInterrupt):
+        selected_voice = VoiceName.KORE
+        print(f"✅ Using default voice: {selected_voice.value}")
+
+    return selected_voice
+
+
+async def main(assume_yes=False):
+    """
+    Main function.
+
+    Args:
+        assume_yes: Skip the interactive prompts and use the default voice
+    """
     print("🎙️  GEMINI LIVE API - REAL-TIME VOICE CHAT")
     print("=" * 60)
 
@@ -370,32 +578,18 @@ async def main():
         print("Make sure your audio devices are working")
         return
 
-    print("⚠️  IMPORTANT: Use headphones to prevent echo/feedback!")
-    input("Press Enter when you have headphones on and are ready to start...")
-
-    # Choose voice
-    print("\n🗣️  Choose AI voice:")
-    voices = list(VoiceName)
-    for i, voice in enumerate(voices, 1):
-        print(f"   {i}. {voice.value}")
-
-    try:
-        choice = input(
-            f"\nSelect voice (1-{len(voices)}) or press Enter for default: "
-        ).strip()
-        if choice and choice.isdigit() and 1 <= int(choice) <= len(voices):
-            selected_voice = voices[int(choice) - 1]
-        else:
-            selected_voice = VoiceName.KORE
-
-        print(f"✅ Selected voice: {selected_voice.value}")
+    # Build the service and its client while the user answers the prompts
+    warmup = asyncio.get_running_loop().run_in_executor(None, GeminiLiveService)
 
-    except (ValueError, KeyboardInterrupt):
+    print("⚠️  IMPORTANT: Use headphones to prevent echo/feedback!")
+    if assume_yes:
         selected_voice = VoiceName.KORE
-        print(f"✅ Using default voice: {selected_voice.value}")
+    else:
+        input("Press Enter when you have headphones on and are ready to start...")
+        selected_voice = choose_voice()
 
     # Start the chat
-    chat = LiveVoiceChat(voice_name=selected_voice)
+    chat = LiveVoiceChat(voice_name=selected_voice, service=await warmup)
 
     try:
         await chat.start_conversation()
@@ -406,8 +600,17 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Real-time voice chat with Gemini")
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="skip the headphone and voice prompts",
+    )
+    args = parser.parse_args()
+
     try:
-        asyncio.run(main())
+        run(main(assume_yes=args.yes))
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     finally:
@@ -12,7 +12,9 @@ This script enables live voice conversations about your screen content:
 Usage: python screen_voice_chat.py
 
 Requirements:
-- pip install pyaudio mss opencv-python pillow
+- pip install pyaudio mss opencv-python
+- Optional: pip install sounddevice (smoother audio)
+- Optional on Windows: pip install dxcam (faster screen capture)
 - Use headphones to prevent echo/feedback
 - Set GEMINI_API_KEY environment variable
 
@@ -23,25 +25,50 @@ Controls:
 """
 
 import asyncio
-import base64
-import io
+import collections
+import concurrent.futures
 import os
 import sys
+import time
+import zlib
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
+    import cv2
     import mss
-    import PIL.Image
+    import numpy as np
     import pyaudio
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
-    print("Install with: pip install pyaudio mss pillow")
-    print("On macOS: brew install portaudio && pip install pyaudio mss pillow")
+    print("Install with: pip install pyaudio mss opencv-python")
+    print("On macOS: brew install portaudio && pip install pyaudio mss opencv-python")
     sys.exit(1)
 
+# sounddevice reads the microphone and writes to the speaker from C with the
+# GIL released, so audio holds up better than PyAudio while frames encode
+try:
+    import sounddevice as sd
+except ImportError:
+    sd = None
+
+# Desktop Duplication capture is much cheaper than mss on Windows when available
+dxcam = None
+if sys.platform == "win32":
+    try:
+        import dxcam
+    except ImportError:
+        pass
+
+# uvloop cuts scheduling overhead for the concurrent audio, screen and socket
+# tasks; it is not available on Windows
+try:
+    from uvloop import run
+except ImportError:
+    from asyncio import run
+
 from src.app.schemas.gemini_live import (  # noqa: E402
     LiveSessionConfig,
     ResponseModality,
@@ -54,7 +81,17 @@ FORMAT = pyaudio.paInt16
 CHANNELS = 1
 SEND_SAMPLE_RATE = 16000
 RECEIVE_SAMPLE_RATE = 24000
-CHUNK_SIZE = 1024
+CHUNK_SIZE = 3200  # 200 ms per read, matching the live chat demo's send batches
+MAX_QUEUED_AUDIO_CHUNKS = 64  # Oldest playback chunks are dropped beyond this
+
+# Screen capture configuration
+MAX_SCREEN_SIZE = (1024, 768)  # Captures are shrunk to fit within this
+# Quality 70 is plenty for the vision model; OpenCV already encodes colour JPEGs
+# with 4:2:0 chroma subsampling
+JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 70]
+SCREEN_INTERVAL_ACTIVE = 0.5  # Seconds between captures while the user talks
+SCREEN_INTERVAL_IDLE = 5.0  # Seconds between captures otherwise
+SCREEN_ACTIVE_WINDOW = 10.0  # Seconds after speech that count as active
 
 pya = pyaudio.PyAudio()
 
@@ -67,8 +104,10 @@ class ScreenVoiceChat:
         self.service = GeminiLiveService()
         self.voice_name = voice_name
 
-        # Audio queues
-        self.audio_out_queue = None
+        # Audio playback buffer: a bounded deque drops the oldest chunks if the
+        # speaker falls behind, and the event wakes the playback task
+        self.audio_out = collections.deque(maxlen=MAX_QUEUED_AUDIO_CHUNKS)
+        self.audio_out_ready = None
         self.screen_queue = None
 
         # Audio streams
@@ -78,8 +117,26 @@ class ScreenVoiceChat:
         # Live API session
         self.session = None
 
-        # Screen capture
+        # Screen capture; the monitor and frame buffers are set up once and
+        # reused for every grab
         self.sct = None
+        self._camera = None  # dxcam capture on Windows, else mss is used
+        self._monitor = None
+        self._grab_size = None
+        self._bgr_buf = None
+        self._resized_buf = None
+        self._last_frame_crc = None  # Checksum of the last frame sent
+
+        # Capture cadence follows the conversation: speech forces a fresh
+        # frame and keeps the interval short until the user goes quiet
+        self._capture_event = None
+        self._last_speech = float("-inf")
+
+        # Screen grabs and JPEG encodes get their own thread so they never
+        # hold up microphone reads or speaker writes on the default executor
+        self._screen_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="screen"
+        )
 
         # Session configuration for multimodal (audio + visual)
         self.config = LiveSessionConfig(
@@ -112,29 +169,49 @@ class ScreenVoiceChat:
 
         # Create audio input stream (microphone)
         try:
-            self.input_stream = await asyncio.to_thread(
-                pya.open,
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=SEND_SAMPLE_RATE,
-                input=True,
-                input_device_index=mic_info["index"],
-                frames_per_buffer=CHUNK_SIZE,
-            )
+            if sd is not None:
+                self.input_stream = sd.RawInputStream(
+                    samplerate=SEND_SAMPLE_RATE,
+                    channels=CHANNELS,
+                    dtype="int16",
+                    blocksize=CHUNK_SIZE,
+                )
+                self.input_stream.start()
+            else:
+                self.input_stream = await asyncio.to_thread(
+                    pya.open,
+                    format=FORMAT,
+                    channels=CHANNELS,
+                    rate=SEND_SAMPLE_RATE,
+                    input=True,
+                    input_device_index=mic_info["index"],
+                    frames_per_buffer=CHUNK_SIZE,
+                )
             print("✅ Microphone ready")
         except Exception as e:
             print(f"❌ Microphone setup failed: {e}")
             return False
 
-        # Create audio output stream (speakers)
+        # Create audio output stream (speakers); both stream types take raw
+        # 16-bit PCM bytes in write()
         try:
-            self.output_stream = await asyncio.to_thread(
-                pya.open,
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RECEIVE_SAMPLE_RATE,
-                output=True,
-            )
+            if sd is not None:
+                self.output_stream = sd.RawOutputStream(
+                    samplerate=RECEIVE_SAMPLE_RATE,
+                    channels=CHANNELS,
+                    dtype="int16",
+                    blocksize=2048,
+                    latency="high",
+                )
+                self.output_stream.start()
+            else:
+                self.output_stream = await asyncio.to_thread(
+                    pya.open,
+                    format=FORMAT,
+                    channels=CHANNELS,
+                    rate=RECEIVE_SAMPLE_RATE,
+                    output=True,
+                )
             print("✅ Speakers ready")
         except Exception as e:
             print(f"❌ Speaker setup failed: {e}")
@@ -146,79 +223,196 @@ class ScreenVoiceChat:
         """Set up screen capture."""
         print("🖥️  Setting up screen capture...")
 
+        if dxcam is not None:
+            try:
+                # Keep the latest desktop frame ready in the background so
+                # each capture is a buffer read rather than a grab
+                self._camera = dxcam.create(output_color="BGR")
+                self._camera.start(target_fps=1, video_mode=True)
+                width, height = self._camera.width, self._camera.height
+                self._allocate_frame_buffers(width, height)
+                print(f"✅ Screen capture ready (dxcam): {width}x{height}")
+                return True
+            except Exception as e:
+                print(f"⚠️  dxcam unavailable, falling back to mss: {e}")
+                self._camera = None
+
         try:
             self.sct = mss.mss()
-            monitor = self.sct.monitors[0]  # Primary monitor
-            print(f"✅ Screen capture ready: {monitor['width']}x{monitor['height']}")
+            self._monitor = self.sct.monitors[0]  # Primary monitor
+            width, height = self._monitor["width"], self._monitor["height"]
+            self._allocate_frame_buffers(width, height)
+            print(f"✅ Screen capture ready: {width}x{height}")
             return True
         except Exception as e:
             print(f"❌ Screen capture setup failed: {e}")
             return False
 
+    def _allocate_frame_buffers(self, width, height):
+        """
+        Allocate the reusable colour and resize buffers for a grab size.
+
+        Args:
+            width: Captured frame width in pixels
+            height: Captured frame height in pixels
+        """
+        self._grab_size = (width, height)
+        self._bgr_buf = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Shrink to fit within MAX_SCREEN_SIZE, keeping the aspect ratio
+        scale = min(MAX_SCREEN_SIZE[0] / width, MAX_SCREEN_SIZE[1] / height, 1.0)
+        if scale < 1.0:
+            size = (round(width * scale), round(height * scale))
+            self._resized_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        else:
+            self._resized_buf = None
+
+    def _grab_frame(self):
+        """
+        Grab the current screen as a BGR numpy array.
+
+        Returns:
+            The frame, either dxcam's latest frame or an mss grab converted
+            into the preallocated BGR buffer
+        """
+        if self._camera is not None:
+            frame = self._camera.get_latest_frame()
+            height, width = frame.shape[:2]
+            if (width, height) != self._grab_size:
+                self._allocate_frame_buffers(width, height)
+            return frame
+
+        screenshot = self.sct.grab(self._monitor)
+
+        # HiDPI displays or a resolution change can alter the grab size
+        if screenshot.size != self._grab_size:
+            self._allocate_frame_buffers(*screenshot.size)
+
+        # View the raw BGRA pixels without copying and convert into the
+        # preallocated BGR buffer OpenCV encodes natively
+        width, height = self._grab_size
+        bgra = np.frombuffer(screenshot.bgra, dtype=np.uint8)
+        bgra = bgra.reshape(height, width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._bgr_buf)
+
     def capture_screen(self):
-        """Capture current screen as base64 encoded image."""
+        """
+        Capture current screen as a JPEG image blob.
+
+        Returns:
+            The blob dict, or None if the screen is unchanged since the last
+            capture or the capture failed
+        """
         try:
             # Capture the screen
-            monitor = self.sct.monitors[0]
-            screenshot = self.sct.grab(monitor)
-
-            # Convert to PIL Image
-            img = PIL.Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-
-            # Resize to reduce bandwidth (optional)
-            img.thumbnail([1024, 768], PIL.Image.Resampling.LANCZOS)
+            frame = self._grab_frame()
+
+            # Resize to reduce bandwidth; area averaging is fast and alias-free
+            # for downscaling, which is all these frames need
+            if self._resized_buf is not None:
+                frame = cv2.resize(
+                    frame,
+                    (self._resized_buf.shape[1], self._resized_buf.shape[0]),
+                    dst=self._resized_buf,
+                    interpolation=cv2.INTER_AREA,
+                )
 
-            # Convert to JPEG and encode as base64
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=85)
-            buffer.seek(0)
+            # Skip the encode and send when nothing on screen has changed
+            frame_crc = zlib.crc32(np.ascontiguousarray(frame))
+            if frame_crc == self._last_frame_crc:
+                return None
+            self._last_frame_crc = frame_crc
 
-            image_data = base64.b64encode(buffer.read()).decode()
+            # Convert to JPEG; the SDK handles wire encoding of the raw bytes
+            ok, jpeg = cv2.imencode(".jpg", frame, JPEG_PARAMS)
+            if not ok:
+                raise RuntimeError("JPEG encoding failed")
 
-            return {"mime_type": "image/jpeg", "data": image_data}
+            return {"mime_type": "image/jpeg", "data": jpeg.tobytes()}
 
         except Exception as e:
             print(f"❌ Screen capture error: {e}")
             return None
 
-    async def capture_screen_periodically(self):
-        """Periodically capture screen and send to Live API."""
+    def _note_user_speech(self):
+        """Record user speech, forcing a capture if it starts a new exchange."""
+        now = time.monotonic()
+        if now - self._last_speech >= SCREEN_ACTIVE_WINDOW:
+            self._capture_event.set()
+        self._last_speech = now
+
+    async def capture_screen_periodically(self, session):
+        """
+        Periodically capture screen and send to Live API.
+
+        Args:
+            session: The connected Live API session
+        """
         print("📸 Starting periodic screen capture...")
+        loop = asyncio.get_running_loop()
+        send = session.send_realtime_input
 
         while True:
             try:
                 # Capture screen
-                screen_data = await asyncio.to_thread(self.capture_screen)
+                screen_data = await loop.run_in_executor(
+                    self._screen_pool, self.capture_screen
+                )
 
-                if screen_data and self.session:
+                if screen_data:
                     # Send screen capture to Live API
-                    await self.session.send(input=screen_data)
-
-                # Capture screen every 2 seconds (adjust as needed)
-                await asyncio.sleep(2.0)
+                    await send(video=screen_data)
+
+                # Capture often while the user is talking, rarely when idle,
+                # and straight away when they start speaking
+                if time.monotonic() - self._last_speech < SCREEN_ACTIVE_WINDOW:
+                    interval = SCREEN_INTERVAL_ACTIVE
+                else:
+                    interval = SCREEN_INTERVAL_IDLE
+                try:
+                    await asyncio.wait_for(self._capture_event.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._capture_event.clear()
 
             except Exception as e:
                 print(f"❌ Screen capture loop error: {e}")
                 break
 
-    async def listen_microphone(self):
-        """Continuously listen to microphone and send to Live API."""
+    async def listen_microphone(self, session):
+        """
+        Continuously listen to microphone and send to Live API.
+
+        Args:
+            session: The connected Live API session
+        """
         print("🎧 Listening to microphone...")
+        send = session.send_realtime_input
+
+        if sd is not None:
+
+            def read_chunk():
+                # RawInputStream returns a raw buffer plus an overflow flag;
+                # the bytes copy is only made for the Live API payload
+                data, _ = self.input_stream.read(CHUNK_SIZE)
+                return bytes(data)
+
+        else:
+            kwargs = {"exception_on_overflow": False} if __debug__ else {}
 
-        kwargs = {"exception_on_overflow": False} if __debug__ else {}
+            def read_chunk():
+                return self.input_stream.read(CHUNK_SIZE, **kwargs)
+
+        # Reused for every send; the SDK copies it into a Blob before awaiting
+        audio_payload = {"data": b"", "mime_type": "audio/pcm"}
 
         while True:
             try:
                 # Read audio data from microphone
-                data = await asyncio.to_thread(
-                    self.input_stream.read, CHUNK_SIZE, **kwargs
-                )
+                audio_payload["data"] = await asyncio.to_thread(read_chunk)
 
                 # Send to Live API session
-                if self.session:
-                    await self.session.send_realtime_input(
-                        audio={"data": data, "mime_type": "audio/pcm"}
-                    )
+                await send(audio=audio_payload)
 
             except Exception as e:
                 print(f"❌ Microphone error: {e}")
@@ -229,7 +423,10 @@ class ScreenVoiceChat:
         while True:
             try:
                 # Get audio data from queue
-                audio_data = await self.audio_out_queue.get()
+                while not self.audio_out:
+                    await self.audio_out_ready.wait()
+                    self.audio_out_ready.clear()
+                audio_data = self.audio_out.popleft()
 
                 # Play through speakers
                 await asyncio.to_thread(self.output_stream.write, audio_data)
@@ -238,55 +435,60 @@ class ScreenVoiceChat:
                 print(f"❌ Audio playback error: {e}")
                 break
 
-    async def handle_live_responses(self):
-        """Handle responses from the Live API session."""
+    async def handle_live_responses(self, session):
+        """
+        Handle responses from the Live API session.
+
+        Args:
+            session: The connected Live API session
+        """
         print("🤖 Ready to receive AI responses...")
 
+        # The buffer and event live for the whole session, so bind them once
+        audio_out = self.audio_out
+        audio_out_ready = self.audio_out_ready
+
         while True:
             try:
-                turn = self.session.receive()
+                turn = session.receive()
                 async for response in turn:
                     # Handle audio data
-                    if hasattr(response, "data") and response.data:
-                        await self.audio_out_queue.put(response.data)
+                    data = getattr(response, "data", None)
+                    if data:
+                        audio_out.append(data)
+                        audio_out_ready.set()
 
                     # Handle text responses (for debugging)
-                    if hasattr(response, "text") and response.text:
-                        print(f"🤖 AI: {response.text}")
+                    text = getattr(response, "text", None)
+                    if text:
+                        print(f"🤖 AI: {text}")
 
                     # Handle transcriptions
-                    if hasattr(response, "server_content") and response.server_content:
-                        if (
-                            response.server_content.input_transcription
-                            and response.server_content.input_transcription.text
-                        ):
-                            transcript = (
-                                response.server_content.input_transcription.text
-                            )
-                            print(f"🎤 You said: {transcript}")
-
-                        if (
-                            response.server_content.output_transcription
-                            and response.server_content.output_transcription.text
-                        ):
-                            transcript = (
-                                response.server_content.output_transcription.text
-                            )
-                            print(f"🗣️  AI said: {transcript}")
+                    server_content = getattr(response, "server_content", None)
+                    if server_content:
+                        input_transcription = server_content.input_transcription
+                        if input_transcription and input_transcription.text:
+                            print(f"🎤 You said: {input_transcription.text}")
+                            self._note_user_speech()
+
+                        output_transcription = server_content.output_transcription
+                        if output_transcription and output_transcription.text:
+                            print(f"🗣️  AI said: {output_transcription.text}")
 
                 # Handle interruptions - clear audio queue
-                while not self.audio_out_queue.empty():
-                    try:
-                        self.audio_out_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+                audio_out.clear()
 
             except Exception as e:
                 print(f"❌ Response handling error: {e}")
                 break
 
-    async def handle_text_input(self):
-        """Handle text input for when user wants to type instead of speak."""
+    async def handle_text_input(self, session):
+        """
+        Handle text input for when user wants to type instead of speak.
+
+        Args:
+            session: The connected Live API session
+        """
         while True:
             try:
                 text = await asyncio.to_thread(
@@ -298,11 +500,10 @@ class ScreenVoiceChat:
                     return
 
                 if text.strip():
-                    if self.session:
-                        await self.session.send_client_content(
-                            turns={"role": "user", "parts": [{"text": text}]},
-                            turn_complete=True,
-                        )
+                    await session.send_client_content(
+                        turns={"role": "user", "parts": [{"text": text}]},
+                        turn_complete=True,
+                    )
 
             except (EOFError, KeyboardInterrupt):
                 print("\n👋 Goodbye!")
@@ -335,27 +536,30 @@ class ScreenVoiceChat:
             ) as session:
                 self.session = session
 
-                # Create audio queues
-                self.audio_out_queue = asyncio.Queue()
+                # Create the playback and capture wake-up events on the running loop
+                self.audio_out_ready = asyncio.Event()
+                self._capture_event = asyncio.Event()
 
                 # Send initial screen capture
-                initial_screen = self.capture_screen()
+                initial_screen = await asyncio.get_running_loop().run_in_executor(
+                    self._screen_pool, self.capture_screen
+                )
                 if initial_screen:
-                    await session.send(input=initial_screen)
+                    await session.send_realtime_input(video=initial_screen)
                     print("📸 Initial screen capture sent")
 
                 # Start all tasks
                 async with asyncio.TaskGroup() as tg:
                     # Audio tasks
-                    tg.create_task(self.listen_microphone())
+                    tg.create_task(self.listen_microphone(session))
                     tg.create_task(self.play_audio_responses())
-                    tg.create_task(self.handle_live_responses())
+                    tg.create_task(self.handle_live_responses(session))
 
                     # Screen capture task
-                    tg.create_task(self.capture_screen_periodically())
+                    tg.create_task(self.capture_screen_periodically(session))
 
                     # Text input task (this will exit when user types 'q')
-                    text_task = tg.create_task(self.handle_text_input())
+                    text_task = tg.create_task(self.handle_text_input(session))
 
                     # Wait for text task to complete (user quits)
                     await text_task
@@ -384,8 +588,11 @@ class ScreenVoiceChat:
                 self.input_stream.close()
             if self.output_stream:
                 self.output_stream.close()
+            if self._camera:
+                self._camera.stop()
             if self.sct:
                 self.sct.close()
+            self._screen_pool.shutdown(wait=False)
             pya.terminate()
         except Exception:
             pass
@@ -414,7 +621,7 @@ async def main():
     print("   • Use headphones to prevent echo/feedback")
     print("   • The AI can see everything on your screen")
     print("   • Make sure you're comfortable sharing your screen content")
-    print("   • Screen captures are sent every 2 seconds")
+    print("   • Screen captures are sent every 0.5-5 seconds while it changes")
 
     response = (
         input("\nDo you want to continue with screen sharing? (y/n): ").strip().lower()
@@ -459,7 +666,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
     finally:
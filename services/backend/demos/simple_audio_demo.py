@@ -49,6 +49,7 @@ async def generate_initial_audio():
 
     audio_file = None
     transcript = ""
+    audio_dir = Path(service.audio_output_dir)
 
     async for chunk in service.send_text_message(prompt, session_config=config):
         if chunk["type"] == "transcript":
@@ -60,7 +61,7 @@ async def generate_initial_audio():
                 print(f"✅ Audio saved: {audio_file}")
 
                 # Show file info
-                audio_path = Path(service.audio_output_dir) / audio_file
+                audio_path = audio_dir / audio_file
                 if audio_path.exists():
                     size_kb = audio_path.stat().st_size / 1024
                     print(f"📊 File size: {size_kb:.1f} KB")
@@ -150,6 +151,7 @@ async def demonstrate_audio_chain():
 
     prompt = "Ask a follow-up question about space exploration"
     print(f"🗣️  Generating follow-up question...")
+    audio_dir = Path(service.audio_output_dir)
 
     async for chunk in service.send_text_message(prompt, session_config=config):
         if chunk["type"] == "transcript":
@@ -163,7 +165,7 @@ async def demonstrate_audio_chain():
                 print("\n🔄 Using question as input for another response...")
 
                 # Convert and process the question
-                audio_path = Path(service.audio_output_dir) / question_file
+                audio_path = audio_dir / question_file
                 pcm_data = await service.convert_wav_to_pcm(str(audio_path))
 
                 answer_config = LiveSessionConfig(
@@ -14,37 +14,27 @@
 
 """Main API router for v1."""
 
-from fastapi import APIRouter
-
-from src.app.api.v1.routes import (
-    auth,
-    document_edit,
-    gemini_live,
-    text2image,
-    text2speech,
-    text2video,
-)
-
-api_router = APIRouter()
-
-api_router.include_router(
-    document_edit.router, prefix="/documentedit", tags=["document-edit"]
-)
+import importlib
 
-api_router.include_router(
-    text2speech.router, prefix="/text2speech", tags=["text-to-speech"]
-)
+from fastapi import APIRouter
 
-api_router.include_router(
-    text2video.router, prefix="/text2video", tags=["text-to-video"]
-)
+from src.app.core.config import settings
 
-api_router.include_router(
-    text2image.router, prefix="/text2image", tags=["text-to-image"]
+# (module under routes, URL prefix, OpenAPI tag)
+ROUTES = (
+    ("document_edit", "/documentedit", "document-edit"),
+    ("text2speech", "/text2speech", "text-to-speech"),
+    ("text2video", "/text2video", "text-to-video"),
+    ("text2image", "/text2image", "text-to-image"),
+    ("gemini_live", "/gemini-live", "gemini-live"),
+    ("auth", "/auth", "authentication"),
 )
 
-api_router.include_router(
-    gemini_live.router, prefix="/gemini-live", tags=["gemini-live"]
-)
+api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
+for module_name, prefix, tag in ROUTES:
+    # Modules are imported on demand so disabled features cost nothing
+    if module_name == "gemini_live" and not settings.ENABLE_GEMINI_LIVE:
+        continue
+    module = importlib.import_module(f"src.app.api.v1.routes.{module_name}")
+    api_router.include_router(module.router, prefix=prefix, tags=[tag])
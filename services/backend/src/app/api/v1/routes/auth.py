@@ -19,21 +19,23 @@ This module provides endpoints for user authentication including login and logou
 functionality. It uses session-based authentication with sessionStorage on the frontend.
 """
 
+import asyncio
+import time
 import uuid
-from typing import Dict
 
+import aiohttp
+import httpx
 from fastapi import APIRouter, Header, HTTPException
 
 from src.app.core.config import settings
+from src.app.core.genai_client import get_user_client
+from src.app.core.session_store import get_session_store
 from src.app.models.login import LoginRequest, LoginResponse, LogoutResponse
 
 router = APIRouter()
 
-# Simple in-memory session store - replace with Redis or database in production
-active_sessions: Dict[str, Dict] = {}
 
-
-def get_user_api_key(session_id: str) -> str:
+async def get_user_api_key(session_id: str) -> str:
     """
     Retrieve the Gemini API key for a given session.
 
@@ -46,13 +48,11 @@ def get_user_api_key(session_id: str) -> str:
     Raises:
         HTTPException: If session not found or not authenticated
     """
-    if session_id not in active_sessions:
+    # Sessions are only stored after a successful login, and expire on their own
+    session = await get_session_store().get(session_id)
+    if session is None:
         raise HTTPException(status_code=401, detail="Session not found")
 
-    session = active_sessions[session_id]
-    if not session.get("authenticated", False):
-        raise HTTPException(status_code=401, detail="Session not authenticated")
-
     return session.get("gemini_api_key", "")
 
 
@@ -75,33 +75,64 @@ async def login(login_data: LoginRequest) -> LoginResponse:
         if login_data.secret != settings.AUTH_SECRET:
             raise HTTPException(status_code=401, detail="Invalid access code")
 
-        # Validate the Gemini API key by making a simple test call
-        try:
-            from google import genai
-
-            # Create a client with the user's API key
-            client = genai.Client(api_key=login_data.gemini_api_key)
-
-            # Test the API key with a simple content generation call
-            client.models.generate_content(
-                model="gemini-2.0-flash-exp", contents="Hello"
-            )
-            # If this succeeds, the API key is valid
-        except genai.errors.ClientError:
-            raise HTTPException(status_code=401, detail="Invalid Gemini API key")
-        except Exception:
+        # Validate the Gemini API key, reusing a recent result when there is one
+        store = get_session_store()
+        key_valid = await store.get_key_check(login_data.gemini_api_key)
+        if key_valid is None:
+            try:
+                from google import genai
+                from google.genai import types
+
+                client = get_user_client(login_data.gemini_api_key)
+
+                # Test the API key with a one-token call that doesn't block the loop
+                await client.aio.models.generate_content(
+                    model="gemini-2.0-flash-exp",
+                    contents="Hello",
+                    config=types.GenerateContentConfig(max_output_tokens=1),
+                )
+                key_valid = True
+            except genai.errors.ClientError as e:
+                if e.code == 429:
+                    raise HTTPException(
+                        status_code=429,
+                        detail="Gemini rate limit reached, please try again shortly",
+                    )
+                # Remember rejected keys briefly so retries can't hammer the API
+                key_valid = False
+                await store.set_key_check(login_data.gemini_api_key, False)
+            except (
+                genai.errors.ServerError,
+                aiohttp.ClientError,
+                httpx.TransportError,
+                asyncio.TimeoutError,
+            ):
+                # Outages say nothing about the key, so they are not cached
+                raise HTTPException(
+                    status_code=503,
+                    detail="Gemini is unavailable, please try again later",
+                )
+            else:
+                await store.set_key_check(login_data.gemini_api_key, True)
+
+        if not key_valid:
             raise HTTPException(status_code=401, detail="Invalid Gemini API key")
 
         # Create a new session
         session_id = str(uuid.uuid4())
 
         # Store session data including the API key
-        active_sessions[session_id] = {
-            "authenticated": True,
-            "user_name": login_data.name.strip() if login_data.name else "Anonymous",
-            "gemini_api_key": login_data.gemini_api_key,
-            "login_timestamp": str(__import__("datetime").datetime.now()),
-        }
+        await store.set(
+            session_id,
+            {
+                "user_name": (
+                    login_data.name.strip() if login_data.name else "Anonymous"
+                ),
+                "gemini_api_key": login_data.gemini_api_key,
+                # Epoch nanoseconds; session fields are stored as strings
+                "login_timestamp": str(time.time_ns()),
+            },
+        )
 
         return LoginResponse(
             success=True,
@@ -119,16 +150,19 @@ async def login(login_data: LoginRequest) -> LoginResponse:
 
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout() -> LogoutResponse:
+async def logout(x_session_id: str = Header(None)) -> LogoutResponse:
     """
     Logout user by clearing authentication from session.
 
+    Args:
+        x_session_id: Session ID from X-Session-ID header, if sent
+
     Returns:
         LogoutResponse: Logout result
     """
     try:
-        # For this simple implementation, we just return success
-        # In a real app, you'd identify the session and remove it
+        if x_session_id:
+            await get_session_store().delete(x_session_id)
         return LogoutResponse(success=True, message="Logout successful")
 
     except Exception as e:
@@ -174,7 +208,7 @@ async def get_user_api_key_endpoint(x_session_id: str = Header(None)) -> dict:
         if not x_session_id:
             raise HTTPException(status_code=401, detail="Session ID required")
 
-        api_key = get_user_api_key(x_session_id)
+        api_key = await get_user_api_key(x_session_id)
         return {"api_key": api_key}
 
     except HTTPException:
@@ -21,14 +21,18 @@ edited content.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from google.genai import errors
 from loguru import logger
 
 from src.app.schemas.document_edit import (
+    DocumentEditBatchRequest,
+    DocumentEditBatchResponse,
     DocumentEditRequest,
     DocumentEditResponse,
 )
 from src.app.services.document_edit_service import DocumentEditService
 from src.app.utils.dependencies import get_document_edit_service
+from src.app.utils.exceptions import GeminiAPIException
 
 router = APIRouter()
 
@@ -53,7 +57,7 @@ async def edit_document(
     """
     try:
         logger.info(
-            "Processing document edit request with %s characters", len(request.content)
+            "Processing document edit request with {} characters", len(request.content)
         )
 
         edited_content = await service.edit_document(
@@ -73,8 +77,89 @@ async def edit_document(
         )
 
     except Exception as e:
-        logger.error("Document editing failed: %s", e)
+        logger.error("Document editing failed: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Document editing failed: {str(e)}",
         )
+
+
+@router.post(
+    "/batch",
+    response_model=DocumentEditBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_document_edit_batch(
+    request: DocumentEditBatchRequest,
+    service: DocumentEditService = Depends(get_document_edit_service),
+) -> DocumentEditBatchResponse:
+    """
+    Submit several document edits as one Gemini batch job.
+
+    Batch jobs cost half as much as individual edits but can take up to a
+    day; poll GET /batch/{job_id} for the results.
+
+    Args:
+        request: Document edits to run
+        service: Document edit service dependency
+
+    Returns:
+        DocumentEditBatchResponse: The job identifier and its initial state
+
+    Raises:
+        HTTPException: If the batch job cannot be created
+    """
+    try:
+        job_id, state = await service.submit_edit_batch(request.requests)
+        return DocumentEditBatchResponse(job_id=job_id, state=state)
+
+    except Exception as e:
+        logger.error("Document edit batch submission failed: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Document edit batch submission failed: {str(e)}",
+        )
+
+
+@router.get("/batch/{job_id}", response_model=DocumentEditBatchResponse)
+async def get_document_edit_batch(
+    job_id: str,
+    service: DocumentEditService = Depends(get_document_edit_service),
+) -> DocumentEditBatchResponse:
+    """
+    Get the state of a document edit batch job, with results once done.
+
+    Args:
+        job_id: Batch job identifier returned on submission
+        service: Document edit service dependency
+
+    Returns:
+        DocumentEditBatchResponse: The job state and any results
+
+    Raises:
+        HTTPException: If the job is unknown or failed
+    """
+    try:
+        state, edited_contents = await service.get_edit_batch(job_id)
+        return DocumentEditBatchResponse(
+            job_id=job_id, state=state, edited_contents=edited_contents
+        )
+
+    except errors.ClientError as e:
+        if e.code == 404:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Batch job not found"
+            )
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+    except GeminiAPIException as e:
+        logger.error("Document edit batch {} failed: {}", job_id, e)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Document edit batch failed: {e.message}",
+        )
+    except Exception as e:
+        logger.error("Document edit batch lookup failed: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Document edit batch lookup failed: {str(e)}",
+        )
@@ -14,9 +14,11 @@
 
 """WebSocket routes for Gemini Live API."""
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, WebSocket
 from loguru import logger
 
+from src.app.schemas.gemini_live import VoiceName
 from src.app.schemas.gemini_live_web import (
     ActiveSessionsResponse,
     SessionInfo,
@@ -27,6 +29,39 @@ from src.app.utils.dependencies import get_gemini_live_websocket_service
 
 router = APIRouter()
 
+# The voice list is fixed, so the response body is built once at import time
+_VOICES_RESPONSE = {
+    "voices": [
+        {
+            "id": voice.value,
+            "name": voice.value.title(),
+            "description": f"{voice.value.title()} voice option",
+        }
+        for voice in VoiceName
+    ]
+}
+
+# Stats only change as sessions come and go, so dashboards polling /stats
+# and /health share one computation per STATS_CACHE_SECONDS
+STATS_CACHE_SECONDS = 2
+_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_SECONDS)
+
+
+def _cached_session_stats(service: GeminiLiveWebSocketService) -> dict:
+    """
+    Get session statistics, reusing a result computed in the last few seconds.
+
+    Args:
+        service: The WebSocket service owning the session manager
+
+    Returns:
+        dict: Session statistics as returned by the service
+    """
+    stats = _stats_cache.get("stats")
+    if stats is None:
+        stats = _stats_cache["stats"] = service.get_session_stats()
+    return stats
+
 
 @router.websocket("/voice-chat")
 async def voice_chat_websocket(
@@ -84,7 +119,7 @@ async def get_active_sessions(
         )
 
     except Exception as e:
-        logger.error(f"Failed to get active sessions: {e}")
+        logger.error("Failed to get active sessions: {}", e)
         raise
 
 
@@ -94,11 +129,11 @@ async def get_session_stats(
 ):
     """Get session statistics."""
     try:
-        stats = service.get_session_stats()
+        stats = _cached_session_stats(service)
         return SessionStatsResponse(**stats)
 
     except Exception as e:
-        logger.error(f"Failed to get session stats: {e}")
+        logger.error("Failed to get session stats: {}", e)
         raise
 
 
@@ -116,29 +151,18 @@ async def terminate_session(
         await session.stop_gemini_session()
         service.session_manager.remove_session(session_id)
 
-        logger.info(f"Manually terminated session {session_id}")
+        logger.info("Manually terminated session {}", session_id)
         return {"message": "Session terminated", "session_id": session_id}
 
     except Exception as e:
-        logger.error(f"Failed to terminate session {session_id}: {e}")
+        logger.error("Failed to terminate session {}: {}", session_id, e)
         raise
 
 
 @router.get("/voices")
 async def get_available_voices():
     """Get list of available AI voices."""
-    from src.app.schemas.gemini_live import VoiceName
-
-    voices = [
-        {
-            "id": voice.value,
-            "name": voice.value.title(),
-            "description": f"{voice.value.title()} voice option",
-        }
-        for voice in VoiceName
-    ]
-
-    return {"voices": voices}
+    return _VOICES_RESPONSE
 
 
 @router.get("/health")
@@ -147,12 +171,12 @@ async def websocket_health_check(
 ):
     """Health check for WebSocket service."""
     try:
-        stats = service.get_session_stats()
+        stats = _cached_session_stats(service)
         return {
             "status": "healthy",
             "active_sessions": stats["active_sessions"],
             "total_sessions": stats["total_sessions"],
         }
     except Exception as e:
-        logger.error(f"WebSocket health check failed: {e}")
+        logger.error("WebSocket health check failed: {}", e)
         return {"status": "unhealthy", "error": str(e)}
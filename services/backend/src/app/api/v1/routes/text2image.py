@@ -22,7 +22,6 @@ and for downloading the generated image files.
 import os
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
 from google.api_core import exceptions
 from loguru import logger
 
@@ -32,6 +31,7 @@ from src.app.services.text2image_service import (
     Text2ImageService,
 )
 from src.app.utils.dependencies import get_text2image_service
+from src.app.utils.downloads import file_download_response
 
 router = APIRouter()
 
@@ -43,49 +43,54 @@ async def generate_images(
 ):
     """Generate images from text prompt."""
     try:
-        logger.info("Generating %d image(s) for prompt...", request.num_images)
+        logger.info("Generating {} image(s) for prompt...", request.num_images)
         file_paths = await service.generate_images(
             prompt=request.prompt,
             num_images=request.num_images,
         )
-        logger.info("Successfully generated images: %s", file_paths)
+        logger.info("Successfully generated images: {}", file_paths)
         return Text2ImageResponse(file_paths=file_paths, status="success")
 
     except ImageGenerationError as e:
-        logger.error("Image generation failed: %s", e)
+        logger.error("Image generation failed: {}", e)
         raise HTTPException(
             status_code=500,
             detail=str(e),
         )
     except exceptions.ResourceExhausted as e:
-        logger.warning("Rate limit exceeded for image generation: %s", e)
+        logger.warning("Rate limit exceeded for image generation: {}", e)
         raise HTTPException(
             status_code=429,
             detail="Rate limit exceeded. Please try again later.",
         )
 
     except exceptions.GoogleAPICallError as e:
-        logger.error("Image generation service API error: %s", e)
+        logger.error("Image generation service API error: {}", e)
         raise HTTPException(
             status_code=502,
             detail=f"The image generation service returned an error: {e}",
         )
 
     except Exception as e:
-        logger.error("Unexpected error during image generation: %s", e)
+        logger.error("Unexpected error during image generation: {}", e)
         raise HTTPException(
             status_code=500, detail=f"An unexpected error occurred: {e}"
         )
 
 
 @router.get("/download/{filename}")
-async def download_image(
+def download_image(
     filename: str,
     service: Text2ImageService = Depends(get_text2image_service),
 ):
     """Download generated image file."""
     file_path = os.path.join(service.output_dir, filename)
-    if not os.path.exists(file_path):
+    try:
+        # One stat both checks existence and feeds the response headers
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(file_path, media_type="image/png")
+    return file_download_response(
+        file_path, f"image/{filename}", "image/png", stat_result=stat_result
+    )
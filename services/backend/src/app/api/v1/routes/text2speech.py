@@ -16,9 +16,18 @@
 
 import os
 import uuid
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from typing import Any, Dict, Tuple
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from src.app.core.config import settings
@@ -27,14 +36,81 @@ from src.app.schemas.text2speech import (
     Text2SpeechResponse,
 )
 from src.app.services.text2speech_service import Text2SpeechService
+from src.app.utils.concurrency import SingleFlight
 from src.app.utils.dependencies import get_text2speech_service
+from src.app.utils.downloads import (
+    file_download_response,
+    sign_download_path,
+    verify_download_signature,
+)
+from src.app.utils.static_json import StaticJSON
 
 router = APIRouter()
 
+# Speech lookups and generations in flight, keyed by speech_cache_key
+_speech_inflight = SingleFlight()
+
+# For now, serve a mock list of speakers
+# In a real implementation, this would come from the TTS service
+_SPEAKER_LIST = [
+    {"id": "joe", "name": "Joe", "language": "en-US", "gender": "male"},
+    {"id": "jane", "name": "Jane", "language": "en-US", "gender": "female"},
+    {"id": "alex", "name": "Alex", "language": "en-US", "gender": "neutral"},
+]
+
+_SPEAKERS = StaticJSON({"speakers": _SPEAKER_LIST})
+
+_SPEAKER_DETAILS = {
+    speaker["id"]: StaticJSON(
+        {
+            "speaker": speaker["id"],
+            "voice_name": speaker["name"],
+            "language_code": speaker["language"],
+            "gender": speaker["gender"],
+        }
+    )
+    for speaker in _SPEAKER_LIST
+}
+
+
+async def _speech_file(
+    service: Text2SpeechService, cache_key: str, speech_options: Dict[str, Any]
+) -> Tuple[str, int, bool]:
+    """
+    Reuse the cached audio file for a request, or generate and cache a new one.
+
+    Args:
+        service: Text-to-speech service
+        cache_key: Key from speech_cache_key for the request
+        speech_options: Keyword arguments for save_speech_stream
+
+    Returns:
+        Tuple of the file identifier, its PCM size in bytes and whether it
+        came from the cache
+    """
+    cached = await service.get_cached_speech(cache_key)
+    if cached:
+        file_id, data_size = cached
+        logger.info("Reusing cached speech: {}.wav", file_id)
+        return file_id, data_size, True
+
+    file_id = uuid.uuid4().hex
+    filename = f"{file_id}.wav"
+
+    # Stream speech straight to disk (the service creates the output
+    # directory on startup)
+    file_path = os.path.join(service.output_dir, filename)
+    data_size = await service.save_speech_stream(file_path=file_path, **speech_options)
+    await service.cache_speech(cache_key, file_id, data_size)
+
+    logger.info("Speech generation completed successfully: {}", filename)
+    return file_id, data_size, False
+
 
 @router.post("/", response_model=Text2SpeechResponse)
 async def generate_speech(
     request: Text2SpeechRequest,
+    http_request: Request,
     service: Text2SpeechService = Depends(get_text2speech_service),
 ) -> Text2SpeechResponse:
     """
@@ -42,6 +118,7 @@ async def generate_speech(
 
     Args:
         request: Text-to-speech request containing text and voice configuration
+        http_request: Incoming HTTP request, used to build the download link
         service: Text-to-speech service dependency
 
     Returns:
@@ -51,16 +128,11 @@ async def generate_speech(
         HTTPException: If speech generation fails
     """
     try:
-        logger.info(
-            "Processing text-to-speech request with %s characters", len(request.text)
+        logger.debug(
+            "Processing text-to-speech request with {} characters", len(request.text)
         )
 
-        # Generate unique filename
-        file_id = str(uuid.uuid4())
-        filename = f"{file_id}.wav"
-
-        # Generate speech
-        audio_data = await service.generate_speech(
+        speech_options = dict(
             text=request.text,
             is_multi_speaker=request.is_multi_speaker,
             voice_name=request.voice_name,
@@ -69,68 +141,142 @@ async def generate_speech(
             pitch=request.pitch,
         )
 
-        # Ensure output directory exists
-        os.makedirs(settings.AUDIO_OUTPUT_DIR, exist_ok=True)
-
-        # Save audio file
-        file_path = os.path.join(settings.AUDIO_OUTPUT_DIR, filename)
-        await service.save_audio_file(audio_data, file_path)
-
-        logger.info("Speech generation completed successfully: %s", filename)
+        # Identical requests reuse the audio file generated the first time.
+        # The lookup, generation and cache write run as one flight per key, so
+        # concurrent identical requests share one Gemini call and one file
+        cache_key = service.speech_cache_key(**speech_options)
+        file_id, data_size, cache_hit = await _speech_inflight.do(
+            cache_key, lambda: _speech_file(service, cache_key, speech_options)
+        )
+        filename = f"{file_id}.wav"
 
         return Text2SpeechResponse(
             audio_file_id=file_id,
             filename=filename,
-            file_path=file_path,
-            duration_seconds=len(audio_data)
+            download_url=sign_download_path(
+                http_request.app.url_path_for("download_audio", file_id=file_id),
+                file_id,
+            ),
+            duration_seconds=data_size
             / (settings.AUDIO_SAMPLE_RATE * settings.AUDIO_SAMPLE_WIDTH),
-            file_size_bytes=len(audio_data),
+            file_size_bytes=data_size,
+            cache_hit=cache_hit,
             status="success",
         )
 
     except Exception as e:
-        logger.error("Speech generation failed: %s", e)
+        logger.exception("Speech generation failed: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Speech generation failed: {str(e)}",
         )
 
 
+@router.post("/stream")
+async def stream_speech(
+    request: Text2SpeechRequest,
+    service: Text2SpeechService = Depends(get_text2speech_service),
+) -> StreamingResponse:
+    """
+    Stream speech as a WAV file while it is being generated.
+
+    Args:
+        request: Text-to-speech request containing text and voice configuration
+        service: Text-to-speech service dependency
+
+    Returns:
+        StreamingResponse: WAV audio stream
+
+    Raises:
+        HTTPException: If speech generation fails before any audio is produced
+    """
+    logger.debug(
+        "Processing streaming text-to-speech request with {} characters",
+        len(request.text),
+    )
+
+    chunks = service.stream_speech(
+        text=request.text,
+        is_multi_speaker=request.is_multi_speaker,
+        voice_name=request.voice_name,
+        speakers=request.speakers,
+        speed=request.speed,
+        pitch=request.pitch,
+    )
+
+    # Wait for the first chunk so that upfront failures still map to an error status
+    try:
+        first_chunk = await anext(chunks)
+    except Exception as e:
+        logger.exception("Speech streaming failed: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Speech generation failed: {str(e)}",
+        )
+
+    async def body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(body(), media_type="audio/wav")
+
+
 @router.get("/download/{file_id}")
-async def download_audio(file_id: str):
+def download_audio(
+    file_id: str,
+    sig: str = Query(..., description="Signature from the download_url"),
+    exp: int = Query(..., description="Expiry timestamp from the download_url"),
+):
     """
     Download generated audio file.
 
+    Only signed links handed out by the generate endpoint are served, until
+    they expire.
+
     Args:
         file_id: Unique file identifier
+        sig: Link signature
+        exp: Link expiry as a Unix timestamp
 
     Returns:
-        FileResponse: Audio file
+        Response: Audio file, or a redirect to it for the reverse proxy
 
     Raises:
-        HTTPException: If file not found
+        HTTPException: If the link is invalid or expired, or file not found
     """
+    if not verify_download_signature(file_id, sig, exp):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired download link",
+        )
+
     try:
         filename = f"{file_id}.wav"
         file_path = os.path.join(settings.AUDIO_OUTPUT_DIR, filename)
 
-        if not os.path.exists(file_path):
-            logger.warning("Audio file not found: %s", file_path)
+        try:
+            # One stat both checks existence and feeds the response headers
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            logger.warning("Audio file not found: {}", file_path)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Audio file not found",
             )
 
-        return FileResponse(
-            path=file_path,
-            media_type="audio/wav",
+        return file_download_response(
+            file_path,
+            f"audio/{filename}",
+            "audio/wav",
             filename=filename,
+            stat_result=stat_result,
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("Audio download failed: %s", e)
+        logger.exception("Audio download failed: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Audio download failed: {str(e)}",
@@ -138,79 +284,35 @@ async def download_audio(file_id: str):
 
 
 @router.get("/speakers")
-async def get_available_speakers():
+async def get_available_speakers(request: Request) -> Response:
     """
     Get list of available speakers.
 
+    Args:
+        request: Incoming request, used for ETag revalidation
+
     Returns:
-        Dict containing list of available speakers
+        Response: JSON containing list of available speakers
     """
-    try:
-        # For now, return a mock list of speakers
-        # In a real implementation, this would come from the TTS service
-        speakers = [
-            {"id": "joe", "name": "Joe", "language": "en-US", "gender": "male"},
-            {"id": "jane", "name": "Jane", "language": "en-US", "gender": "female"},
-            {"id": "alex", "name": "Alex", "language": "en-US", "gender": "neutral"},
-        ]
-
-        return {"speakers": speakers}
-
-    except Exception as e:
-        logger.error("Failed to get speakers: %s", e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get speakers: {str(e)}",
-        )
+    return _SPEAKERS.response(request)
 
 
 @router.get("/speakers/{speaker_id}")
-async def get_speaker_details(speaker_id: str):
+async def get_speaker_details(speaker_id: str, request: Request) -> Response:
     """
     Get details for a specific speaker.
 
     Args:
         speaker_id: ID of the speaker
+        request: Incoming request, used for ETag revalidation
 
     Returns:
-        Dict containing speaker details
+        Response: JSON containing speaker details
     """
-    try:
-        # Mock speaker details - in real implementation would come from TTS service
-        speaker_details = {
-            "joe": {
-                "speaker": "joe",
-                "voice_name": "Joe",
-                "language_code": "en-US",
-                "gender": "male",
-            },
-            "jane": {
-                "speaker": "jane",
-                "voice_name": "Jane",
-                "language_code": "en-US",
-                "gender": "female",
-            },
-            "alex": {
-                "speaker": "alex",
-                "voice_name": "Alex",
-                "language_code": "en-US",
-                "gender": "neutral",
-            },
-        }
-
-        if speaker_id not in speaker_details:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Speaker not found",
-            )
-
-        return speaker_details[speaker_id]
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get speaker details: %s", e)
+    if speaker_id not in _SPEAKER_DETAILS:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get speaker details: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Speaker not found",
         )
+
+    return _SPEAKER_DETAILS[speaker_id].response(request)
@@ -14,17 +14,53 @@
 
 import os
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from google.api_core import exceptions
 from loguru import logger
 
 from src.app.schemas.text2video import Text2VideoRequest, Text2VideoResponse
-from src.app.services.text2video_service import Text2VideoService
+from src.app.services.text2video_service import (
+    Text2VideoService,
+    VideoGenerationTimeoutError,
+)
 from src.app.utils.dependencies import get_text2video_service
+from src.app.utils.downloads import file_download_response
+from src.app.utils.static_json import StaticJSON
 
 router = APIRouter()
 
+_STYLES = StaticJSON(
+    {
+        "styles": [
+            {
+                "id": "professional",
+                "name": "Professional",
+                "description": "Clean, business-oriented style",
+            },
+            {
+                "id": "casual",
+                "name": "Casual",
+                "description": "Relaxed, informal style",
+            },
+            {
+                "id": "animated",
+                "name": "Animated",
+                "description": "Cartoon and animated style",
+            },
+            {
+                "id": "cinematic",
+                "name": "Cinematic",
+                "description": "Movie-like cinematic style",
+            },
+            {
+                "id": "educational",
+                "name": "Educational",
+                "description": "Learning and tutorial style",
+            },
+        ]
+    }
+)
+
 
 @router.post("/generate", response_model=Text2VideoResponse)
 async def generate_video(
@@ -33,31 +69,38 @@ async def generate_video(
 ):
     """Generate video from text prompt."""
     try:
-        logger.info("Generating video for prompt: %s", request.prompt)
+        logger.info("Generating video for prompt: {}", request.prompt)
         file_path = await service.generate_video(
             prompt=request.prompt,
             aspect_ratio=request.aspect_ratio,
             person_generation=request.person_generation,
         )
-        logger.info("Successfully generated video: %s", file_path)
+        logger.info("Successfully generated video: {}", file_path)
         return Text2VideoResponse(file_path=file_path, status="success")
 
+    except VideoGenerationTimeoutError as e:
+        logger.error("Video generation timed out: {}", e)
+        raise HTTPException(
+            status_code=504,
+            detail="Video generation timed out. Please try again later.",
+        )
+
     except exceptions.ResourceExhausted as e:
-        logger.warning("Rate limit exceeded for video generation: %s", e)
+        logger.warning("Rate limit exceeded for video generation: {}", e)
         raise HTTPException(
             status_code=429,
             detail="Rate limit exceeded. You have sent too many requests. Please try again later.",
         )
 
     except exceptions.GoogleAPICallError as e:
-        logger.error("Video generation service API error: %s", e)
+        logger.error("Video generation service API error: {}", e)
         raise HTTPException(
             status_code=502,
             detail=f"The video generation service returned an error. Please try again.",
         )
 
     except Exception as e:
-        logger.error("Unexpected error during video generation: %s", e)
+        logger.exception("Unexpected error during video generation: {}", e)
         error_str = str(e)
         if "RESOURCE_EXHAUSTED" in error_str or "429" in error_str:
             raise HTTPException(
@@ -71,22 +114,37 @@ async def generate_video(
 
 
 @router.get("/download/{filename}")
-async def download_video(
+def download_video(
     filename: str,
     service: Text2VideoService = Depends(get_text2video_service),
 ):
-    """Download generated video file."""
+    """
+    Download generated video file.
+
+    Range requests are answered with 206 partial content by FileResponse (or
+    by nginx when DOWNLOAD_ACCEL_PREFIX is set), so browsers can seek without
+    re-downloading the whole video.
+    """
     try:
         file_path = os.path.join(service.output_dir, filename)
-        if not os.path.exists(file_path):
-            logger.warning("Video file not found: %s", file_path)
+        try:
+            # One stat both checks existence and feeds the response headers
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
+            logger.warning("Video file not found: {}", file_path)
             raise HTTPException(status_code=404, detail="File not found")
 
-        return FileResponse(file_path)
+        return file_download_response(
+            file_path,
+            f"video/{filename}",
+            "video/mp4",
+            filename=filename,
+            stat_result=stat_result,
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("Video download failed: %s", e)
+        logger.exception("Video download failed: {}", e)
         raise HTTPException(
             status_code=500,
             detail=f"Video download failed: {str(e)}",
@@ -94,47 +152,14 @@ async def download_video(
 
 
 @router.get("/styles")
-async def get_video_styles():
+async def get_video_styles(request: Request) -> Response:
     """
     Get list of available video styles.
 
+    Args:
+        request: Incoming request, used for ETag revalidation
+
     Returns:
-        Dict containing list of available styles
+        Response: JSON containing list of available styles
     """
-    try:
-        styles = [
-            {
-                "id": "professional",
-                "name": "Professional",
-                "description": "Clean, business-oriented style",
-            },
-            {
-                "id": "casual",
-                "name": "Casual",
-                "description": "Relaxed, informal style",
-            },
-            {
-                "id": "animated",
-                "name": "Animated",
-                "description": "Cartoon and animated style",
-            },
-            {
-                "id": "cinematic",
-                "name": "Cinematic",
-                "description": "Movie-like cinematic style",
-            },
-            {
-                "id": "educational",
-                "name": "Educational",
-                "description": "Learning and tutorial style",
-            },
-        ]
-
-        return {"styles": styles}
-
-    except Exception as e:
-        logger.error("Failed to get video styles: %s", e)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get video styles: {str(e)}",
-        )
+    return _STYLES.response(request)
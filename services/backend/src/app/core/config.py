@@ -41,6 +41,13 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     AUTH_SECRET: str
 
+    # Login sessions
+    REDIS_URL: str = ""  # Shared sessions and caches; in-process when empty
+    SESSION_TTL_SECONDS: int = 24 * 60 * 60
+    SESSION_MAX_ENTRIES: int = 10_000  # Cap for the in-process store
+    KEY_CHECK_TTL_SECONDS: int = 15 * 60  # Cached valid Gemini API keys
+    KEY_CHECK_NEGATIVE_TTL_SECONDS: int = 30  # Cached rejected keys
+
     # Gemini API
     GEMINI_API_KEY: str = ""  # Optional - users provide at login
     GEMINI_MODEL_DOCUMENT: str = "gemini-2.0-flash"
@@ -53,9 +60,20 @@ class Settings(BaseSettings):
     GEMINI_MODEL_LIVE_THINKING: str = (
         "gemini-2.5-flash-exp-native-audio-thinking-dialog"
     )
+    GEMINI_MAX_CONCURRENCY: int = 8  # Max in-flight Gemini calls per batch
+    GEMINI_BATCH_POLL_MAX_DELAY: float = 60.0  # seconds
+    GEMINI_BATCH_TIMEOUT: float = 24 * 60 * 60  # seconds
+    GEMINI_RESPONSE_CACHE_SIZE: int = 256  # Cached non-audio responses, 0 disables
+    DOCUMENT_EDIT_CACHE_TTL: int = 60 * 60  # Edits shared via Redis, 0 disables
+    TTS_CACHE_TTL: int = 24 * 60 * 60  # Reuse of identical speech, 0 disables
+    TTS_CACHE_SIZE: int = 1024  # In-process entries when Redis is not set
+    GEMINI_RPM: int = 0  # Requests per minute, 0 disables
+    GEMINI_TPM: int = 0  # Estimated input tokens per minute, 0 disables
+    GEMINI_MAX_ATTEMPTS: int = 3  # Tries per call on 429 and 5xx responses
 
     # API Configuration
     API_V1_STR: str = "/v1/api"
+    ENABLE_GEMINI_LIVE: bool = True  # Mount the Live API WebSocket routes
     ALLOWED_HOSTS: list = [
         "http://localhost:3000",
         "http://127.0.0.1:3000", 
@@ -74,10 +92,18 @@ class Settings(BaseSettings):
     IMAGE_OUTPUT_DIR: str
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    # Internal nginx location serving the output dirs, e.g. "/_protected"
+    DOWNLOAD_ACCEL_PREFIX: str = ""
+    DOWNLOAD_URL_TTL_SECONDS: int = 60 * 60  # Lifetime of signed audio links
+    DOWNLOAD_THREADS: int = 100  # Worker threads for sync handlers and file reads
 
     # Video Configuration
     VIDEO_ASPECT_RATIO: str = "16:9"
     VIDEO_PERSON_GENERATION: str = "allow_adult"
+    VIDEO_POLL_INITIAL_DELAY: float = 2.0  # seconds
+    VIDEO_POLL_MAX_DELAY: float = 30.0  # seconds
+    VIDEO_POLL_TIMEOUT: float = 600.0  # seconds
+    VIDEO_CACHE_MAX_BYTES: int = 5 * 1024**3  # Video dir size cap, 0 disables
 
     # Default Speakers Configuration
     DEFAULT_SPEAKERS: List[SpeakerDefaults] = [
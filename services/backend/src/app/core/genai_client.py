@@ -0,0 +1,67 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared Gemini client."""
+
+from functools import lru_cache
+from typing import Optional
+
+from google import genai
+
+from src.app.core.config import settings
+
+
+@lru_cache()
+def get_client(api_version: Optional[str] = None) -> genai.Client:
+    """
+    Get the process-wide Gemini client.
+
+    Services share one client per API version so that they reuse a single
+    HTTP connection pool instead of each opening their own.
+
+    Args:
+        api_version: API version to target, or None for the SDK default
+
+    Returns:
+        genai.Client: Shared Gemini client
+    """
+    http_options = {"api_version": api_version} if api_version else None
+    return genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
+
+
+@lru_cache(maxsize=256)
+def get_user_client(api_key: str) -> genai.Client:
+    """
+    Get a client for a user-supplied API key.
+
+    Clients are kept for the most recently used keys, so repeat logins
+    reuse the existing connection pool instead of a fresh TLS handshake.
+
+    Args:
+        api_key: The user's Gemini API key
+
+    Returns:
+        genai.Client: Client authenticated with the key
+    """
+    return genai.Client(api_key=api_key)
+
+
+async def warm_client() -> None:
+    """
+    Prime the shared client's connection pool with a cheap metadata call.
+
+    Fetching a model's metadata opens the TLS connection and validates the
+    API key without spending tokens, so the first real request skips both.
+    """
+    await get_client().aio.models.get(model=settings.GEMINI_MODEL_DOCUMENT)
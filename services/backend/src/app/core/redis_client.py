@@ -0,0 +1,47 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared Redis client."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.app.core.config import settings
+
+
+@lru_cache()
+def get_redis() -> Optional[Any]:
+    """
+    Get the process-wide async Redis client.
+
+    Returns:
+        redis.asyncio.Redis: Shared client decoding responses to str, or None
+        when REDIS_URL is not set
+
+    Raises:
+        RuntimeError: If REDIS_URL is set but the redis package is not installed
+    """
+    if not settings.REDIS_URL:
+        return None
+
+    try:
+        from redis import asyncio as redis_asyncio
+    except ImportError as e:
+        raise RuntimeError(
+            "REDIS_URL is set but the redis package is not installed. "
+            "Install it with the redis extra: pip install -e '.[redis]'"
+        ) from e
+
+    return redis_asyncio.from_url(settings.REDIS_URL, decode_responses=True)
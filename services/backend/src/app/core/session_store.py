@@ -0,0 +1,223 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Login session storage."""
+
+import hashlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from cachetools import TTLCache
+
+from src.app.core.config import settings
+from src.app.core.redis_client import get_redis
+
+
+class SessionStore(ABC):
+    """
+    Interface for storing login sessions.
+
+    Sessions are flat string-to-string mappings that expire after a fixed
+    time to live. Implementations must be safe to call from the event loop.
+    """
+
+    @abstractmethod
+    async def set(self, session_id: str, data: Dict[str, str]) -> None:
+        """
+        Create or replace a session.
+
+        Args:
+            session_id: Session identifier
+            data: Session fields
+        """
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Dict[str, str]]:
+        """
+        Fetch a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            The session fields, or None if the session does not exist
+        """
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> None:
+        """
+        Remove a session if it exists.
+
+        Args:
+            session_id: Session identifier
+        """
+
+    @abstractmethod
+    async def get_key_check(self, api_key: str) -> Optional[bool]:
+        """
+        Look up a cached API key validation result.
+
+        Args:
+            api_key: The API key that was validated
+
+        Returns:
+            True or False for a cached result, None if the key is not cached
+        """
+
+    @abstractmethod
+    async def set_key_check(self, api_key: str, valid: bool) -> None:
+        """
+        Cache an API key validation result.
+
+        Valid keys are remembered for KEY_CHECK_TTL_SECONDS and invalid ones
+        for the much shorter KEY_CHECK_NEGATIVE_TTL_SECONDS. Only a SHA-256
+        digest of the key is stored.
+
+        Args:
+            api_key: The API key that was validated
+            valid: Whether the key was accepted
+        """
+
+
+def _key_digest(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Session store kept in this process.
+
+    Entries expire after the TTL and the oldest are evicted once maxsize is
+    reached, so memory stays bounded. Sessions are not shared between
+    worker processes; use RedisSessionStore for that.
+    """
+
+    def __init__(
+        self, ttl: float, maxsize: int, timer: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            ttl: Seconds a session lives after it is set
+            maxsize: Maximum number of sessions kept
+            timer: Clock used for expiry, mainly for tests
+        """
+        kwargs = {"timer": timer} if timer else {}
+        self._sessions: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl, **kwargs)
+        self._valid_keys: TTLCache = TTLCache(
+            maxsize=maxsize, ttl=settings.KEY_CHECK_TTL_SECONDS, **kwargs
+        )
+        self._invalid_keys: TTLCache = TTLCache(
+            maxsize=maxsize, ttl=settings.KEY_CHECK_NEGATIVE_TTL_SECONDS, **kwargs
+        )
+
+    async def set(self, session_id: str, data: Dict[str, str]) -> None:
+        self._sessions[session_id] = dict(data)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, str]]:
+        data = self._sessions.get(session_id)
+        return dict(data) if data is not None else None
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    async def get_key_check(self, api_key: str) -> Optional[bool]:
+        digest = _key_digest(api_key)
+        if digest in self._valid_keys:
+            return True
+        if digest in self._invalid_keys:
+            return False
+        return None
+
+    async def set_key_check(self, api_key: str, valid: bool) -> None:
+        digest = _key_digest(api_key)
+        if valid:
+            self._invalid_keys.pop(digest, None)
+            self._valid_keys[digest] = True
+        else:
+            self._invalid_keys[digest] = True
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Session store backed by Redis hashes.
+
+    Each session is a hash under ``sess:{session_id}`` with a Redis TTL, so
+    every worker process sees the same sessions and they survive restarts.
+    """
+
+    def __init__(self, redis: Any, ttl: int):
+        """
+        Initialize the store.
+
+        Args:
+            redis: Async Redis client decoding responses to str
+            ttl: Seconds a session lives after it is set
+        """
+        self._redis = redis
+        self._ttl = ttl
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"sess:{session_id}"
+
+    async def set(self, session_id: str, data: Dict[str, str]) -> None:
+        key = self._key(session_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=data)
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+
+    async def get(self, session_id: str) -> Optional[Dict[str, str]]:
+        # HGETALL returns an empty mapping for missing keys
+        data = await self._redis.hgetall(self._key(session_id))
+        return data or None
+
+    async def delete(self, session_id: str) -> None:
+        await self._redis.delete(self._key(session_id))
+
+    async def get_key_check(self, api_key: str) -> Optional[bool]:
+        value = await self._redis.get(f"keycheck:{_key_digest(api_key)}")
+        return None if value is None else value == "1"
+
+    async def set_key_check(self, api_key: str, valid: bool) -> None:
+        # Expiry is left to Redis, which also bounds the cache size
+        ttl = (
+            settings.KEY_CHECK_TTL_SECONDS
+            if valid
+            else settings.KEY_CHECK_NEGATIVE_TTL_SECONDS
+        )
+        await self._redis.set(
+            f"keycheck:{_key_digest(api_key)}", "1" if valid else "0", ex=ttl
+        )
+
+
+@lru_cache()
+def get_session_store() -> SessionStore:
+    """
+    Get the process-wide session store.
+
+    Returns:
+        SessionStore: Redis-backed when REDIS_URL is set, in-memory otherwise
+    """
+    redis = get_redis()
+    if redis is not None:
+        return RedisSessionStore(redis, settings.SESSION_TTL_SECONDS)
+    return MemorySessionStore(
+        ttl=settings.SESSION_TTL_SECONDS, maxsize=settings.SESSION_MAX_ENTRIES
+    )
@@ -14,49 +14,51 @@
 
 """Main FastAPI application entry point."""
 
+import asyncio
 import logging
 import re
 from contextlib import asynccontextmanager
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.app.api.v1.endpoints import api_router
 from src.app.core.config import settings
+from src.app.core.genai_client import warm_client
 from src.app.core.logging import setup_logging
+from src.app.utils.dependencies import init_services
+
+
+@lru_cache(maxsize=8)
+def _origin_pattern(allowed_hosts: Tuple[str, ...]) -> re.Pattern:
+    """Compile allowed host patterns into one anchored alternation."""
+    alternatives = "|".join(
+        re.escape(host).replace(r"\*", ".*") for host in allowed_hosts
+    )
+    return re.compile(f"^(?:{alternatives})$")
 
 
 def is_allowed_origin(origin: str, allowed_hosts: List[str]) -> bool:
     """
     Check if an origin is allowed based on patterns including wildcards.
-    
+
+    The patterns are compiled into a single regex once per host list, so a
+    check is one match call.
+
     Args:
         origin: The origin to check
         allowed_hosts: List of allowed host patterns
-        
+
     Returns:
         True if origin is allowed, False otherwise
     """
     if not origin:
         return False
-        
-    # Check for exact matches first
-    if origin in allowed_hosts:
-        return True
-        
-    # Check for wildcard patterns
-    for host in allowed_hosts:
-        if host == "*":
-            return True
-        # Convert wildcard pattern to regex
-        if "*" in host:
-            # Escape special regex characters except *
-            pattern = re.escape(host).replace(r"\*", ".*")
-            if re.match(f"^{pattern}$", origin):
-                return True
-                
-    return False
+    return _origin_pattern(tuple(allowed_hosts)).match(origin) is not None
 
 
 @asynccontextmanager
@@ -64,6 +66,20 @@ async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events."""
     setup_logging()
     logging.info("Starting Document Service API...")
+    # Download handlers are sync and FileResponse reads in threads, so size
+    # the shared pool for many concurrent downloads rather than anyio's 40
+    to_thread.current_default_thread_limiter().total_tokens = settings.DOWNLOAD_THREADS
+    try:
+        init_services()
+    except Exception as e:
+        # No server-side API key; services are created on first request instead
+        logging.warning(f"Deferred service initialization: {e}")
+    else:
+        try:
+            await asyncio.wait_for(warm_client(), timeout=10)
+        except Exception as e:
+            # Warmup is best effort; the first request opens the connection
+            logging.warning(f"Gemini client warmup failed: {e}")
     yield
     logging.info("Shutting down Document Service API...")
 
@@ -75,6 +91,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Set up CORS with custom origin checking for mobile compatibility
@@ -82,8 +99,16 @@ app.add_middleware(
     CORSMiddleware,
     allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$|^https://.*\.ngrok-free\.app$|^https://.*\.ngrok\.io$",
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Listing the methods and headers the frontend actually uses lets Starlette
+    # build one fixed preflight response, which browsers may cache for a day
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "X-Session-ID",
+        "ngrok-skip-browser-warning",  # Sent by the frontend behind ngrok
+    ],
+    max_age=86400,
 )
 
 # Include API router
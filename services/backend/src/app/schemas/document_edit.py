@@ -14,7 +14,7 @@
 
 """Document edit API schemas."""
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -102,3 +102,31 @@ class DocumentEditResponse(BaseModel):
         ...,
         description="Processing status",
     )
+
+
+class DocumentEditBatchRequest(BaseModel):
+    """Batch document edit request schema."""
+
+    requests: List[DocumentEditRequest] = Field(
+        ...,
+        description="Document edits to run as one batch job",
+        min_length=1,
+        max_length=100,
+    )
+
+
+class DocumentEditBatchResponse(BaseModel):
+    """Batch document edit status schema."""
+
+    job_id: str = Field(
+        ...,
+        description="Batch job identifier",
+    )
+    state: str = Field(
+        ...,
+        description="Batch job state, e.g. JOB_STATE_RUNNING",
+    )
+    edited_contents: Optional[List[str]] = Field(
+        default=None,
+        description="Edited documents in request order, once the job has succeeded",
+    )
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
@@ -20,7 +20,8 @@ class Text2ImageRequest(BaseModel):
     """Schema for text-to-image generation request."""
 
     prompt: str
-    num_images: Optional[int] = 4
+    # Up to four API requests of four images each
+    num_images: Optional[int] = Field(default=4, ge=1, le=16)
 
 
 class Text2ImageResponse(BaseModel):
@@ -93,9 +93,9 @@ class Text2SpeechResponse(BaseModel):
         ...,
         description="Generated audio filename",
     )
-    file_path: str = Field(
+    download_url: str = Field(
         ...,
-        description="Path to the generated audio file",
+        description="Signed, expiring path to download the audio file",
     )
     duration_seconds: float = Field(
         ...,
@@ -105,6 +105,10 @@ class Text2SpeechResponse(BaseModel):
         ...,
         description="File size in bytes",
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether an identical earlier request's audio was reused",
+    )
     status: str = Field(
         ...,
         description="Processing status",
@@ -14,22 +14,33 @@
 
 """Document editing service."""
 
+import hashlib
 import textwrap
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from loguru import logger
 
 from src.app.core.config import settings
+from src.app.core.redis_client import get_redis
 from src.app.models.document_edit import DocumentType
+from src.app.schemas.document_edit import DocumentEditRequest
 from src.app.services.gemini_service import GeminiService
 
+# Gemini batch job names look like "batches/<id>"; only the id is exposed
+_BATCH_NAME_PREFIX = "batches/"
+
 
 class DocumentEditService:
     """Service for document editing using Gemini AI."""
 
-    def __init__(self):
-        """Initialize document edit service."""
-        self.gemini_service = GeminiService()
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
+        """
+        Initialize document edit service.
+
+        Args:
+            gemini_service: Shared Gemini service, created if not provided
+        """
+        self.gemini_service = gemini_service or GeminiService()
 
     def _build_edit_prompt(
         self,
@@ -97,17 +108,141 @@ class DocumentEditService:
                 additional_context=additional_context,
             )
 
+            cache_key = self._edit_cache_key(prompt)
+            cached = await self._get_cached_edit(cache_key)
+            if cached is not None:
+                logger.info("Returning cached document edit")
+                return cached
+
             response = await self.gemini_service.generate_content(
                 content=prompt,
                 model=settings.GEMINI_MODEL_DOCUMENT,
                 response_modalities=["TEXT"],
             )
 
-            edited_content = response.candidates[0].content.parts[0].text
+            edited_content = self._extract_text(response)
+            await self._set_cached_edit(cache_key, edited_content)
 
             logger.info("Document editing completed")
-            return edited_content.strip()
+            return edited_content
 
         except Exception as e:
             logger.error(f"Document editing failed: {str(e)}")
             raise Exception(f"Document editing failed: {str(e)}")
+
+    @staticmethod
+    def _edit_cache_key(prompt: str) -> str:
+        """
+        Build the shared cache key for an edit.
+
+        The prompt already embeds the content, instructions, document type
+        and context. BLAKE2b keeps hashing cheap for large documents.
+
+        Args:
+            prompt: Editing prompt
+
+        Returns:
+            str: Redis key for the edit
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(settings.GEMINI_MODEL_DOCUMENT.encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return f"docedit:{digest.hexdigest()}"
+
+    async def _get_cached_edit(self, cache_key: str) -> Optional[str]:
+        """
+        Look up an edit in the Redis cache shared by all workers.
+
+        Identical edits within one process are already served by the
+        GeminiService response cache; this covers the other workers.
+
+        Args:
+            cache_key: Key from _edit_cache_key
+
+        Returns:
+            Optional[str]: The cached edited content, or None on a miss
+        """
+        redis = get_redis()
+        if redis is None or settings.DOCUMENT_EDIT_CACHE_TTL <= 0:
+            return None
+        try:
+            return await redis.get(cache_key)
+        except Exception as e:
+            # The cache is an optimization, never a reason to fail an edit
+            logger.warning(f"Document edit cache lookup failed: {e}")
+            return None
+
+    async def _set_cached_edit(self, cache_key: str, edited_content: str) -> None:
+        """
+        Store an edit in the Redis cache shared by all workers.
+
+        Args:
+            cache_key: Key from _edit_cache_key
+            edited_content: Edited document content
+        """
+        redis = get_redis()
+        if redis is None or settings.DOCUMENT_EDIT_CACHE_TTL <= 0:
+            return
+        try:
+            await redis.set(
+                cache_key, edited_content, ex=settings.DOCUMENT_EDIT_CACHE_TTL
+            )
+        except Exception as e:
+            logger.warning(f"Document edit cache update failed: {e}")
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        """Return the edited document text from a Gemini response."""
+        return response.candidates[0].content.parts[0].text.strip()
+
+    async def submit_edit_batch(
+        self, requests: List[DocumentEditRequest]
+    ) -> Tuple[str, str]:
+        """
+        Submit several edits as one Gemini batch job.
+
+        Batch jobs are billed at half the interactive rate and may take up to
+        a day, so this suits bulk edits that nobody is waiting on.
+
+        Args:
+            requests: Document edit requests
+
+        Returns:
+            Tuple of the batch job identifier to pass to get_edit_batch and
+            the job's initial state name
+        """
+        prompts = [
+            self._build_edit_prompt(
+                content=request.content,
+                instructions=request.instructions,
+                document_type=request.document_type,
+                additional_context=request.additional_context,
+            )
+            for request in requests
+        ]
+        job_name, state = await self.gemini_service.submit_content_batch(
+            contents=prompts,
+            model=settings.GEMINI_MODEL_DOCUMENT,
+            response_modalities=["TEXT"],
+        )
+        logger.info(f"Submitted {len(prompts)} document edits as {job_name}")
+        return job_name.removeprefix(_BATCH_NAME_PREFIX), state.value
+
+    async def get_edit_batch(self, job_id: str) -> Tuple[str, Optional[List[str]]]:
+        """
+        Check on a batch of edits submitted with submit_edit_batch.
+
+        Args:
+            job_id: Batch job identifier
+
+        Returns:
+            Tuple of the job state name and, once the job has succeeded, the
+            edited documents in request order (None until then)
+        """
+        state, responses = await self.gemini_service.get_content_batch(
+            _BATCH_NAME_PREFIX + job_id
+        )
+        if responses is None:
+            return state.value, None
+        return state.value, [self._extract_text(response) for response in responses]
@@ -21,16 +21,19 @@ import uuid
 import wave
 from typing import Any, AsyncGenerator, Dict, Optional
 
-from google import genai
 from google.genai import types
 from loguru import logger
 
 from src.app.core.config import settings
+from src.app.core.genai_client import get_client
 from src.app.schemas.gemini_live import (
     LiveSessionConfig,
     ResponseModality,
 )
 
+# Audio is streamed to the Live API in slices of this duration
+_AUDIO_SEND_CHUNK_MS = 200
+
 
 class GeminiLiveError(Exception):
     """Custom exception for Gemini Live API failures."""
@@ -46,9 +49,7 @@ class GeminiLiveService:
 
     def __init__(self):
         """Initialize the Gemini Live service."""
-        self.client = genai.Client(
-            api_key=settings.GEMINI_API_KEY, http_options={"api_version": "v1beta"}
-        )
+        self.client = get_client(api_version="v1beta")
         self.audio_output_dir = settings.AUDIO_OUTPUT_DIR
         os.makedirs(self.audio_output_dir, exist_ok=True)
 
@@ -291,11 +292,19 @@ class GeminiLiveService:
             async with self.client.aio.live.connect(
                 model=model, config=config
             ) as session:
-                await session.send_realtime_input(
-                    audio=types.Blob(
-                        data=audio_data, mime_type=f"audio/pcm;rate={sample_rate}"
+                # Send 200 ms slices rather than one large message so the model
+                # can start processing while the rest of the audio is in flight
+                mime_type = f"audio/pcm;rate={sample_rate}"
+                chunk_bytes = sample_rate * 2 * _AUDIO_SEND_CHUNK_MS // 1000
+                audio_view = memoryview(audio_data)
+                for offset in range(0, len(audio_view), chunk_bytes):
+                    await session.send_realtime_input(
+                        audio=types.Blob(
+                            data=audio_view[offset : offset + chunk_bytes].tobytes(),
+                            mime_type=mime_type,
+                        )
                     )
-                )
+                    await asyncio.sleep(0)
 
                 response_data = {
                     "response_id": str(uuid.uuid4()),
@@ -14,14 +14,51 @@
 
 """Gemini AI service."""
 
+import asyncio
+import hashlib
 import os
-from typing import Optional
+import time
+from typing import AsyncIterator, List, Optional, Tuple
 
+from cachetools import LRUCache
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.app.core.config import settings
+from src.app.core.genai_client import get_client
+from src.app.utils.concurrency import AsyncRateLimiter, SingleFlight
+from src.app.utils.exceptions import GeminiAPIException
+
+# Batch job states after which polling stops
+_BATCH_TERMINAL_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+}
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Return whether a Gemini error is worth retrying (rate limit or server)."""
+    return isinstance(exc, errors.APIError) and (exc.code == 429 or exc.code >= 500)
+
+
+def _retrying() -> AsyncRetrying:
+    """Retry policy for Gemini calls: backoff on 429 and 5xx responses."""
+    return AsyncRetrying(
+        retry=retry_if_exception(is_retryable_error),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(settings.GEMINI_MAX_ATTEMPTS),
+        reraise=True,
+    )
 
 
 class GeminiService:
@@ -29,7 +66,93 @@ class GeminiService:
 
     def __init__(self):
         """Initialize Gemini service."""
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.client = get_client()
+        self._request_limiter = AsyncRateLimiter(settings.GEMINI_RPM)
+        self._token_limiter = AsyncRateLimiter(settings.GEMINI_TPM)
+        self._inflight = SingleFlight()
+        self._response_cache: Optional[LRUCache] = (
+            LRUCache(maxsize=settings.GEMINI_RESPONSE_CACHE_SIZE)
+            if settings.GEMINI_RESPONSE_CACHE_SIZE > 0
+            else None
+        )
+
+    def _cache_key(
+        self,
+        content: str,
+        model: str,
+        config: types.GenerateContentConfig,
+    ) -> bytes:
+        """
+        Build the exact-match key identifying a request.
+
+        Args:
+            content: Input content/prompt
+            model: Model name to use
+            config: Generation configuration
+
+        Returns:
+            bytes: SHA-256 digest identifying the request
+        """
+        digest = hashlib.sha256()
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(content.encode())
+        digest.update(b"\0")
+        digest.update(config.model_dump_json(exclude_none=True).encode())
+        return digest.digest()
+
+    def _build_config(
+        self,
+        response_modalities: Optional[list] = None,
+        speech_config: Optional[types.SpeechConfig] = None,
+    ) -> types.GenerateContentConfig:
+        """
+        Build the generation config shared by single and batch requests.
+
+        Args:
+            response_modalities: Response modalities (e.g., ["TEXT"], ["AUDIO"])
+            speech_config: Speech configuration for TTS
+
+        Returns:
+            GenerateContentConfig: Generation configuration
+        """
+        config = types.GenerateContentConfig()
+
+        if response_modalities:
+            config.response_modalities = response_modalities
+
+        if speech_config:
+            config.speech_config = speech_config
+
+        return config
+
+    async def _generate_with_retry(
+        self,
+        content: str,
+        model: str,
+        config: types.GenerateContentConfig,
+    ) -> genai.types.GenerateContentResponse:
+        """
+        Call the Gemini API within the rate limits, retrying transient errors.
+
+        Args:
+            content: Input content/prompt
+            model: Model name to use
+            config: Generation configuration
+
+        Returns:
+            GenerateContentResponse: Gemini API response
+        """
+        async for attempt in _retrying():
+            with attempt:
+                await self._request_limiter.acquire()
+                # Rough estimate of ~4 characters per token
+                await self._token_limiter.acquire(len(content) // 4 + 1)
+                return await self.client.aio.models.generate_content(
+                    model=model,
+                    contents=content,
+                    config=config,
+                )
 
     async def generate_content(
         self,
@@ -51,37 +174,252 @@ class GeminiService:
             GenerateContentResponse: Gemini API response
         """
         try:
-            config = types.GenerateContentConfig()
-
-            if response_modalities:
-                config.response_modalities = response_modalities
+            config = self._build_config(response_modalities, speech_config)
 
-            if speech_config:
-                config.speech_config = speech_config
+            cache_key = self._cache_key(content, model, config)
+            # Audio responses carry megabytes of inline PCM and are reused at
+            # the file level by the text-to-speech cache instead
+            cacheable = self._response_cache is not None and "AUDIO" not in (
+                response_modalities or []
+            )
+            if cacheable:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Returning cached Gemini response")
+                    return cached
 
-            logger.debug(f"Generating content with model: {model}")
+            logger.debug("Generating content with model: {}", model)
 
-            response = await self.client.aio.models.generate_content(
-                model=model,
-                contents=content,
-                config=config,
+            # Identical requests already in flight share a single API call
+            response = await self._inflight.do(
+                cache_key,
+                lambda: self._generate_with_retry(content, model, config),
             )
 
             # Add response validation and logging
             if not response or not response.candidates:
                 raise Exception("Empty response from Gemini API")
 
-            logger.debug(f"Response structure: {response}")
-            logger.debug(
-                f"First candidate: {response.candidates[0] if response.candidates else 'No candidates'}"
+            # Lazy: rendering the response is expensive and debug is usually off
+            logger.opt(lazy=True).debug("Response structure: {}", lambda: response)
+            logger.opt(lazy=True).debug(
+                "First candidate: {}", lambda: response.candidates[0]
             )
 
             if not response.candidates[0].content:
                 raise Exception("No content in response")
 
+            if cacheable:
+                self._response_cache[cache_key] = response
+
             logger.debug("Content generation completed")
             return response
 
         except Exception as e:
-            logger.error("Gemini API error: %s", e)
+            logger.error("Gemini API error: {}", e)
             raise
+
+    async def generate_content_stream(
+        self,
+        content: str,
+        model: str,
+        response_modalities: Optional[list] = None,
+        speech_config: Optional[types.SpeechConfig] = None,
+    ) -> AsyncIterator[genai.types.GenerateContentResponse]:
+        """
+        Stream generated content from Gemini AI as it is produced.
+
+        Args:
+            content: Input content/prompt
+            model: Model name to use
+            response_modalities: Response modalities (e.g., ["TEXT"], ["AUDIO"])
+            speech_config: Speech configuration for TTS
+
+        Yields:
+            GenerateContentResponse: Partial Gemini API responses
+        """
+        config = self._build_config(response_modalities, speech_config)
+
+        logger.debug("Streaming content with model: {}", model)
+        async for attempt in _retrying():
+            with attempt:
+                await self._request_limiter.acquire()
+                await self._token_limiter.acquire(len(content) // 4 + 1)
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=model,
+                    contents=content,
+                    config=config,
+                )
+                # The request is sent on first iteration, so 429 and 5xx
+                # responses surface here, before anything has been yielded
+                first_chunk = await anext(stream, None)
+
+        if first_chunk is None:
+            return
+        yield first_chunk
+        async for chunk in stream:
+            yield chunk
+
+    async def _create_batch_job(
+        self,
+        contents: List[str],
+        model: str,
+        response_modalities: Optional[list] = None,
+        speech_config: Optional[types.SpeechConfig] = None,
+    ) -> types.BatchJob:
+        """
+        Create a Gemini batch job with one inlined request per prompt.
+
+        Args:
+            contents: Input prompts
+            model: Model name to use
+            response_modalities: Response modalities (e.g., ["TEXT"], ["AUDIO"])
+            speech_config: Speech configuration for TTS
+
+        Returns:
+            BatchJob: The created batch job
+        """
+        config = self._build_config(response_modalities, speech_config)
+        requests = [
+            types.InlinedRequest(
+                contents=content, config=config, metadata={"index": str(index)}
+            )
+            for index, content in enumerate(contents)
+        ]
+
+        logger.info("Submitting batch of {} requests to {}", len(requests), model)
+        return await self.client.aio.batches.create(model=model, src=requests)
+
+    async def submit_content_batch(
+        self,
+        contents: List[str],
+        model: str,
+        response_modalities: Optional[list] = None,
+        speech_config: Optional[types.SpeechConfig] = None,
+    ) -> Tuple[str, types.JobState]:
+        """
+        Submit prompts as a Gemini batch job without waiting for it.
+
+        Args:
+            contents: Input prompts
+            model: Model name to use
+            response_modalities: Response modalities (e.g., ["TEXT"], ["AUDIO"])
+            speech_config: Speech configuration for TTS
+
+        Returns:
+            Tuple of the created job's name, for get_content_batch, and its
+            state as reported by the API
+        """
+        job = await self._create_batch_job(
+            contents, model, response_modalities, speech_config
+        )
+        return job.name, job.state
+
+    async def get_content_batch(
+        self, job_name: str
+    ) -> Tuple[types.JobState, Optional[List[genai.types.GenerateContentResponse]]]:
+        """
+        Check on a batch job created by submit_content_batch.
+
+        Args:
+            job_name: Name of the batch job
+
+        Returns:
+            Tuple of the job state and, once the job has succeeded, one
+            response per prompt in input order (None until then)
+
+        Raises:
+            GeminiAPIException: If the job or any of its prompts failed
+        """
+        job = await self.client.aio.batches.get(name=job_name)
+        if job.state not in _BATCH_TERMINAL_STATES:
+            return job.state, None
+        return job.state, self._collect_batch_results(job)
+
+    def _collect_batch_results(
+        self, job: types.BatchJob, expected: Optional[int] = None
+    ) -> List[genai.types.GenerateContentResponse]:
+        """
+        Order the responses of a finished batch job by prompt index.
+
+        Args:
+            job: Batch job in a terminal state
+            expected: Number of prompts submitted, if known
+
+        Returns:
+            List[GenerateContentResponse]: One response per prompt, in input order
+
+        Raises:
+            GeminiAPIException: If the job or any of its prompts failed
+        """
+        if job.state not in (
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+        ):
+            raise GeminiAPIException(
+                f"Batch job finished with state {job.state}", {"job": job.name}
+            )
+
+        inlined_responses = job.dest.inlined_responses or []
+        count = len(inlined_responses) if expected is None else expected
+        results: List[Optional[genai.types.GenerateContentResponse]] = [None] * count
+        for position, inlined in enumerate(inlined_responses):
+            metadata = inlined.metadata or {}
+            index = int(metadata.get("index", position))
+            if inlined.error or not inlined.response:
+                raise GeminiAPIException(
+                    f"Batch request {index} failed",
+                    {"job": job.name, "error": str(inlined.error)},
+                )
+            results[index] = inlined.response
+
+        if any(result is None for result in results):
+            raise GeminiAPIException(
+                "Batch job returned fewer responses than requests", {"job": job.name}
+            )
+
+        logger.info("Batch job {} completed", job.name)
+        return results
+
+    async def generate_content_batch(
+        self,
+        contents: List[str],
+        model: str,
+        response_modalities: Optional[list] = None,
+        speech_config: Optional[types.SpeechConfig] = None,
+    ) -> List[genai.types.GenerateContentResponse]:
+        """
+        Generate content for many prompts through the Gemini Batch API.
+
+        The prompts are submitted as a single batch job, which is billed at the
+        batch rate and is not subject to per-request rate limits. The job is
+        polled with exponential backoff until it reaches a terminal state.
+
+        Args:
+            contents: Input prompts
+            model: Model name to use
+            response_modalities: Response modalities (e.g., ["TEXT"], ["AUDIO"])
+            speech_config: Speech configuration for TTS
+
+        Returns:
+            List[GenerateContentResponse]: One response per prompt, in input order
+
+        Raises:
+            GeminiAPIException: If the job fails, times out, or any prompt fails
+        """
+        job = await self._create_batch_job(
+            contents, model, response_modalities, speech_config
+        )
+
+        deadline = time.monotonic() + settings.GEMINI_BATCH_TIMEOUT
+        delay = 2.0
+        while job.state not in _BATCH_TERMINAL_STATES:
+            if time.monotonic() >= deadline:
+                raise GeminiAPIException(
+                    "Batch job did not complete in time", {"job": job.name}
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.GEMINI_BATCH_POLL_MAX_DELAY)
+            job = await self.client.aio.batches.get(name=job.name)
+
+        return self._collect_batch_results(job, expected=len(contents))
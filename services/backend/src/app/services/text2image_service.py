@@ -12,17 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import time
 import uuid
 from io import BytesIO
 
-from google import genai
 from google.genai import types
 from loguru import logger
 from PIL import Image
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.app.core.config import settings
+from src.app.core.genai_client import get_client
+from src.app.services.gemini_service import is_retryable_error
+
+# Most images the Imagen API returns for a single request
+_MAX_IMAGES_PER_REQUEST = 4
 
 
 class ImageGenerationError(Exception):
@@ -40,9 +51,11 @@ class Text2ImageService:
 
     def __init__(self):
         """Initializes the Text2ImageService, creating the output directory if needed."""
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.client = get_client()
         self.output_dir = settings.IMAGE_OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
+        # Shared by all requests, so a burst of chunks can't flood the API
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
 
     async def generate_images(self, prompt: str, num_images: int) -> list[str]:
         """
@@ -60,33 +73,99 @@ class Text2ImageService:
                                   unexpected error occurs during the process.
         """
         try:
-            logger.info("Requesting %d image(s) for prompt...", num_images)
-            response = await self.client.aio.models.generate_images(
-                model=settings.GEMINI_MODEL_IMAGE,
-                prompt=prompt,
-                config=types.GenerateImagesConfig(
-                    number_of_images=num_images,
-                ),
+            logger.info("Requesting {} image(s) for prompt...", num_images)
+            # Requests of up to four images run concurrently, at most
+            # GEMINI_MAX_CONCURRENCY at a time; a request that still fails
+            # after retries only costs its own images
+            counts = [
+                min(_MAX_IMAGES_PER_REQUEST, num_images - start)
+                for start in range(0, num_images, _MAX_IMAGES_PER_REQUEST)
+            ]
+            results = await asyncio.gather(
+                *(self._request_images(prompt, count) for count in counts),
+                return_exceptions=True,
             )
 
-            if not response.generated_images:
+            images = []
+            errors = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                else:
+                    images.extend(result)
+
+            if not images:
+                if errors:
+                    raise errors[0]
                 logger.error("Image generation failed: API returned no images.")
                 raise ImageGenerationError(
                     "Image generation failed: The API returned no images."
                 )
+            if errors:
+                logger.warning(
+                    "{} of {} image request(s) failed: {}",
+                    len(errors),
+                    len(counts),
+                    errors[0],
+                )
 
-            file_paths = []
-            for generated_image in response.generated_images:
-                image = Image.open(BytesIO(generated_image.image.image_bytes))
-                # Use UUID for unique filenames
-                file_name = f"image_{uuid.uuid4()}.png"
-                file_path = os.path.join(self.output_dir, file_name)
-                image.save(file_path)
-                file_paths.append(file_name)
+            # Decoding and encoding PNGs is CPU work, keep it off the event loop
+            file_paths = await asyncio.to_thread(self._save_images, images)
 
-            logger.info("Successfully generated %d image(s).", len(file_paths))
+            logger.info("Successfully generated {} image(s).", len(file_paths))
             return file_paths
 
+        except ImageGenerationError:
+            raise
         except Exception as e:
-            logger.error("An unexpected error occurred in Text2ImageService: %s", e)
+            logger.error("An unexpected error occurred in Text2ImageService: {}", e)
             raise ImageGenerationError(f"An unexpected error occurred: {e}") from e
+
+    async def _request_images(self, prompt: str, count: int) -> list[bytes]:
+        """
+        Request images from the API, retrying rate limits and server errors.
+
+        Args:
+            prompt: The text description to generate images from.
+            count: The number of images, at most _MAX_IMAGES_PER_REQUEST.
+
+        Returns:
+            The encoded bytes of each generated image.
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(is_retryable_error),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(settings.GEMINI_MAX_ATTEMPTS),
+            reraise=True,
+        ):
+            # The slot is released between attempts, so backoff doesn't hold it
+            with attempt:
+                async with self._semaphore:
+                    response = await self.client.aio.models.generate_images(
+                        model=settings.GEMINI_MODEL_IMAGE,
+                        prompt=prompt,
+                        config=types.GenerateImagesConfig(number_of_images=count),
+                    )
+        return [
+            generated_image.image.image_bytes
+            for generated_image in response.generated_images or []
+        ]
+
+    def _save_images(self, images: list[bytes]) -> list[str]:
+        """
+        Save generated images as PNG files in the output directory.
+
+        Args:
+            images: The encoded bytes of each image.
+
+        Returns:
+            The filenames of the saved images.
+        """
+        file_paths = []
+        for image_bytes in images:
+            image = Image.open(BytesIO(image_bytes))
+            # Use UUID for unique filenames
+            file_name = f"image_{uuid.uuid4()}.png"
+            image.save(os.path.join(self.output_dir, file_name))
+            file_paths.append(file_name)
+        return file_paths
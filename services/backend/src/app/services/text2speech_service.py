@@ -14,28 +14,144 @@
 
 """Text-to-speech service implementation."""
 
+import asyncio
+import contextlib
+import hashlib
 import os
-import wave
-from typing import List, Optional
+import struct
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
 
+import aiofiles
+from cachetools import TTLCache
 from google import genai
 from google.genai import types
 from loguru import logger
 
 from src.app.core.config import settings
+from src.app.core.redis_client import get_redis
 from src.app.models.text2speech import SpeechPitch, SpeechSpeed, VoiceName
 from src.app.schemas.text2speech import SpeakerConfig
 from src.app.services.gemini_service import GeminiService
 
+# Instruction prepended to multi-speaker scripts
+_TTS_PREFIX = "TTS the following conversation"
+
+# Data size advertised in streamed WAV headers, whose length isn't known upfront
+_STREAMING_DATA_SIZE = 0xFFFFFFFF - 36
+
+# Canonical 44-byte PCM WAV header layout, compiled once
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Streamed audio is coalesced into writes of about this size
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def _wav_header(data_size: int, channels: int, rate: int, sample_width: int) -> bytes:
+    """
+    Build a canonical 44-byte PCM WAV header.
+
+    Args:
+        data_size: Size of the PCM payload in bytes
+        channels: Number of audio channels
+        rate: Sample rate
+        sample_width: Sample width in bytes
+
+    Returns:
+        bytes: RIFF/WAVE header
+    """
+    block_align = channels * sample_width
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        rate,
+        rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+@lru_cache(maxsize=64)
+def _single_speaker_config(voice_name: str) -> types.SpeechConfig:
+    """
+    Build the speech configuration for a prebuilt voice.
+
+    Configs are cached per voice; callers must treat them as read-only.
+
+    Args:
+        voice_name: Prebuilt voice name
+
+    Returns:
+        SpeechConfig: Speech configuration
+    """
+    return types.SpeechConfig(
+        voice_config=types.VoiceConfig(
+            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                voice_name=voice_name,
+            )
+        )
+    )
+
+
+@lru_cache(maxsize=64)
+def _multi_speaker_config(speakers: Tuple[Tuple[str, str], ...]) -> types.SpeechConfig:
+    """
+    Build the multi-speaker speech configuration for a speaker lineup.
+
+    Configs are cached per lineup; callers must treat them as read-only.
+
+    Args:
+        speakers: (speaker, voice name) pairs
+
+    Returns:
+        SpeechConfig: Multi-speaker speech configuration
+    """
+    speaker_configs = [
+        types.SpeakerVoiceConfig(
+            speaker=speaker,
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice_name,
+                )
+            ),
+        )
+        for speaker, voice_name in speakers
+    ]
+
+    return types.SpeechConfig(
+        multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+            speaker_voice_configs=speaker_configs
+        )
+    )
+
 
 class Text2SpeechService:
     """Service for text-to-speech using Gemini AI."""
 
-    def __init__(self):
-        """Initialize text-to-speech service."""
-        self.gemini_service = GeminiService()
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
+        """
+        Initialize text-to-speech service.
+
+        Args:
+            gemini_service: Shared Gemini service, created if not provided
+        """
+        self.gemini_service = gemini_service or GeminiService()
         self.output_dir = settings.AUDIO_OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+        # Used when REDIS_URL is not set; maps cache keys to "file_id:data_size"
+        self._speech_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=settings.TTS_CACHE_SIZE, ttl=settings.TTS_CACHE_TTL)
+            if settings.TTS_CACHE_TTL > 0
+            else None
+        )
 
     def _create_speech_config(
         self,
@@ -54,13 +170,7 @@ class Text2SpeechService:
         Returns:
             SpeechConfig: Speech configuration
         """
-        return types.SpeechConfig(
-            voice_config=types.VoiceConfig(
-                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                    voice_name=voice_name.value,
-                )
-            )
-        )
+        return _single_speaker_config(voice_name.value)
 
     def _create_multi_speaker_config(
         self,
@@ -75,22 +185,8 @@ class Text2SpeechService:
         Returns:
             A SpeechConfig object for multi-speaker synthesis.
         """
-        speaker_configs = [
-            types.SpeakerVoiceConfig(
-                speaker=speaker.speaker,
-                voice_config=types.VoiceConfig(
-                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                        voice_name=speaker.voice_name.value,
-                    )
-                ),
-            )
-            for speaker in speakers
-        ]
-
-        return types.SpeechConfig(
-            multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                speaker_voice_configs=speaker_configs
-            )
+        return _multi_speaker_config(
+            tuple((speaker.speaker, speaker.voice_name.value) for speaker in speakers)
         )
 
     def _format_multi_speaker_text(self, text: str) -> str:
@@ -106,11 +202,174 @@ class Text2SpeechService:
         Returns:
             The formatted text string.
         """
-        if not text.startswith("TTS the following conversation"):
-            return f"""TTS the following conversation:
-{text}"""
+        if not text.startswith(_TTS_PREFIX):
+            return f"{_TTS_PREFIX}:\n{text}"
         return text
 
+    def _resolve_request_config(
+        self,
+        is_multi_speaker: bool,
+        voice_name: Optional[VoiceName],
+        speakers: Optional[List[SpeakerConfig]],
+        speed: SpeechSpeed,
+        pitch: SpeechPitch,
+    ) -> Tuple[types.SpeechConfig, str]:
+        """
+        Resolve the speech configuration and model for a TTS request.
+
+        Args:
+            is_multi_speaker: Whether to use multi-speaker TTS
+            voice_name: Voice to use for single speaker TTS
+            speakers: Speaker configurations for multi-speaker TTS
+            speed: Speech speed
+            pitch: Speech pitch
+
+        Returns:
+            Tuple[SpeechConfig, str]: Speech configuration and model name
+        """
+        if not is_multi_speaker:
+            return (
+                self._create_speech_config(voice_name, speed, pitch),
+                settings.GEMINI_MODEL_TTS,
+            )
+
+        # Use default speakers if none provided for multi-speaker
+        if not speakers:
+            speakers = [
+                SpeakerConfig(**speaker_config.model_dump())
+                for speaker_config in settings.DEFAULT_SPEAKERS
+            ]
+
+        return (
+            self._create_multi_speaker_config(speakers),
+            settings.GEMINI_MODEL_MULTI_TTS,
+        )
+
+    def speech_cache_key(
+        self,
+        text: str,
+        is_multi_speaker: bool = False,
+        voice_name: Optional[VoiceName] = VoiceName.KORE,
+        speakers: Optional[List[SpeakerConfig]] = None,
+        speed: SpeechSpeed = SpeechSpeed.NORMAL,
+        pitch: SpeechPitch = SpeechPitch.NORMAL,
+    ) -> str:
+        """
+        Build the cache key identifying the audio a request would produce.
+
+        The key covers the resolved model, prompt and speech configuration,
+        so requests that end up sending Gemini the same call share an entry.
+
+        Args:
+            text: Text to convert to speech
+            is_multi_speaker: Whether to use multi-speaker TTS
+            voice_name: Voice to use for single speaker TTS
+            speakers: Speaker configurations for multi-speaker TTS
+            speed: Speech speed
+            pitch: Speech pitch
+
+        Returns:
+            str: Cache key for the request
+        """
+        speech_config, model = self._resolve_request_config(
+            is_multi_speaker, voice_name, speakers, speed, pitch
+        )
+        formatted_text = (
+            self._format_multi_speaker_text(text) if is_multi_speaker else text
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(formatted_text.encode())
+        digest.update(b"\0")
+        digest.update(speech_config.model_dump_json(exclude_none=True).encode())
+        return f"tts:{digest.hexdigest()}"
+
+    async def get_cached_speech(self, cache_key: str) -> Optional[Tuple[str, int]]:
+        """
+        Look up a previously generated audio file for a cache key.
+
+        Args:
+            cache_key: Key from speech_cache_key
+
+        Returns:
+            Optional[Tuple[str, int]]: File id and PCM data size of the cached
+            audio, or None if there is none or its file is gone
+        """
+        if settings.TTS_CACHE_TTL <= 0:
+            return None
+
+        redis = get_redis()
+        if redis is None:
+            value = self._speech_cache.get(cache_key)
+        else:
+            try:
+                value = await redis.get(cache_key)
+            except Exception as e:
+                # The cache is an optimization, never a reason to fail a request
+                logger.warning(f"Speech cache lookup failed: {e}")
+                return None
+
+        if not value:
+            return None
+        file_id, data_size = value.rsplit(":", 1)
+        if not os.path.exists(os.path.join(self.output_dir, f"{file_id}.wav")):
+            return None
+        return file_id, int(data_size)
+
+    async def cache_speech(self, cache_key: str, file_id: str, data_size: int) -> None:
+        """
+        Remember the audio file generated for a cache key.
+
+        Only the file id and size are cached; the audio stays on disk.
+
+        Args:
+            cache_key: Key from speech_cache_key
+            file_id: Id of the generated audio file
+            data_size: Size of the PCM audio data in bytes
+        """
+        if settings.TTS_CACHE_TTL <= 0:
+            return
+
+        value = f"{file_id}:{data_size}"
+        redis = get_redis()
+        if redis is None:
+            self._speech_cache[cache_key] = value
+            return
+        try:
+            await redis.set(cache_key, value, ex=settings.TTS_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Speech cache update failed: {e}")
+
+    def _extract_audio_data(self, response: types.GenerateContentResponse) -> bytes:
+        """
+        Extract the raw audio bytes from a Gemini response.
+
+        Args:
+            response: Gemini API response
+
+        Returns:
+            bytes: Audio data
+
+        Raises:
+            Exception: If the response does not contain audio data
+        """
+        if not response or not response.candidates:
+            raise Exception("No response from Gemini API")
+
+        content = response.candidates[0].content
+        parts = content.parts if content else None
+        if not parts:
+            raise Exception("Invalid response structure from Gemini API")
+
+        # Part always defines inline_data (None when absent), so no hasattr needed
+        inline_data = parts[0].inline_data
+        audio_data = inline_data.data if inline_data else None
+        if not audio_data:
+            raise Exception("No audio data in response")
+
+        return audio_data
+
     async def generate_speech(
         self,
         text: str,
@@ -139,27 +398,12 @@ class Text2SpeechService:
                 f"Generating {'multi-speaker' if is_multi_speaker else 'single-speaker'} speech"
             )
 
-            # Use default speakers if none provided for multi-speaker
-            if is_multi_speaker and not speakers:
-                speakers = [
-                    SpeakerConfig(**speaker_config)
-                    for speaker_config in settings.DEFAULT_SPEAKERS
-                ]
-
+            speech_config, model = self._resolve_request_config(
+                is_multi_speaker, voice_name, speakers, speed, pitch
+            )
             formatted_text = (
                 self._format_multi_speaker_text(text) if is_multi_speaker else text
             )
-            speech_config = (
-                self._create_multi_speaker_config(speakers)
-                if is_multi_speaker
-                else self._create_speech_config(voice_name, speed, pitch)
-            )
-
-            model = (
-                settings.GEMINI_MODEL_MULTI_TTS
-                if is_multi_speaker
-                else settings.GEMINI_MODEL_TTS
-            )
 
             response = await self.gemini_service.generate_content(
                 content=formatted_text,
@@ -168,22 +412,7 @@ class Text2SpeechService:
                 speech_config=speech_config,
             )
 
-            if not response or not response.candidates:
-                raise Exception("No response from Gemini API")
-
-            candidate = response.candidates[0]
-            if not candidate.content or not candidate.content.parts:
-                raise Exception("Invalid response structure from Gemini API")
-
-            part = candidate.content.parts[0]
-            if (
-                not hasattr(part, "inline_data")
-                or not part.inline_data
-                or not part.inline_data.data
-            ):
-                raise Exception("No audio data in response")
-
-            audio_data = part.inline_data.data
+            audio_data = self._extract_audio_data(response)
             logger.info("Speech generation completed")
             return audio_data
 
@@ -191,6 +420,193 @@ class Text2SpeechService:
             logger.error(f"Speech generation failed: {str(e)}")
             raise Exception(f"Speech generation failed: {str(e)}")
 
+    async def stream_speech(
+        self,
+        text: str,
+        is_multi_speaker: bool = False,
+        voice_name: Optional[VoiceName] = VoiceName.KORE,
+        speakers: Optional[List[SpeakerConfig]] = None,
+        speed: SpeechSpeed = SpeechSpeed.NORMAL,
+        pitch: SpeechPitch = SpeechPitch.NORMAL,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech as a WAV file while Gemini is still generating it.
+
+        A WAV header with an open-ended length is emitted together with the
+        first audio chunk, followed by raw PCM chunks as they arrive.
+
+        Args:
+            text: Text to convert to speech
+            is_multi_speaker: Whether to use multi-speaker TTS
+            voice_name: Voice to use for single speaker TTS
+            speakers: Speaker configurations for multi-speaker TTS
+            speed: Speech speed
+            pitch: Speech pitch
+
+        Yields:
+            bytes: WAV header followed by audio data chunks
+        """
+        speech_config, model = self._resolve_request_config(
+            is_multi_speaker, voice_name, speakers, speed, pitch
+        )
+        formatted_text = (
+            self._format_multi_speaker_text(text) if is_multi_speaker else text
+        )
+
+        header = _wav_header(
+            _STREAMING_DATA_SIZE,
+            settings.AUDIO_CHANNELS,
+            settings.AUDIO_SAMPLE_RATE,
+            settings.AUDIO_SAMPLE_WIDTH,
+        )
+        async for response in self.gemini_service.generate_content_stream(
+            content=formatted_text,
+            model=model,
+            response_modalities=["AUDIO"],
+            speech_config=speech_config,
+        ):
+            content = response.candidates[0].content if response.candidates else None
+            for part in (content.parts if content else None) or []:
+                inline_data = part.inline_data
+                data = inline_data.data if inline_data else None
+                if not data:
+                    continue
+                if header:
+                    yield header + data
+                    header = None
+                else:
+                    yield data
+
+        if header:
+            raise Exception("No audio data in response")
+
+    async def save_speech_stream(
+        self,
+        file_path: str,
+        text: str,
+        is_multi_speaker: bool = False,
+        voice_name: Optional[VoiceName] = VoiceName.KORE,
+        speakers: Optional[List[SpeakerConfig]] = None,
+        speed: SpeechSpeed = SpeechSpeed.NORMAL,
+        pitch: SpeechPitch = SpeechPitch.NORMAL,
+    ) -> int:
+        """
+        Stream generated speech straight into a WAV file.
+
+        Chunks are coalesced into writes of about 64 KiB as they arrive, so
+        the whole recording is never held in memory. The header's sizes are
+        filled in once the stream ends, and a partial file is removed if
+        generation fails.
+
+        Args:
+            file_path: Output file path
+            text: Text to convert to speech
+            is_multi_speaker: Whether to use multi-speaker TTS
+            voice_name: Voice to use for single speaker TTS
+            speakers: Speaker configurations for multi-speaker TTS
+            speed: Speech speed
+            pitch: Speech pitch
+
+        Returns:
+            int: Size of the PCM audio data written, in bytes
+        """
+        written = 0
+        pending = bytearray()
+        try:
+            async with aiofiles.open(file_path, "wb") as f:
+                async for chunk in self.stream_speech(
+                    text=text,
+                    is_multi_speaker=is_multi_speaker,
+                    voice_name=voice_name,
+                    speakers=speakers,
+                    speed=speed,
+                    pitch=pitch,
+                ):
+                    pending += chunk
+                    written += len(chunk)
+                    if len(pending) >= _WRITE_BUFFER_SIZE:
+                        await f.write(pending)
+                        pending.clear()
+                if pending:
+                    await f.write(pending)
+
+                data_size = written - _WAV_HEADER.size
+                await f.seek(0)
+                await f.write(
+                    _wav_header(
+                        data_size,
+                        settings.AUDIO_CHANNELS,
+                        settings.AUDIO_SAMPLE_RATE,
+                        settings.AUDIO_SAMPLE_WIDTH,
+                    )
+                )
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(file_path)
+            raise
+
+        logger.info(f"Audio file saved: {file_path}")
+        return data_size
+
+    async def generate_speech_batch(
+        self,
+        texts: List[str],
+        is_multi_speaker: bool = False,
+        voice_name: Optional[VoiceName] = VoiceName.KORE,
+        speakers: Optional[List[SpeakerConfig]] = None,
+        speed: SpeechSpeed = SpeechSpeed.NORMAL,
+        pitch: SpeechPitch = SpeechPitch.NORMAL,
+        use_batch_api: bool = False,
+    ) -> List[bytes]:
+        """
+        Generate speech for several texts concurrently.
+
+        Requests are issued in parallel, with at most GEMINI_MAX_CONCURRENCY
+        calls in flight at once to stay under the API rate limits. For large,
+        latency-tolerant jobs, set use_batch_api to submit all texts as a single
+        Gemini batch job instead.
+
+        Args:
+            texts: Texts to convert to speech
+            is_multi_speaker: Whether to use multi-speaker TTS
+            voice_name: Voice to use for single speaker TTS
+            speakers: Speaker configurations for multi-speaker TTS
+            speed: Speech speed
+            pitch: Speech pitch
+            use_batch_api: Whether to use the Gemini Batch API
+
+        Returns:
+            List[bytes]: Audio data for each text, in input order
+        """
+        if use_batch_api:
+            speech_config, model = self._resolve_request_config(
+                is_multi_speaker, voice_name, speakers, speed, pitch
+            )
+            contents = [
+                self._format_multi_speaker_text(text) if is_multi_speaker else text
+                for text in texts
+            ]
+            responses = await self.gemini_service.generate_content_batch(
+                contents=contents,
+                model=model,
+                response_modalities=["AUDIO"],
+                speech_config=speech_config,
+            )
+            return [self._extract_audio_data(response) for response in responses]
+
+        async def _generate_one(text: str) -> bytes:
+            async with self._semaphore:
+                return await self.generate_speech(
+                    text=text,
+                    is_multi_speaker=is_multi_speaker,
+                    voice_name=voice_name,
+                    speakers=speakers,
+                    speed=speed,
+                    pitch=pitch,
+                )
+
+        return await asyncio.gather(*(_generate_one(text) for text in texts))
+
     async def save_audio_file(
         self,
         audio_data: bytes,
@@ -215,11 +631,10 @@ class Text2SpeechService:
             rate = rate or settings.AUDIO_SAMPLE_RATE
             sample_width = sample_width or settings.AUDIO_SAMPLE_WIDTH
 
-            with wave.open(file_path, "wb") as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(sample_width)
-                wf.setframerate(rate)
-                wf.writeframes(audio_data)
+            header = _wav_header(len(audio_data), channels, rate, sample_width)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(header)
+                await f.write(audio_data)
 
             logger.info(f"Audio file saved: {file_path}")
 
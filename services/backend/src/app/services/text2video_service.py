@@ -13,22 +13,36 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
+import hashlib
 import os
+import random
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import aiofiles
 import aiohttp
-from google import genai
 from google.genai import types
 from loguru import logger
 
 from src.app.core.config import settings
+from src.app.core.genai_client import get_client
+from src.app.utils.concurrency import SingleFlight
+
+# Dedicated pool for large video file I/O, kept apart from the default executor
+# so multi-MB writes don't delay short to_thread hops elsewhere in the app
+_VIDEO_IO = ThreadPoolExecutor(max_workers=4, thread_name_prefix="video-io")
 
 
 class VideoGenerationError(Exception):
     """Custom exception for video generation failures."""
 
 
+class VideoGenerationTimeoutError(VideoGenerationError):
+    """Raised when a video generation job does not finish in time."""
+
+
 class Text2VideoService:
     """
     Service for generating videos from text prompts using the Gemini AI API.
@@ -39,69 +53,206 @@ class Text2VideoService:
 
     def __init__(self):
         """Initializes the Text2VideoService."""
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.client = get_client()
         self.output_dir = settings.VIDEO_OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
+        self._inflight = SingleFlight()
 
-    async def generate_video(
+    async def _wait_for_operation(self, operation):
+        """
+        Polls a video generation operation until it completes.
+
+        The delay between polls starts at VIDEO_POLL_INITIAL_DELAY and doubles
+        up to VIDEO_POLL_MAX_DELAY, with +/-20% jitter so that concurrent jobs
+        do not poll in lockstep.
+
+        Args:
+            operation: The long-running operation returned by generate_videos.
+
+        Returns:
+            The completed operation.
+
+        Raises:
+            VideoGenerationTimeoutError: If the operation is still running after
+                VIDEO_POLL_TIMEOUT seconds.
+        """
+        deadline = time.monotonic() + settings.VIDEO_POLL_TIMEOUT
+        delay = settings.VIDEO_POLL_INITIAL_DELAY
+
+        while not operation.done:
+            if time.monotonic() >= deadline:
+                logger.error("Video generation timed out while polling.")
+                raise VideoGenerationTimeoutError(
+                    "Video generation did not complete in time."
+                )
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, settings.VIDEO_POLL_MAX_DELAY)
+            operation = await self.client.aio.operations.get(operation)
+
+        return operation
+
+    def _cache_filename(
         self, prompt: str, aspect_ratio: str, person_generation: str
     ) -> str:
         """
-        Generates a video asynchronously based on a text prompt.
+        Builds the content-addressed filename for a video request.
+
+        Args:
+            prompt: The text description for the video.
+            aspect_ratio: The desired aspect ratio.
+            person_generation: The policy for generating people.
+
+        Returns:
+            The filename under which the generated video is cached.
+        """
+        key = hashlib.sha256(
+            "\0".join(
+                [settings.GEMINI_MODEL_VIDEO, prompt, aspect_ratio, person_generation]
+            ).encode()
+        ).hexdigest()
+        return f"video_{key}.mp4"
+
+    def _evict_cache(self, keep: str) -> None:
+        """
+        Deletes least recently used videos until the cache fits its size cap.
+
+        Args:
+            keep: Filename that must not be evicted (the video just generated).
+        """
+        if settings.VIDEO_CACHE_MAX_BYTES <= 0:
+            return
+
+        entries = []
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".mp4") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= settings.VIDEO_CACHE_MAX_BYTES:
+                break
+            if entry.name == keep:
+                continue
+            try:
+                os.remove(entry.path)
+                total -= size
+                logger.info("Evicted cached video: {}", entry.name)
+            except FileNotFoundError:
+                pass
+
+    async def _create_video(
+        self,
+        prompt: str,
+        aspect_ratio: str,
+        person_generation: str,
+        file_name: str,
+    ) -> str:
+        """
+        Runs a video generation job and saves the result under file_name.
 
         Args:
             prompt: The text description for the video.
             aspect_ratio: The desired aspect ratio (e.g., "16:9").
             person_generation: The policy for generating people.
+            file_name: The cache filename to save the video under.
 
         Returns:
             The filename of the generated video.
 
         Raises:
-            VideoGenerationError: If the video generation or download fails.
+            VideoGenerationError: If the API returns no downloadable video.
         """
-        try:
-            logger.info("Starting video generation for prompt: %s", prompt)
-            operation = await self.client.aio.models.generate_videos(
-                model=settings.GEMINI_MODEL_VIDEO,
-                prompt=prompt,
-                config=types.GenerateVideosConfig(
-                    person_generation=person_generation,
-                    aspect_ratio=aspect_ratio,
-                ),
-            )
+        file_path = os.path.join(self.output_dir, file_name)
 
-            logger.info("Polling for video generation completion...")
-            while not operation.done:
-                await asyncio.sleep(20)  # Non-blocking sleep
-                operation = await self.client.aio.operations.get(operation)
+        logger.info("Starting video generation for prompt: %s", prompt)
+        operation = await self.client.aio.models.generate_videos(
+            model=settings.GEMINI_MODEL_VIDEO,
+            prompt=prompt,
+            config=types.GenerateVideosConfig(
+                person_generation=person_generation,
+                aspect_ratio=aspect_ratio,
+            ),
+        )
 
-            if not operation.response or not operation.response.generated_videos:
-                logger.error("Video generation failed: No video was returned.")
-                raise VideoGenerationError("No video generated by the API.")
+        logger.info("Polling for video generation completion...")
+        operation = await self._wait_for_operation(operation)
 
-            video_file = operation.response.generated_videos[0].video
-            if not video_file or not video_file.uri:
-                logger.error("Video generation failed: No download URI found.")
-                raise VideoGenerationError(
-                    "No video download URI found in the response."
-                )
+        if not operation.response or not operation.response.generated_videos:
+            logger.error("Video generation failed: No video was returned.")
+            raise VideoGenerationError("No video generated by the API.")
 
-            logger.info("Downloading video from URI: %s", video_file.uri)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(video_file.uri) as resp:
-                    resp.raise_for_status()
-                    video_data = await resp.read()
+        video_file = operation.response.generated_videos[0].video
+        if not video_file or not video_file.uri:
+            logger.error("Video generation failed: No download URI found.")
+            raise VideoGenerationError("No video download URI found in the response.")
 
-            file_name = f"video_{uuid.uuid4()}.mp4"
-            file_path = os.path.join(self.output_dir, file_name)
+        logger.info("Downloading video from URI: %s", video_file.uri)
+        async with aiohttp.ClientSession() as session:
+            async with session.get(video_file.uri) as resp:
+                resp.raise_for_status()
+                video_data = await resp.read()
 
-            async with aiofiles.open(file_path, "wb") as f:
+        # Write to a temporary file first so a partial download is never cached
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.part"
+        try:
+            async with aiofiles.open(tmp_path, "wb", executor=_VIDEO_IO) as f:
                 await f.write(video_data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            # Leftover .part files are invisible to _evict_cache, so remove them
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        await asyncio.get_running_loop().run_in_executor(
+            _VIDEO_IO, self._evict_cache, file_name
+        )
+
+        logger.info("Successfully generated and saved video: %s", file_name)
+        return file_name
+
+    async def generate_video(
+        self, prompt: str, aspect_ratio: str, person_generation: str
+    ) -> str:
+        """
+        Generates a video asynchronously based on a text prompt.
+
+        Videos are cached on disk by request, so repeating a request returns
+        the previously generated file without calling the API.
 
-            logger.info("Successfully generated and saved video: %s", file_name)
-            return file_name
+        Args:
+            prompt: The text description for the video.
+            aspect_ratio: The desired aspect ratio (e.g., "16:9").
+            person_generation: The policy for generating people.
+
+        Returns:
+            The filename of the generated video.
+
+        Raises:
+            VideoGenerationTimeoutError: If the generation job does not finish
+                within the configured polling timeout.
+            VideoGenerationError: If the video generation or download fails.
+        """
+        try:
+            file_name = self._cache_filename(prompt, aspect_ratio, person_generation)
+            file_path = os.path.join(self.output_dir, file_name)
+            if os.path.exists(file_path):
+                # Refresh the mtime so eviction treats the video as recently used
+                os.utime(file_path)
+                logger.info("Serving cached video: {}", file_name)
+                return file_name
+
+            # Concurrent identical requests share one generation job
+            return await self._inflight.do(
+                file_name,
+                lambda: self._create_video(
+                    prompt, aspect_ratio, person_generation, file_name
+                ),
+            )
 
+        except VideoGenerationError:
+            raise
         except Exception as e:
             logger.error("An unexpected error occurred during video generation: %s", e)
             raise VideoGenerationError(f"An unexpected error occurred: {e}") from e
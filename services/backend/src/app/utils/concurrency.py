@@ -0,0 +1,117 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Async concurrency helpers."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how much capacity is consumed per time period.
+
+    Waiters are served in arrival order. A bucket created with a max_rate of 0
+    never blocks, which lets callers disable limiting through configuration.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_rate: Capacity available per time period
+            time_period: Length of the time period in seconds
+        """
+        self.max_rate = max_rate
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the capacity accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_rate, self._tokens + (now - self._updated) * self._refill_rate
+        )
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until the requested capacity is available and consume it.
+
+        Args:
+            amount: Capacity to consume, capped at max_rate
+        """
+        if self.max_rate <= 0:
+            return
+
+        amount = min(amount, self.max_rate)
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= amount
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller for a key starts the work in its own task; every caller,
+    including the first, awaits that task. A caller that is cancelled (say,
+    because its client disconnected) only stops waiting, so the others still
+    get the result.
+    """
+
+    def __init__(self):
+        """Initialize the in-flight table."""
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn for key, or join the in-flight run for the same key.
+
+        Args:
+            key: Identity of the work; equal keys are deduplicated
+            fn: Zero-argument coroutine function performing the work
+
+        Returns:
+            The result of fn
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, fn))
+            task.add_done_callback(_retrieve_exception)
+            self._inflight[key] = task
+        # Shield so a cancelled caller doesn't cancel the shared run
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, freeing key as soon as it finishes."""
+        try:
+            return await fn()
+        finally:
+            del self._inflight[key]
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark a shared run's exception retrieved when every caller has left."""
+    if not task.cancelled():
+        task.exception()
@@ -15,24 +15,35 @@
 """FastAPI dependencies."""
 
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from src.app.core.config import settings
 from src.app.services.document_edit_service import DocumentEditService
-from src.app.services.gemini_live_web_service import GeminiLiveWebSocketService
+from src.app.services.gemini_service import GeminiService
 from src.app.services.text2image_service import Text2ImageService
 from src.app.services.text2speech_service import Text2SpeechService
 from src.app.services.text2video_service import Text2VideoService
 
+if TYPE_CHECKING:
+    from src.app.services.gemini_live_web_service import GeminiLiveWebSocketService
+
+
+@lru_cache()
+def get_gemini_service() -> GeminiService:
+    """Get the Gemini service instance shared by the other services."""
+    return GeminiService()
+
 
 @lru_cache()
 def get_document_edit_service() -> DocumentEditService:
     """Get document edit service instance."""
-    return DocumentEditService()
+    return DocumentEditService(gemini_service=get_gemini_service())
 
 
 @lru_cache()
 def get_text2speech_service() -> Text2SpeechService:
     """Get text-to-speech service instance."""
-    return Text2SpeechService()
+    return Text2SpeechService(gemini_service=get_gemini_service())
 
 
 @lru_cache()
@@ -47,13 +58,24 @@ def get_text2video_service() -> Text2VideoService:
     return Text2VideoService()
 
 
-@lru_cache()
-def get_tts_service() -> Text2SpeechService:
-    """Get text-to-speech service instance (alias for compatibility)."""
-    return Text2SpeechService()
+# Alias for compatibility; shares the cached text-to-speech instance
+get_tts_service = get_text2speech_service
 
 
 @lru_cache()
-def get_gemini_live_websocket_service() -> GeminiLiveWebSocketService:
+def get_gemini_live_websocket_service() -> "GeminiLiveWebSocketService":
     """Get Gemini Live WebSocket service instance."""
+    # Imported here so the Live stack is only loaded when the feature is used
+    from src.app.services.gemini_live_web_service import GeminiLiveWebSocketService
+
     return GeminiLiveWebSocketService()
+
+
+def init_services() -> None:
+    """Create the shared service instances ahead of the first request."""
+    get_document_edit_service()
+    get_text2speech_service()
+    get_text2image_service()
+    get_text2video_service()
+    if settings.ENABLE_GEMINI_LIVE:
+        get_gemini_live_websocket_service()
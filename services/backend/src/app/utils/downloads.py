@@ -0,0 +1,119 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Responses and signed links for downloading generated files."""
+
+import hashlib
+import hmac
+import os
+import time
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from src.app.core.config import settings
+
+# Read size when Starlette streams a file itself; its 64 KiB default means a
+# thread hop for every 64 KiB of a multi-megabyte video
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+
+def file_download_response(
+    file_path: str,
+    location: str,
+    media_type: str,
+    filename: Optional[str] = None,
+    stat_result: Optional[os.stat_result] = None,
+) -> Response:
+    """
+    Build the response that sends a generated file to the client.
+
+    When DOWNLOAD_ACCEL_PREFIX is set, the body is left to the reverse proxy
+    through an X-Accel-Redirect header, so the worker answers immediately and
+    nginx sends the file itself. Otherwise the file is streamed by Starlette,
+    which hands it to the server's pathsend extension where one is offered
+    and reads it in 1 MiB chunks where not.
+
+    Args:
+        file_path: Path of the file on disk
+        location: Path of the file below DOWNLOAD_ACCEL_PREFIX, e.g. "image/a.png"
+        media_type: Content type of the file
+        filename: Download name for the Content-Disposition header, if any
+        stat_result: Result of os.stat on the file, to avoid a second stat
+
+    Returns:
+        Response: The download response
+    """
+    if not settings.DOWNLOAD_ACCEL_PREFIX:
+        response = FileResponse(
+            file_path,
+            media_type=media_type,
+            filename=filename,
+            stat_result=stat_result,
+        )
+        response.chunk_size = _FILE_CHUNK_SIZE
+        return response
+
+    headers = {
+        "X-Accel-Redirect": f"{settings.DOWNLOAD_ACCEL_PREFIX.rstrip('/')}/"
+        f"{quote(location)}"
+    }
+    if filename:
+        quoted = quote(filename)
+        if quoted != filename:
+            headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quoted}"
+        else:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(media_type=media_type, headers=headers)
+
+
+def _download_signature(file_id: str, expires: int) -> str:
+    message = f"{file_id}:{expires}".encode()
+    digest = hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256)
+    return digest.hexdigest()[:32]
+
+
+def sign_download_path(path: str, file_id: str) -> str:
+    """
+    Append an expiring signature to a download path.
+
+    Args:
+        path: Download path of the file, without a query string
+        file_id: Identifier of the file the signature covers
+
+    Returns:
+        str: The path with sig and exp query parameters
+    """
+    expires = int(time.time()) + settings.DOWNLOAD_URL_TTL_SECONDS
+    return f"{path}?sig={_download_signature(file_id, expires)}&exp={expires}"
+
+
+def verify_download_signature(file_id: str, sig: str, exp: int) -> bool:
+    """
+    Check a signature created by sign_download_path.
+
+    Args:
+        file_id: Identifier of the requested file
+        sig: Signature from the query string
+        exp: Expiry timestamp from the query string
+
+    Returns:
+        bool: Whether the signature matches and has not expired
+    """
+    if exp < time.time():
+        return False
+    return hmac.compare_digest(sig, _download_signature(file_id, exp))
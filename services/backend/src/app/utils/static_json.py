@@ -0,0 +1,62 @@
+# Copyright 2025 Loïc Muhirwa
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Constant JSON payloads served with HTTP caching headers."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+# Browsers may reuse these payloads for an hour before revalidating
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+class StaticJSON:
+    """
+    JSON payload serialized once and served with an ETag.
+
+    Requests whose If-None-Match matches the ETag get an empty 304 response,
+    so a client revalidating its copy costs neither serialization nor body.
+    """
+
+    def __init__(self, content: Any):
+        """
+        Serialize the payload and derive its ETag.
+
+        Args:
+            content: JSON-serializable payload
+        """
+        self.body = orjson.dumps(content)
+        digest = hashlib.blake2b(self.body, digest_size=8).hexdigest()
+        self.etag = f'"{digest}"'
+
+    def response(self, request: Request) -> Response:
+        """
+        Build the response for a request.
+
+        Args:
+            request: Incoming request, checked for If-None-Match
+
+        Returns:
+            Response: The payload, or 304 when the client's copy is current
+        """
+        headers = {"ETag": self.etag, "Cache-Control": _CACHE_CONTROL}
+        if_none_match = request.headers.get("if-none-match", "")
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if self.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
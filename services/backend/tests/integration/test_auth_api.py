@@ -0,0 +1,80 @@
+"""Integration tests for authentication API endpoints."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from google.genai import errors
+
+from src.app.core.config import settings
+
+
+@pytest.mark.api
+def test_login_session_lifecycle(client: TestClient):
+    """Test that a login session serves the API key until logout."""
+    with patch("src.app.api.v1.routes.auth.get_user_client") as mock_client:
+        mock_client.return_value.aio.models.generate_content = AsyncMock()
+        response = client.post(
+            "/v1/api/auth/login",
+            json={"secret": settings.AUTH_SECRET, "gemini_api_key": "user-key"},
+        )
+    assert response.status_code == 200
+    session_id = response.json()["session_id"]
+
+    response = client.get(
+        "/v1/api/auth/user-api-key", headers={"X-Session-ID": session_id}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"api_key": "user-key"}
+
+    response = client.post("/v1/api/auth/logout", headers={"X-Session-ID": session_id})
+    assert response.status_code == 200
+
+    response = client.get(
+        "/v1/api/auth/user-api-key", headers={"X-Session-ID": session_id}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.api
+def test_user_api_key_unknown_session(client: TestClient):
+    """Test that an unknown session is rejected."""
+    response = client.get("/v1/api/auth/user-api-key", headers={"X-Session-ID": "nope"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Session not found"
+
+
+@pytest.mark.api
+def test_login_reuses_cached_key_validation(client: TestClient):
+    """Test that a recently validated API key is not probed again."""
+    payload = {"secret": settings.AUTH_SECRET, "gemini_api_key": "repeat-key"}
+
+    with patch("src.app.api.v1.routes.auth.get_user_client") as mock_client:
+        mock_client.return_value.aio.models.generate_content = AsyncMock()
+        assert client.post("/v1/api/auth/login", json=payload).status_code == 200
+        assert client.post("/v1/api/auth/login", json=payload).status_code == 200
+
+    assert mock_client.call_count == 1
+
+
+@pytest.mark.api
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (errors.ClientError(400, {"error": {"message": "API key not valid"}}), 401),
+        (errors.ClientError(429, {"error": {"message": "quota"}}), 429),
+        (errors.ServerError(503, {"error": {"message": "unavailable"}}), 503),
+    ],
+)
+def test_login_key_probe_errors(client: TestClient, error, status_code):
+    """Test that only rejected keys are reported as invalid."""
+    payload = {"secret": settings.AUTH_SECRET, "gemini_api_key": f"key-{status_code}"}
+
+    with patch("src.app.api.v1.routes.auth.get_user_client") as mock_client:
+        mock_client.return_value.aio.models.generate_content = AsyncMock(
+            side_effect=error
+        )
+        response = client.post("/v1/api/auth/login", json=payload)
+
+    assert response.status_code == status_code
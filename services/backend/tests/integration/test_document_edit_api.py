@@ -199,3 +199,43 @@ async def test_document_edit_endpoint_async(async_client):
         data = response.json()
         assert data["edited_content"] == "Async edited content"
         assert data["status"] == "success"
+
+
+@pytest.mark.api
+def test_document_edit_batch_submit(client: TestClient, sample_document: str):
+    """Test submitting several document edits as a batch job."""
+    with patch(
+        "src.app.services.document_edit_service.DocumentEditService.submit_edit_batch"
+    ) as mock_submit:
+        mock_submit.return_value = ("job-123", "JOB_STATE_QUEUED")
+
+        response = client.post(
+            "/v1/api/documentedit/batch",
+            json={
+                "requests": [
+                    {"content": sample_document, "instructions": "Fix grammar"},
+                    {"content": sample_document, "instructions": "Shorten it"},
+                ]
+            },
+        )
+
+        assert response.status_code == 202
+        assert response.json()["job_id"] == "job-123"
+        assert response.json()["state"] == "JOB_STATE_QUEUED"
+        assert len(mock_submit.call_args.args[0]) == 2
+
+
+@pytest.mark.api
+def test_document_edit_batch_status(client: TestClient):
+    """Test polling a finished document edit batch job."""
+    with patch(
+        "src.app.services.document_edit_service.DocumentEditService.get_edit_batch"
+    ) as mock_get:
+        mock_get.return_value = ("JOB_STATE_SUCCEEDED", ["first", "second"])
+
+        response = client.get("/v1/api/documentedit/batch/job-123")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"] == "JOB_STATE_SUCCEEDED"
+        assert data["edited_contents"] == ["first", "second"]
@@ -126,11 +126,9 @@ def test_text2image_download_endpoint_success(client: TestClient, temp_file: str
 
     with (
         patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
         patch("src.app.services.text2image_service.Text2ImageService") as mock_service,
     ):
         mock_join.return_value = temp_file
-        mock_exists.return_value = True
         mock_service.return_value.output_dir = "/fake/output/dir"
 
         response = client.get(f"/v1/api/text2image/download/{filename}")
@@ -143,10 +141,10 @@ def test_text2image_download_endpoint_success(client: TestClient, temp_file: str
 def test_text2image_download_endpoint_file_not_found(client: TestClient):
     """Test image download when file doesn't exist."""
     with (
-        patch("os.path.exists") as mock_exists,
+        patch("os.stat") as mock_stat,
         patch("src.app.services.text2image_service.Text2ImageService") as mock_service,
     ):
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
         mock_service.return_value.output_dir = "/fake/output/dir"
 
         response = client.get("/v1/api/text2image/download/nonexistent.png")
@@ -1,11 +1,21 @@
 """Integration tests for text-to-speech API endpoints."""
 
+import asyncio
+import os
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from src.app.main import app
 from src.app.models.text2speech import SpeechPitch, SpeechSpeed, VoiceName
+from src.app.utils.downloads import sign_download_path
+
+
+def signed_download_url(file_id: str) -> str:
+    """Build a signed audio download URL as the generate endpoint does."""
+    return sign_download_path(f"/v1/api/text2speech/download/{file_id}", file_id)
 
 
 @pytest.mark.api
@@ -15,15 +25,11 @@ def test_text2speech_endpoint_success(
     """Test successful text-to-speech generation."""
     with (
         patch(
-            "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-        ) as mock_generate,
-        patch(
-            "src.app.services.text2speech_service.Text2SpeechService.save_audio_file"
+            "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
         ) as mock_save,
         patch("os.makedirs"),
     ):
-        mock_generate.return_value = mock_audio_data
-        mock_save.return_value = None
+        mock_save.return_value = len(mock_audio_data)
 
         response = client.post(
             "/v1/api/text2speech/",
@@ -41,10 +47,102 @@ def test_text2speech_endpoint_success(
         assert data["status"] == "success"
         assert "audio_file_id" in data
         assert data["filename"].endswith(".wav")
+        assert data["download_url"].startswith(
+            f"/v1/api/text2speech/download/{data['audio_file_id']}?sig="
+        )
         assert data["file_size_bytes"] > 0
         assert data["duration_seconds"] > 0
 
 
+@pytest.mark.api
+def test_text2speech_endpoint_cache_hit(client: TestClient, sample_text: str):
+    """Test that cached speech is returned without generating it again."""
+    service_path = "src.app.services.text2speech_service.Text2SpeechService"
+    with (
+        patch(f"{service_path}.get_cached_speech") as mock_cached,
+        patch(f"{service_path}.save_speech_stream") as mock_save,
+    ):
+        mock_cached.return_value = ("cached-id", 48000)
+
+        response = client.post("/v1/api/text2speech/", json={"text": sample_text})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cache_hit"] is True
+        assert data["audio_file_id"] == "cached-id"
+        assert data["duration_seconds"] == 1.0
+        mock_save.assert_not_called()
+
+
+@pytest.mark.api
+async def test_text2speech_endpoint_coalesces_identical_requests(
+    test_directories, sample_text: str
+):
+    """Test that concurrent identical requests share one generation."""
+    service_path = "src.app.services.text2speech_service.Text2SpeechService"
+
+    async def slow_save(**_):
+        await asyncio.sleep(0.05)
+        return 48000
+
+    with (
+        patch(f"{service_path}.get_cached_speech", return_value=None) as mock_cached,
+        patch(f"{service_path}.save_speech_stream", side_effect=slow_save) as mock_save,
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post("/v1/api/text2speech/", json={"text": sample_text})
+                    for _ in range(2)
+                )
+            )
+
+    assert [response.status_code for response in responses] == [200, 200]
+    first, second = (response.json() for response in responses)
+    assert first["audio_file_id"] == second["audio_file_id"]
+    mock_cached.assert_awaited_once()
+    mock_save.assert_awaited_once()
+
+
+@pytest.mark.api
+def test_text2speech_stream_endpoint(client: TestClient, sample_text: str):
+    """Test streaming text-to-speech returns the audio chunks in order."""
+
+    async def fake_stream(self, **_):
+        yield b"RIFF-header"
+        yield b"pcm-data"
+
+    with patch(
+        "src.app.services.text2speech_service.Text2SpeechService.stream_speech",
+        new=fake_stream,
+    ):
+        response = client.post("/v1/api/text2speech/stream", json={"text": sample_text})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/wav"
+        assert response.content == b"RIFF-headerpcm-data"
+
+
+@pytest.mark.api
+def test_text2speech_stream_endpoint_error(client: TestClient, sample_text: str):
+    """Test streaming text-to-speech reports upfront failures as errors."""
+
+    async def failing_stream(self, **_):
+        raise Exception("API error")
+        yield b""
+
+    with patch(
+        "src.app.services.text2speech_service.Text2SpeechService.stream_speech",
+        new=failing_stream,
+    ):
+        response = client.post("/v1/api/text2speech/stream", json={"text": sample_text})
+
+        assert response.status_code == 500
+        assert "Speech generation failed" in response.json()["detail"]
+
+
 @pytest.mark.api
 def test_text2speech_endpoint_minimal_request(
     client: TestClient, mock_audio_data: bytes
@@ -52,15 +150,11 @@ def test_text2speech_endpoint_minimal_request(
     """Test TTS with minimal request."""
     with (
         patch(
-            "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-        ) as mock_generate,
-        patch(
-            "src.app.services.text2speech_service.Text2SpeechService.save_audio_file"
+            "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
         ) as mock_save,
         patch("os.makedirs"),
     ):
-        mock_generate.return_value = mock_audio_data
-        mock_save.return_value = None
+        mock_save.return_value = len(mock_audio_data)
 
         response = client.post("/v1/api/text2speech/", json={"text": "Hello world"})
 
@@ -76,15 +170,11 @@ def test_text2speech_endpoint_multi_speaker(
     """Test multi-speaker TTS."""
     with (
         patch(
-            "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-        ) as mock_generate,
-        patch(
-            "src.app.services.text2speech_service.Text2SpeechService.save_audio_file"
+            "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
         ) as mock_save,
         patch("os.makedirs"),
     ):
-        mock_generate.return_value = mock_audio_data
-        mock_save.return_value = None
+        mock_save.return_value = len(mock_audio_data)
 
         response = client.post(
             "/v1/api/text2speech/",
@@ -103,15 +193,11 @@ def test_text2speech_endpoint_custom_speakers(
     """Test TTS with custom speakers."""
     with (
         patch(
-            "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-        ) as mock_generate,
-        patch(
-            "src.app.services.text2speech_service.Text2SpeechService.save_audio_file"
+            "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
         ) as mock_save,
         patch("os.makedirs"),
     ):
-        mock_generate.return_value = mock_audio_data
-        mock_save.return_value = None
+        mock_save.return_value = len(mock_audio_data)
 
         speakers = [
             {"speaker": "Alice", "voice_name": VoiceName.KORE.value},
@@ -170,9 +256,9 @@ def test_text2speech_endpoint_validation_errors(client: TestClient):
 def test_text2speech_endpoint_service_error(client: TestClient):
     """Test TTS service error handling."""
     with patch(
-        "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-    ) as mock_generate:
-        mock_generate.side_effect = Exception("TTS service error")
+        "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
+    ) as mock_save:
+        mock_save.side_effect = Exception("TTS service error")
 
         response = client.post("/v1/api/text2speech/", json={"text": "Hello world"})
 
@@ -187,11 +273,10 @@ def test_download_audio_endpoint_success(client: TestClient, temp_file: str):
     # Create a mock audio file
     file_id = "test-file-id"
 
-    with patch("os.path.join") as mock_join, patch("os.path.exists") as mock_exists:
+    with patch("os.path.join") as mock_join:
         mock_join.return_value = temp_file
-        mock_exists.return_value = True
 
-        response = client.get(f"/v1/api/text2speech/download/{file_id}")
+        response = client.get(signed_download_url(file_id))
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "audio/wav"
@@ -200,23 +285,46 @@ def test_download_audio_endpoint_success(client: TestClient, temp_file: str):
 @pytest.mark.api
 def test_download_audio_endpoint_file_not_found(client: TestClient):
     """Test audio download when file doesn't exist."""
-    with patch("os.path.exists") as mock_exists:
-        mock_exists.return_value = False
+    with patch("os.stat") as mock_stat:
+        mock_stat.side_effect = FileNotFoundError
 
-        response = client.get("/v1/api/text2speech/download/nonexistent-file")
+        response = client.get(signed_download_url("nonexistent-file"))
 
         assert response.status_code == 404
         data = response.json()
         assert "Audio file not found" in data["detail"]
 
 
+@pytest.mark.api
+def test_download_audio_endpoint_rejects_bad_links(client: TestClient):
+    """Test that unsigned, tampered and expired download links are refused."""
+    url = signed_download_url("test-file")
+
+    response = client.get("/v1/api/text2speech/download/test-file")
+    assert response.status_code == 422
+
+    response = client.get(url.replace("test-file", "other-file"))
+    assert response.status_code == 403
+
+    with patch("src.app.utils.downloads.time.time", return_value=10**12):
+        response = client.get(url)
+    assert response.status_code == 403
+    assert "expired" in response.json()["detail"]
+
+
 @pytest.mark.api
 def test_download_audio_endpoint_server_error(client: TestClient):
     """Test audio download server error."""
-    with patch("os.path.exists") as mock_exists:
-        mock_exists.side_effect = Exception("File system error")
+    real_stat = os.stat
+
+    def failing_stat(path, *args, **kwargs):
+        # Only the audio file fails, so traceback logging can still read sources
+        if str(path).endswith("test-file.wav"):
+            raise Exception("File system error")
+        return real_stat(path, *args, **kwargs)
 
-        response = client.get("/v1/api/text2speech/download/test-file")
+    with patch("os.stat", side_effect=failing_stat):
+        response = client.get(signed_download_url("test-file"))
 
         assert response.status_code == 500
         data = response.json()
@@ -281,15 +389,11 @@ async def test_text2speech_endpoint_async(async_client, mock_audio_data: bytes):
     """Test TTS endpoint with async client."""
     with (
         patch(
-            "src.app.services.text2speech_service.Text2SpeechService.generate_speech"
-        ) as mock_generate,
-        patch(
-            "src.app.services.text2speech_service.Text2SpeechService.save_audio_file"
+            "src.app.services.text2speech_service.Text2SpeechService.save_speech_stream"
         ) as mock_save,
         patch("os.makedirs"),
     ):
-        mock_generate.return_value = mock_audio_data
-        mock_save.return_value = None
+        mock_save.return_value = len(mock_audio_data)
 
         response = await async_client.post(
             "/v1/api/text2speech/", json={"text": "Async test"}
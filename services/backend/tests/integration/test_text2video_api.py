@@ -5,7 +5,10 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
-from src.app.services.text2video_service import VideoGenerationError
+from src.app.services.text2video_service import (
+    VideoGenerationError,
+    VideoGenerationTimeoutError,
+)
 
 
 @pytest.mark.api
@@ -67,6 +70,21 @@ def test_text2video_generate_endpoint_validation_errors(client: TestClient):
     assert response.status_code == 422
 
 
+@pytest.mark.api
+def test_text2video_generate_endpoint_timeout(client: TestClient):
+    """Test video generation timeout maps to 504."""
+    with patch(
+        "src.app.services.text2video_service.Text2VideoService.generate_video"
+    ) as mock_generate:
+        mock_generate.side_effect = VideoGenerationTimeoutError("timed out")
+
+        response = client.post(
+            "/v1/api/text2video/generate", json={"prompt": "test video"}
+        )
+
+        assert response.status_code == 504
+
+
 @pytest.mark.api
 def test_text2video_generate_endpoint_service_error(client: TestClient):
     """Test video generation service error handling."""
@@ -146,26 +164,44 @@ def test_text2video_download_endpoint_success(client: TestClient, temp_file: str
 
     with (
         patch("os.path.join") as mock_join,
-        patch("os.path.exists") as mock_exists,
         patch("src.app.services.text2video_service.Text2VideoService") as mock_service,
     ):
         mock_join.return_value = temp_file
-        mock_exists.return_value = True
         mock_service.return_value.output_dir = "/fake/output/dir"
 
         response = client.get(f"/v1/api/text2video/download/{filename}")
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "video/mp4"
+
+
+@pytest.mark.api
+def test_text2video_download_endpoint_range(client: TestClient, temp_file: str):
+    """Test that a Range request returns partial content."""
+    with open(temp_file, "wb") as f:
+        f.write(b"0123456789")
+
+    with patch("os.path.join") as mock_join:
+        mock_join.return_value = temp_file
+
+        response = client.get(
+            "/v1/api/text2video/download/test_video.mp4",
+            headers={"Range": "bytes=2-5"},
+        )
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
 
 
 @pytest.mark.api
 def test_text2video_download_endpoint_file_not_found(client: TestClient):
     """Test video download when file doesn't exist."""
     with (
-        patch("os.path.exists") as mock_exists,
+        patch("os.stat") as mock_stat,
         patch("src.app.services.text2video_service.Text2VideoService") as mock_service,
     ):
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
         mock_service.return_value.output_dir = "/fake/output/dir"
 
         response = client.get("/v1/api/text2video/download/nonexistent.mp4")
@@ -178,8 +214,8 @@ def test_text2video_download_endpoint_file_not_found(client: TestClient):
 @pytest.mark.api
 def test_text2video_download_endpoint_server_error(client: TestClient):
     """Test video download server error."""
-    with patch("os.path.exists") as mock_exists:
-        mock_exists.side_effect = Exception("File system error")
+    with patch("os.stat") as mock_stat:
+        mock_stat.side_effect = Exception("File system error")
 
         response = client.get("/v1/api/text2video/download/test.mp4")
 
@@ -206,6 +242,20 @@ def test_get_video_styles_endpoint(client: TestClient):
     assert "description" in style
 
 
+@pytest.mark.api
+def test_get_video_styles_endpoint_not_modified(client: TestClient):
+    """Test that a client holding the current styles gets a 304."""
+    first = client.get("/v1/api/text2video/styles")
+
+    response = client.get(
+        "/v1/api/text2video/styles",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
 @pytest.mark.api
 def test_get_video_styles_endpoint_error(client: TestClient):
     """Test video styles endpoint error handling."""
@@ -3,7 +3,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from src.app.main import app
+from src.app.main import app, is_allowed_origin
 
 
 @pytest.mark.unit
@@ -70,6 +70,41 @@ def test_cors_headers(client: TestClient):
     # Note: TestClient doesn't always include all CORS headers in test mode
 
 
+@pytest.mark.api
+def test_cors_preflight_allows_frontend_headers(client: TestClient):
+    """Test that preflight requests from the frontend are allowed and cacheable."""
+    response = client.options(
+        "/v1/api/auth/login",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": (
+                "content-type, x-session-id, ngrok-skip-browser-warning"
+            ),
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-max-age"] == "86400"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "origin,allowed_hosts,expected",
+    [
+        ("https://example.com", ["https://example.com"], True),
+        ("https://a.ngrok.io", ["http://localhost", "https://*.ngrok.io"], True),
+        ("https://a.ngrok.io.evil.com", ["https://*.ngrok.io"], False),
+        ("https://exampleXcom", ["https://example.com"], False),
+        ("https://anything.dev", ["*"], True),
+        ("", ["*"], False),
+    ],
+)
+def test_is_allowed_origin(origin, allowed_hosts, expected):
+    """Test origin matching against exact and wildcard host patterns."""
+    assert is_allowed_origin(origin, allowed_hosts) is expected
+
+
 @pytest.mark.api
 def test_api_routes_exist(client: TestClient):
     """Test that all expected API routes exist."""
@@ -0,0 +1,103 @@
+"""Tests for async concurrency helpers."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.app.utils.concurrency import AsyncRateLimiter, SingleFlight
+
+
+@pytest.mark.unit
+async def test_rate_limiter_allows_burst_up_to_capacity():
+    """Test that a full bucket does not block."""
+    limiter = AsyncRateLimiter(max_rate=5, time_period=60)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.unit
+async def test_rate_limiter_waits_for_refill():
+    """Test that an empty bucket waits for capacity to refill."""
+    limiter = AsyncRateLimiter(max_rate=10, time_period=1)
+    await limiter.acquire(10)
+
+    start = time.monotonic()
+    await limiter.acquire(2)
+
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.unit
+async def test_rate_limiter_disabled():
+    """Test that a zero rate never blocks."""
+    limiter = AsyncRateLimiter(max_rate=0)
+
+    for _ in range(100):
+        await limiter.acquire(1000)
+
+
+@pytest.mark.unit
+async def test_single_flight_coalesces_concurrent_calls():
+    """Test that concurrent calls with the same key run the work once."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(single_flight.do("key", work) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert calls == 1
+
+    # Once finished, the key is free to run again
+    assert await single_flight.do("key", work) == "result"
+    assert calls == 2
+
+
+@pytest.mark.unit
+async def test_single_flight_propagates_errors():
+    """Test that waiters receive the leader's exception."""
+    single_flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", work) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.unit
+async def test_single_flight_survives_cancelled_leader():
+    """Test that cancelling the first caller doesn't cancel the shared run."""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    leader = asyncio.create_task(single_flight.do("key", work))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(single_flight.do("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+
+    assert await waiter == "result"
+    assert leader.cancelled()
+    assert calls == 1
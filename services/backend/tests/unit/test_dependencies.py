@@ -1,7 +1,11 @@
 """Tests for service dependencies."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
+from src.app.core.config import settings
+from src.app.core.genai_client import get_client, warm_client
 from src.app.services.document_edit_service import DocumentEditService
 from src.app.services.text2image_service import Text2ImageService
 from src.app.services.text2speech_service import Text2SpeechService
@@ -12,6 +16,7 @@ from src.app.utils.dependencies import (
     get_text2speech_service,
     get_text2video_service,
     get_tts_service,
+    init_services,
 )
 
 
@@ -70,6 +75,42 @@ def test_get_tts_service_alias():
     assert service is tts_service
 
 
+@pytest.mark.unit
+def test_services_share_gemini_client():
+    """Test that services reuse the process-wide Gemini client."""
+    assert get_text2speech_service().gemini_service.client is get_client()
+    assert get_document_edit_service().gemini_service.client is get_client()
+    assert get_text2image_service().client is get_client()
+    assert get_text2video_service().client is get_client()
+
+
+@pytest.mark.unit
+def test_init_services_skips_disabled_gemini_live():
+    """Test that the Live service is not built when the feature is off."""
+    with (
+        patch.object(settings, "ENABLE_GEMINI_LIVE", False),
+        patch(
+            "src.app.utils.dependencies.get_gemini_live_websocket_service"
+        ) as mock_live,
+    ):
+        init_services()
+
+    mock_live.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_warm_client_fetches_model_metadata():
+    """Test that warmup primes the shared client with a metadata call."""
+    with patch("src.app.core.genai_client.get_client") as mock_get_client:
+        mock_get_client.return_value.aio.models.get = AsyncMock()
+
+        await warm_client()
+
+        mock_get_client.return_value.aio.models.get.assert_awaited_once_with(
+            model=settings.GEMINI_MODEL_DOCUMENT
+        )
+
+
 @pytest.mark.unit
 def test_dependency_caching():
     """Test that dependencies are properly cached."""
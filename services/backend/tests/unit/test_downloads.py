@@ -0,0 +1,35 @@
+"""Tests for download responses."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.responses import FileResponse
+
+from src.app.utils.downloads import file_download_response
+
+
+@pytest.mark.unit
+def test_file_download_response_streams_file_by_default(temp_file):
+    """Test that files are streamed when no proxy prefix is configured."""
+    with patch("src.app.utils.downloads.settings.DOWNLOAD_ACCEL_PREFIX", ""):
+        response = file_download_response(temp_file, "audio/a.wav", "audio/wav")
+
+    assert isinstance(response, FileResponse)
+    assert response.chunk_size == 1024 * 1024
+
+
+@pytest.mark.unit
+def test_file_download_response_uses_accel_redirect():
+    """Test that the proxy is asked to send the file when a prefix is set."""
+    with patch("src.app.utils.downloads.settings.DOWNLOAD_ACCEL_PREFIX", "/_p/"):
+        response = file_download_response(
+            "/srv/audio/a b.wav", "audio/a b.wav", "audio/wav", filename="a b.wav"
+        )
+
+    assert response.headers["x-accel-redirect"] == "/_p/audio/a%20b.wav"
+    assert response.headers["content-type"] == "audio/wav"
+    assert (
+        response.headers["content-disposition"]
+        == "attachment; filename*=utf-8''a%20b.wav"
+    )
+    assert response.body == b""
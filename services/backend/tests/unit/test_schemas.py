@@ -159,7 +159,7 @@ class TestText2SpeechSchemas:
         data = {
             "audio_file_id": "123e4567-e89b-12d3-a456-426614174000",
             "filename": "audio.wav",
-            "file_path": "/path/to/audio.wav",
+            "download_url": "/v1/api/text2speech/download/123?sig=abc&exp=1",
             "duration_seconds": 5.5,
             "file_size_bytes": 132000,
             "status": "success",
@@ -190,6 +190,13 @@ class TestText2ImageSchemas:
         assert request.prompt == "Test image"
         assert request.num_images == 4  # Default value
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_images", [0, 17])
+    def test_text2image_request_num_images_bounds(self, num_images):
+        """Test that image counts outside 1-16 are rejected."""
+        with pytest.raises(ValidationError):
+            Text2ImageRequest(prompt="Test image", num_images=num_images)
+
     @pytest.mark.unit
     def test_text2image_response(self):
         """Test text-to-image response."""
@@ -1,17 +1,149 @@
 """Unit tests for service classes."""
 
+import asyncio
 import os
 import tempfile
-from unittest.mock import Mock, patch
+import wave
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from google.genai import errors, types
 
 from src.app.models.document_edit import DocumentType
+from src.app.schemas.document_edit import DocumentEditRequest
 from src.app.models.text2speech import SpeechPitch, SpeechSpeed, VoiceName
+from src.app.schemas.text2speech import SpeakerConfig
 from src.app.services.document_edit_service import DocumentEditService
+from src.app.services.gemini_service import GeminiService
 from src.app.services.text2image_service import ImageGenerationError, Text2ImageService
 from src.app.services.text2speech_service import Text2SpeechService
-from src.app.services.text2video_service import Text2VideoService, VideoGenerationError
+from src.app.services.text2video_service import (
+    Text2VideoService,
+    VideoGenerationError,
+    VideoGenerationTimeoutError,
+)
+
+
+class TestGeminiService:
+    """Test GeminiService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create GeminiService instance."""
+        return GeminiService()
+
+    @pytest.mark.unit
+    async def test_generate_content_cached(self, service: GeminiService):
+        """Test identical requests are served from the response cache."""
+        mock_response = Mock()
+        mock_response.candidates = [Mock()]
+
+        with patch.object(service, "client") as mock_client:
+            mock_client.aio.models.generate_content = AsyncMock(
+                return_value=mock_response
+            )
+
+            first = await service.generate_content("Hello", model="test-model")
+            second = await service.generate_content("Hello", model="test-model")
+            await service.generate_content("Goodbye", model="test-model")
+
+            assert first is second is mock_response
+            assert mock_client.aio.models.generate_content.await_count == 2
+
+    @pytest.mark.unit
+    async def test_generate_content_does_not_cache_audio(self, service: GeminiService):
+        """Test that audio responses are not kept in the response cache."""
+        mock_response = Mock()
+        mock_response.candidates = [Mock()]
+
+        with patch.object(service, "client") as mock_client:
+            mock_client.aio.models.generate_content = AsyncMock(
+                return_value=mock_response
+            )
+
+            for _ in range(2):
+                await service.generate_content(
+                    "Hello", model="test-model", response_modalities=["AUDIO"]
+                )
+
+            assert mock_client.aio.models.generate_content.await_count == 2
+            assert len(service._response_cache) == 0
+
+    @pytest.mark.unit
+    async def test_generate_content_retries_rate_limit(self, service: GeminiService):
+        """Test that 429 responses are retried before succeeding."""
+        mock_response = Mock()
+        mock_response.candidates = [Mock()]
+        rate_limited = errors.APIError(429, {"error": {"message": "quota"}})
+
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            mock_client.aio.models.generate_content = AsyncMock(
+                side_effect=[rate_limited, mock_response]
+            )
+
+            result = await service.generate_content("Retry me", model="test-model")
+
+            assert result is mock_response
+            assert mock_client.aio.models.generate_content.await_count == 2
+
+    @pytest.mark.unit
+    async def test_generate_content_stream_retries_rate_limit(
+        self, service: GeminiService
+    ):
+        """Test that a stream failing before its first chunk is retried."""
+        rate_limited = errors.APIError(429, {"error": {"message": "quota"}})
+
+        async def failing_stream():
+            raise rate_limited
+            yield  # pragma: no cover
+
+        async def stream():
+            yield "first"
+            yield "second"
+
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("asyncio.sleep", new=AsyncMock()),
+        ):
+            mock_client.aio.models.generate_content_stream = AsyncMock(
+                side_effect=[failing_stream(), stream()]
+            )
+
+            chunks = [
+                chunk
+                async for chunk in service.generate_content_stream(
+                    "Retry me", model="test-model"
+                )
+            ]
+
+            assert chunks == ["first", "second"]
+            assert mock_client.aio.models.generate_content_stream.await_count == 2
+
+    @pytest.mark.unit
+    async def test_get_content_batch(self, service: GeminiService):
+        """Test batch results are returned in prompt order once the job is done."""
+        first, second = Mock(), Mock()
+        running = Mock(state=types.JobState.JOB_STATE_RUNNING)
+        done = Mock(state=types.JobState.JOB_STATE_SUCCEEDED)
+        done.dest.inlined_responses = [
+            Mock(metadata={"index": "1"}, error=None, response=second),
+            Mock(metadata={"index": "0"}, error=None, response=first),
+        ]
+
+        with patch.object(service, "client") as mock_client:
+            mock_client.aio.batches.get = AsyncMock(side_effect=[running, done])
+
+            assert await service.get_content_batch("batches/job") == (
+                types.JobState.JOB_STATE_RUNNING,
+                None,
+            )
+            assert await service.get_content_batch("batches/job") == (
+                types.JobState.JOB_STATE_SUCCEEDED,
+                [first, second],
+            )
 
 
 class TestDocumentEditService:
@@ -95,6 +227,53 @@ class TestDocumentEditService:
 
             assert "Document editing failed" in str(exc_info.value)
 
+    @pytest.mark.unit
+    async def test_submit_edit_batch_reports_job_state(
+        self, service: DocumentEditService
+    ):
+        """Test that a submitted batch reports the state the API returned."""
+        with patch.object(
+            service.gemini_service,
+            "submit_content_batch",
+            AsyncMock(return_value=("batches/job-1", types.JobState.JOB_STATE_QUEUED)),
+        ):
+            result = await service.submit_edit_batch(
+                [DocumentEditRequest(content="Text", instructions="Fix grammar")]
+            )
+
+        assert result == ("job-1", "JOB_STATE_QUEUED")
+
+    @pytest.mark.unit
+    async def test_edit_document_uses_shared_cache(self, service: DocumentEditService):
+        """Test that edits cached in Redis skip the Gemini call."""
+        mock_redis = Mock()
+        mock_redis.get = AsyncMock(side_effect=[None, "Edited document content"])
+        mock_redis.set = AsyncMock()
+        mock_part = Mock(text="Edited document content")
+        mock_candidate = Mock()
+        mock_candidate.content.parts = [mock_part]
+        mock_response = Mock(candidates=[mock_candidate])
+
+        with (
+            patch(
+                "src.app.services.document_edit_service.get_redis",
+                return_value=mock_redis,
+            ),
+            patch.object(service, "gemini_service") as mock_gemini,
+        ):
+            mock_gemini.generate_content = AsyncMock(return_value=mock_response)
+
+            for _ in range(2):
+                result = await service.edit_document(
+                    content="Original content", instructions="Edit this"
+                )
+                assert result == "Edited document content"
+
+            mock_gemini.generate_content.assert_awaited_once()
+            key = mock_redis.set.await_args.args[0]
+            assert key.startswith("docedit:")
+            assert mock_redis.get.await_args.args[0] == key
+
 
 class TestText2SpeechService:
     """Test Text2SpeechService."""
@@ -116,6 +295,26 @@ class TestText2SpeechService:
 
         assert config.voice_config.prebuilt_voice_config.voice_name == "Kore"
 
+    @pytest.mark.unit
+    def test_speech_configs_are_reused(self, service: Text2SpeechService):
+        """Test that identical voice settings reuse the same config object."""
+        first = service._create_speech_config(
+            VoiceName.KORE, SpeechSpeed.NORMAL, SpeechPitch.NORMAL
+        )
+        second = service._create_speech_config(
+            VoiceName.KORE, SpeechSpeed.NORMAL, SpeechPitch.NORMAL
+        )
+        assert first is second
+
+        speakers = [
+            SpeakerConfig(speaker="Joe", voice_name=VoiceName.KORE),
+            SpeakerConfig(speaker="Jane", voice_name=VoiceName.ALG),
+        ]
+        multi = service._create_multi_speaker_config(speakers)
+        assert multi is service._create_multi_speaker_config(list(speakers))
+        speaker_configs = multi.multi_speaker_voice_config.speaker_voice_configs
+        assert [c.speaker for c in speaker_configs] == ["Joe", "Jane"]
+
     @pytest.mark.unit
     def test_format_multi_speaker_text(self, service: Text2SpeechService):
         """Test multi-speaker text formatting."""
@@ -155,6 +354,68 @@ class TestText2SpeechService:
             assert result == mock_audio_data
             mock_gemini.generate_content.assert_called_once()
 
+    @pytest.mark.unit
+    async def test_generate_speech_batch(self, service: Text2SpeechService):
+        """Test batched speech generation preserves input order."""
+        with patch.object(
+            service,
+            "generate_speech",
+            new=AsyncMock(side_effect=lambda text, **_: text.encode()),
+        ) as mock_generate:
+            result = await service.generate_speech_batch(["one", "two", "three"])
+
+            assert result == [b"one", b"two", b"three"]
+            assert mock_generate.call_count == 3
+
+    @pytest.mark.unit
+    async def test_generate_speech_batch_api(
+        self, service: Text2SpeechService, mock_audio_data: bytes
+    ):
+        """Test batched speech generation through the Gemini Batch API."""
+        mock_response = Mock()
+        mock_part = Mock()
+        mock_part.inline_data.data = mock_audio_data
+        mock_response.candidates = [Mock()]
+        mock_response.candidates[0].content.parts = [mock_part]
+
+        with patch.object(service, "gemini_service") as mock_gemini:
+            mock_gemini.generate_content_batch = AsyncMock(
+                return_value=[mock_response, mock_response]
+            )
+
+            result = await service.generate_speech_batch(
+                ["one", "two"], use_batch_api=True
+            )
+
+            assert result == [mock_audio_data, mock_audio_data]
+            mock_gemini.generate_content_batch.assert_awaited_once()
+            mock_gemini.generate_content.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_stream_speech(self, service: Text2SpeechService):
+        """Test streamed speech starts with a WAV header and yields chunks."""
+
+        def audio_chunk(data: bytes) -> Mock:
+            chunk = Mock()
+            chunk.candidates = [Mock()]
+            chunk.candidates[0].content.parts = [Mock()]
+            chunk.candidates[0].content.parts[0].inline_data.data = data
+            return chunk
+
+        async def fake_stream(**_):
+            yield audio_chunk(b"\x01\x02")
+            yield audio_chunk(b"\x03\x04")
+
+        with patch.object(service, "gemini_service") as mock_gemini:
+            mock_gemini.generate_content_stream = fake_stream
+
+            chunks = [chunk async for chunk in service.stream_speech("Hello")]
+
+            assert len(chunks) == 2
+            assert chunks[0][:4] == b"RIFF" and chunks[0][8:12] == b"WAVE"
+            assert chunks[0].endswith(b"\x01\x02")
+            assert chunks[1] == b"\x03\x04"
+
     @pytest.mark.unit
     async def test_generate_speech_no_response(self, service: Text2SpeechService):
         """Test speech generation with no response."""
@@ -184,6 +445,67 @@ class TestText2SpeechService:
             if os.path.exists(file_path):
                 os.unlink(file_path)
 
+    @pytest.mark.unit
+    async def test_save_audio_file_is_valid_wav(
+        self, service: Text2SpeechService, mock_audio_data: bytes
+    ):
+        """Test the saved file is a readable WAV with the requested format."""
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+            file_path = tmp_file.name
+
+        try:
+            await service.save_audio_file(
+                mock_audio_data, file_path, channels=1, rate=24000, sample_width=2
+            )
+
+            with wave.open(file_path, "rb") as wf:
+                assert wf.getnchannels() == 1
+                assert wf.getframerate() == 24000
+                assert wf.getsampwidth() == 2
+                assert wf.readframes(wf.getnframes()) == mock_audio_data
+        finally:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
+    @pytest.mark.unit
+    async def test_save_speech_stream(self, service: Text2SpeechService, tmp_path):
+        """Test streamed speech is written as a WAV file with final sizes."""
+        chunks = [b"\x01\x00" * 100, b"\x02\x00" * 50]
+
+        async def fake_stream(**_):
+            for data in chunks:
+                part = Mock()
+                part.inline_data.data = data
+                candidate = Mock()
+                candidate.content.parts = [part]
+                yield Mock(candidates=[candidate])
+
+        file_path = str(tmp_path / "speech.wav")
+        with patch.object(service, "gemini_service") as mock_gemini:
+            mock_gemini.generate_content_stream = fake_stream
+
+            data_size = await service.save_speech_stream(file_path, "Hello")
+
+        assert data_size == 300
+        with wave.open(file_path, "rb") as wf:
+            assert wf.getnframes() == 150
+            assert wf.readframes(wf.getnframes()) == b"".join(chunks)
+
+    @pytest.mark.unit
+    async def test_speech_cache(self, service: Text2SpeechService, tmp_path):
+        """Test generated speech is reused while its file still exists."""
+        service.output_dir = str(tmp_path)
+        key = service.speech_cache_key("Hello", voice_name=VoiceName.KORE)
+
+        assert key == service.speech_cache_key("Hello", speed=SpeechSpeed.FAST)
+        assert key != service.speech_cache_key("Hello", voice_name=VoiceName.ALG)
+
+        await service.cache_speech(key, "abc", 4800)
+        assert await service.get_cached_speech(key) is None
+
+        (tmp_path / "abc.wav").write_bytes(b"")
+        assert await service.get_cached_speech(key) == ("abc", 4800)
+
     @pytest.mark.unit
     async def test_save_audio_file_error(self, service: Text2SpeechService):
         """Test audio file saving with error."""
@@ -258,6 +580,65 @@ class TestText2ImageService:
 
             assert "An unexpected error occurred" in str(exc_info.value)
 
+    @pytest.mark.unit
+    async def test_generate_images_splits_requests(
+        self, service: Text2ImageService, mock_image_data: bytes
+    ):
+        """Test that large requests are split and a failed part is tolerated."""
+
+        def response(count: int) -> Mock:
+            generated = Mock()
+            generated.image.image_bytes = mock_image_data
+            return Mock(generated_images=[generated] * count)
+
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("src.app.services.text2image_service.Image.open"),
+        ):
+            mock_client.aio.models.generate_images = AsyncMock(
+                side_effect=[response(4), Exception("API error"), response(1)]
+            )
+
+            result = await service.generate_images("Test prompt", 9)
+
+            counts = [
+                call.kwargs["config"].number_of_images
+                for call in mock_client.aio.models.generate_images.await_args_list
+            ]
+            assert counts == [4, 4, 1]
+            assert len(result) == 5
+
+    @pytest.mark.unit
+    async def test_generate_images_limits_concurrency(
+        self, service: Text2ImageService, mock_image_data: bytes
+    ):
+        """Test that image requests run at most GEMINI_MAX_CONCURRENCY at a time."""
+        service._semaphore = asyncio.Semaphore(2)
+        in_flight = 0
+        peak = 0
+
+        async def generate_images(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            generated = Mock()
+            generated.image.image_bytes = mock_image_data
+            count = kwargs["config"].number_of_images
+            return Mock(generated_images=[generated] * count)
+
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("src.app.services.text2image_service.Image.open"),
+        ):
+            mock_client.aio.models.generate_images = generate_images
+
+            result = await service.generate_images("Test prompt", 16)
+
+        assert len(result) == 16
+        assert peak == 2
+
 
 class TestText2VideoService:
     """Test Text2VideoService."""
@@ -310,6 +691,64 @@ class TestText2VideoService:
             assert result.endswith(".mp4")
             mock_file.write.assert_called_once_with(mock_video_data)
 
+    @pytest.mark.unit
+    async def test_generate_video_removes_partial_file(
+        self, service: Text2VideoService, tmp_path
+    ):
+        """Test that a failed save leaves no temporary file behind."""
+        service.output_dir = str(tmp_path)
+
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("aiohttp.ClientSession") as mock_session,
+            patch(
+                "src.app.services.text2video_service.os.replace",
+                side_effect=OSError("disk full"),
+            ),
+        ):
+            operation = Mock(done=True)
+            operation.response.generated_videos = [Mock()]
+            operation.response.generated_videos[0].video.uri = "http://example.com/v"
+            mock_client.aio.models.generate_videos = AsyncMock(return_value=operation)
+
+            mock_resp = Mock(read=AsyncMock(return_value=b"fake video data"))
+            session = mock_session.return_value.__aenter__.return_value
+            session.get = MagicMock()
+            session.get.return_value.__aenter__.return_value = mock_resp
+
+            with pytest.raises(Exception, match="disk full"):
+                await service.generate_video("Test prompt", "16:9", "allow_adult")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.unit
+    async def test_generate_video_cache_hit(self, service: Text2VideoService, tmp_path):
+        """Test that a previously generated video is served without the API."""
+        service.output_dir = str(tmp_path)
+        cached_name = service._cache_filename("Test prompt", "16:9", "allow_adult")
+        (tmp_path / cached_name).write_bytes(b"cached video")
+
+        with patch.object(service, "client") as mock_client:
+            result = await service.generate_video("Test prompt", "16:9", "allow_adult")
+
+            assert result == cached_name
+            mock_client.aio.models.generate_videos.assert_not_called()
+
+    @pytest.mark.unit
+    def test_evict_cache(self, service: Text2VideoService, tmp_path):
+        """Test that least recently used videos are evicted over the size cap."""
+        service.output_dir = str(tmp_path)
+        for index, name in enumerate(["old.mp4", "recent.mp4", "new.mp4"]):
+            path = tmp_path / name
+            path.write_bytes(b"x" * 10)
+            os.utime(path, (index, index))
+
+        with patch("src.app.services.text2video_service.settings") as mock_settings:
+            mock_settings.VIDEO_CACHE_MAX_BYTES = 20
+            service._evict_cache(keep="new.mp4")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["new.mp4", "recent.mp4"]
+
     @pytest.mark.unit
     async def test_generate_video_no_response(self, service: Text2VideoService):
         """Test video generation with no response."""
@@ -352,3 +791,22 @@ class TestText2VideoService:
                 await service.generate_video("Test prompt", "16:9", "allow_adult")
 
             assert "An unexpected error occurred" in str(exc_info.value)
+
+    @pytest.mark.unit
+    async def test_generate_video_poll_timeout(self, service: Text2VideoService):
+        """Test video generation gives up once the polling deadline passes."""
+        with (
+            patch.object(service, "client") as mock_client,
+            patch("asyncio.sleep"),
+            patch("src.app.services.text2video_service.settings.VIDEO_POLL_TIMEOUT", 0),
+        ):
+            mock_operation = Mock()
+            mock_operation.done = False
+            mock_client.aio.models.generate_videos = AsyncMock(
+                return_value=mock_operation
+            )
+
+            with pytest.raises(VideoGenerationTimeoutError) as exc_info:
+                await service.generate_video("Test prompt", "16:9", "allow_adult")
+
+            assert "did not complete in time" in str(exc_info.value)
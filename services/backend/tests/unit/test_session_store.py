@@ -0,0 +1,71 @@
+"""Tests for the login session store."""
+
+import pytest
+
+from src.app.core.config import settings
+from src.app.core.session_store import MemorySessionStore, SessionStore
+
+
+@pytest.mark.unit
+async def test_memory_store_round_trip():
+    """Test that a stored session can be read back and deleted."""
+    store = MemorySessionStore(ttl=60, maxsize=10)
+
+    await store.set("abc", {"gemini_api_key": "key"})
+    assert await store.get("abc") == {"gemini_api_key": "key"}
+
+    await store.delete("abc")
+    assert await store.get("abc") is None
+
+
+@pytest.mark.unit
+async def test_memory_store_expires_sessions():
+    """Test that sessions disappear once their TTL has passed."""
+    now = [0.0]
+    store = MemorySessionStore(ttl=60, maxsize=10, timer=lambda: now[0])
+
+    await store.set("abc", {"gemini_api_key": "key"})
+    now[0] = 61.0
+
+    assert await store.get("abc") is None
+
+
+@pytest.mark.unit
+async def test_memory_store_is_bounded():
+    """Test that the oldest sessions are evicted beyond maxsize."""
+    store = MemorySessionStore(ttl=60, maxsize=2)
+
+    for session_id in ("a", "b", "c"):
+        await store.set(session_id, {"gemini_api_key": session_id})
+
+    assert await store.get("a") is None
+    assert await store.get("c") == {"gemini_api_key": "c"}
+
+
+@pytest.mark.unit
+async def test_memory_store_key_checks_expire_separately():
+    """Test that rejected keys are forgotten sooner than accepted ones."""
+    now = [0.0]
+    store = MemorySessionStore(ttl=60, maxsize=10, timer=lambda: now[0])
+
+    assert await store.get_key_check("good") is None
+    await store.set_key_check("good", True)
+    await store.set_key_check("bad", False)
+    assert await store.get_key_check("good") is True
+    assert await store.get_key_check("bad") is False
+
+    now[0] = settings.KEY_CHECK_NEGATIVE_TTL_SECONDS + 1
+    assert await store.get_key_check("good") is True
+    assert await store.get_key_check("bad") is None
+
+
+@pytest.mark.unit
+def test_incomplete_store_cannot_be_created():
+    """Test that a store missing interface methods fails at construction."""
+
+    class PartialStore(SessionStore):
+        async def get(self, session_id):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialStore()
@@ -0,0 +1,50 @@
+"""Tests for constant JSON responses."""
+
+import orjson
+import pytest
+from starlette.requests import Request
+
+from src.app.utils.static_json import StaticJSON
+
+
+def _request(headers=None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+@pytest.mark.unit
+def test_static_json_serves_payload_with_etag():
+    """Test that the payload is served with caching headers."""
+    payload = StaticJSON({"items": [1, 2]})
+
+    response = payload.response(_request())
+
+    assert response.status_code == 200
+    assert orjson.loads(response.body) == {"items": [1, 2]}
+    assert response.headers["etag"] == payload.etag
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("template", ["{}", "W/{}", '"other", {}', "*"])
+def test_static_json_not_modified(template):
+    """Test that a matching If-None-Match yields an empty 304."""
+    payload = StaticJSON({"items": [1, 2]})
+
+    response = payload.response(
+        _request({"If-None-Match": template.format(payload.etag)})
+    )
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == payload.etag
+
+
+@pytest.mark.unit
+def test_static_json_stale_etag():
+    """Test that a stale ETag gets the full payload."""
+    payload = StaticJSON({"items": [1, 2]})
+
+    response = payload.response(_request({"If-None-Match": '"stale"'}))
+
+    assert response.status_code == 200
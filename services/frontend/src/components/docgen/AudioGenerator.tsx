@@ -60,7 +60,7 @@ export default function AudioGenerator({
         });
 
         setAudioResponse(response);
-        setAudioUrl(getAudioUrl(response.audio_file_id));
+        setAudioUrl(getAudioUrl(response.download_url));
         setDuration(response.duration_seconds);
         setStatus("loading");
         setIsLoading(false);
@@ -128,7 +128,7 @@ export default function AudioGenerator({
   const handleDownload = () => {
     if (audioResponse) {
       const link = document.createElement("a");
-      link.href = getAudioUrl(audioResponse.audio_file_id);
+      link.href = getAudioUrl(audioResponse.download_url);
       link.download = audioResponse.filename;
       document.body.appendChild(link);
       link.click();
@@ -67,7 +67,7 @@ export interface TextToSpeechRequest {
 interface TextToSpeechResponse {
   audio_file_id: string;
   filename: string;
-  file_path: string;
+  download_url: string;
   duration_seconds: number;
   file_size_bytes: number;
   status: string;
@@ -181,8 +181,9 @@ export async function generateImages(request: TextToImageRequest): Promise<TextT
   return successData;
 }
 
-export function getAudioUrl(fileId: string): string {
-  return `${API_BASE_URL}${TEXT_TO_SPEECH_ENDPOINT}download/${fileId}`;
+export function getAudioUrl(downloadUrl: string): string {
+  // The backend hands out signed, expiring download paths
+  return `${API_BASE_URL}${downloadUrl}`;
 }
 
 export function getVideoUrl(filePath: string | undefined): string {
@@ -400,10 +401,13 @@ export const login = async (secret: string, name: string, geminiApiKey: string)
 };
 
 export const logout = async () => {
+  // Send the session ID so the backend can drop the stored session
+  const sessionId = sessionStorage.getItem('genassist_session_id');
   const response = await fetch(`${API_BASE_URL}${AUTH_ENDPOINT}logout`, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
+      ...(sessionId ? { 'X-Session-ID': sessionId } : {}),
     },
   });
 